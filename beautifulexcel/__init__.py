@@ -1,2 +1,27 @@
 # -*- coding: utf-8 -*-
-from beautifulexcel.writer import ExcelWriter
+import importlib
+
+# public names and the modules they are defined in - the modules (and pandas, numpy, openpyxl, and yaml with them) are
+# only imported once a name is used, so that e.g. beautifulexcel.utils can be used without these dependencies
+_LAZY_ATTRS = {
+    "ExcelWriter": "beautifulexcel.writer",
+    "AsyncExcelWriter": "beautifulexcel.async_writer",
+    "ExcelTemplate": "beautifulexcel.template",
+    "batch_export": "beautifulexcel.batch",
+    "read_excel": "beautifulexcel.reader",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, NoReturn, Optional
+
+from beautifulexcel.writer import DataframeSheet, ExcelWriter
+
+
+class AsyncExcelWriter:
+    """
+    Asyncio wrapper of ExcelWriter for web services - the workbook is built and saved in an executor so that the event
+    loop is not blocked while the sheets are styled and the file is written
+
+    Example:
+        ```python
+        from beautifulexcel import AsyncExcelWriter
+
+        async def report(df):
+            async with AsyncExcelWriter('workbook.xlsx', theme='elegant_blue') as writer:
+                ws = await writer.to_excel(df, sheet_name='My Sheet')
+                await writer.run(ws.merge_cells, 'B8:C9')
+        ```
+    """
+
+    def __init__(
+        self, file: Any, executor: Optional[Executor] = None, semaphore: Optional[asyncio.Semaphore] = None, **kwargs
+    ):
+        """
+        Args:
+            file (str): Path to xlsx file (all further ExcelWriter() arguments are passed through as kwargs)
+            executor (concurrent.futures.Executor): Thread pool that builds the workbook (default: the default executor of the event loop) - the workbook lives in this process so process pools are not possible
+            semaphore (asyncio.Semaphore): Semaphore shared by several writers to limit how many workbook operations run at the same time e.g. asyncio.Semaphore(2) for all requests of a web service
+            kwargs (dict): Further ExcelWriter() arguments e.g. theme='elegant_blue', engine='xml'
+        """
+        self.file = file
+        self.executor = executor
+        self.semaphore = semaphore
+        self.kwargs = kwargs
+        self.writer: Optional[ExcelWriter] = None
+        self.cancelled = False
+        self._lock: Optional[asyncio.Lock] = None
+        self._stats = None
+
+    async def __aenter__(self):
+        self._lock = asyncio.Lock()
+        self.writer = await self.run(ExcelWriter, self.file, **self.kwargs)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # the workbook is only saved if it was completely built - e.g. not if the request was cancelled
+        try:
+            if self.writer is not None:
+                if exc_type is None and not self.cancelled:
+                    await self.save()
+                else:
+                    self.writer._discard()
+        finally:
+            self._stats = None if self.writer is None else self.writer.stats
+            self.writer = None
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a (blocking) function in the executor - the operations of a writer run one after the other and at most as
+        many operations as the semaphore allows run at the same time
+
+        Example:
+            ```python
+            ws = await writer.to_excel(df, sheet_name='My Sheet')
+            await writer.run(ws.group_columns, 'B:C')
+            ```
+        """
+        if self._lock is None:
+            self._raise_usage_error()
+        if self.cancelled:
+            raise Exception(
+                "The AsyncExcelWriter was cancelled during a previous operation and the workbook may be incomplete. Please create a new AsyncExcelWriter."
+            )
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            if self.semaphore is not None:
+                await self.semaphore.acquire()
+            try:
+                future = loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # a running thread cannot be interrupted - the writer (and the semaphore) are only released once the
+                    # operation has finished so that the workbook is never used by two threads at the same time
+                    self.cancelled = True
+                    await asyncio.wait([future])
+                    raise
+            finally:
+                if self.semaphore is not None:
+                    self.semaphore.release()
+
+    def _raise_usage_error(self) -> NoReturn:
+        """Raise an error if the writer is used outside of its async with-block"""
+        raise Exception(
+            "Wrong usage! Please run it this way:\n>>> from beautifulexcel import AsyncExcelWriter\n>>> async with AsyncExcelWriter('workbook.xlsx', theme='elegant_blue') as writer:\n>>>     ws1 = await writer.to_excel(df1, sheet_name='My Sheet')"
+        )
+
+    def _get_writer(self) -> ExcelWriter:
+        """The ExcelWriter of the async with-block"""
+        if self.writer is None:
+            self._raise_usage_error()
+        return self.writer
+
+    async def to_excel(self, df, sheet_name: str, **kwargs) -> DataframeSheet:
+        """
+        Export pandas Datafame to excel without blocking the event loop - all ExcelWriter.to_excel() arguments are
+        supported
+
+        Returns:
+            beautifulexcel.DataframeSheet
+        """
+        return await self.run(self._get_writer().to_excel, df, sheet_name, **kwargs)
+
+    async def to_excel_many(self, dfs: dict, workers: Optional[int] = None, **kwargs):
+        """Export multiple pandas Dataframes to excel sheets in parallel processes without blocking the event loop - see ExcelWriter.to_excel_many()"""
+        return await self.run(self._get_writer().to_excel_many, dfs, workers=workers, **kwargs)
+
+    async def save(self):
+        """Write the workbook to the file without blocking the event loop"""
+        await self.run(self._get_writer().save)
+
+    @property
+    def stats(self):
+        """Profiling stats of ExcelWriter(profile=True)"""
+        return self._stats if self.writer is None else self.writer.stats
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Union
+
+import pandas as pd
+
+from beautifulexcel.template import ExcelTemplate
+from beautifulexcel.theme import _theme_cache, load_theme
+from beautifulexcel.utils import sample_positions
+from beautifulexcel.writer import ExcelWriter
+
+# template of the batch in the worker processes - sent once per process by the pool initializer
+_worker_template = None
+
+
+def batch_export(
+    df: pd.DataFrame,
+    by: Union[str, List[str]],
+    path_template: str,
+    sheet_name: str = "Sheet1",
+    workers: int = None,
+    template: bool = True,
+    template_sample: int = 1_000,
+    writer_kwargs: dict = {},
+    **to_excel_kwargs,
+) -> pd.DataFrame:
+    """
+    Export every group of a dataframe into its own workbook in parallel processes e.g. one report per client - a failed
+    file does not abort the batch but is reported with its error. Rows with missing group keys (NaN/None) are not
+    written but reported as a failed group without path.
+
+    Args:
+        df (pd.DataFrame): Dataframe to split into groups
+        by (str or list): Column name(s) to group by (like df.groupby(by))
+        path_template (str): Path of the workbook of a group with the group keys as placeholders e.g. 'reports/{client}.xlsx' or 'reports/{0}_{1}.xlsx' - missing directories are created
+        sheet_name (str): Sheet name of the table in all workbooks
+        workers (int): Number of processes (default: number of CPU cores) - 1 writes the files in this process
+        template (bool): Build one ExcelTemplate from the whole dataframe and only render the rows of the groups into it - all files get the same number formats and column widths (decided on template_sample rows). False writes every file with its own ExcelWriter (needed e.g. for row styles or default_styles=True)
+        template_sample (int): Number of evenly spaced rows of df the template is built from (None uses all rows)
+        writer_kwargs (dict): ExcelWriter() arguments for all files e.g. {'theme': 'elegant_blue', 'engine': 'xml'}
+        to_excel_kwargs (dict): Further .to_excel() arguments for all files e.g. index=True, style={'RoE': 'bg_light_blue'}
+
+    Returns:
+        pd.DataFrame: One row per file indexed by the group keys with the columns "path", "rows", "seconds" (time to write the file), and "error" (None if the file was written)
+
+    Example:
+        ```python
+        from beautifulexcel import batch_export
+
+        report = batch_export(df, by='client', path_template='reports/{client}.xlsx', workers=4, writer_kwargs={'theme': 'elegant_blue'})
+        failed = report[report['error'].notna()]
+        ```
+    """
+    by_list = [by] if isinstance(by, str) else list(by)
+    groups = []
+    for key, group_df in df.groupby(by_list, sort=False, dropna=False):
+        keys = key if isinstance(key, tuple) else (key,)
+        # e.g. 'reports/nan.xlsx' is no meaningful path for rows without a client
+        path = None
+        if not any(pd.isna(value) for value in keys):
+            path = path_template.format(*keys, **dict(zip(by_list, keys)))
+        groups.append((keys, path, group_df))
+    paths = [path for _, path, _ in groups if path is not None]
+    if len(set(paths)) < len(paths):
+        raise Exception(
+            f'The path_template "{path_template}" gives the same path for several groups. Please use all group columns {by_list} in the path_template.'
+        )
+
+    # the theme (and if template=True the styling of the table) is compiled once and shared with the workers
+    batch_template, theme = None, None
+    if template:
+        positions = sample_positions(len(df), template_sample)
+        sample_df = df if positions is None else df.iloc[positions]
+        batch_template = ExcelTemplate(
+            lambda writer: writer.to_excel(sample_df, sheet_name, **to_excel_kwargs), **writer_kwargs
+        )
+    elif writer_kwargs.get("theme", "elegant_blue"):
+        theme = load_theme(writer_kwargs.get("theme", "elegant_blue"))
+
+    # results by group position as NaN group keys are no reliable dict keys
+    results = {
+        i: (None, f"The group keys {dict(zip(by_list, keys))} contain missing values - the rows were not written.")
+        for i, (keys, path, _) in enumerate(groups)
+        if path is None
+    }
+    if workers == 1:
+        for i, (keys, path, group_df) in enumerate(groups):
+            if path is not None:
+                results[i] = _export_group(batch_template, path, group_df, sheet_name, writer_kwargs, to_excel_kwargs)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(batch_template, theme)
+        ) as executor:
+            futures = {
+                i: executor.submit(_export_group, None, path, group_df, sheet_name, writer_kwargs, to_excel_kwargs)
+                for i, (keys, path, group_df) in enumerate(groups)
+                if path is not None
+            }
+            for i, future in futures.items():
+                try:
+                    results[i] = future.result()
+                except Exception as exc:
+                    # e.g. a crashed worker process
+                    results[i] = (None, f"{type(exc).__name__}: {exc}")
+
+    report = pd.DataFrame(
+        [(path, len(group_df), *results[i]) for i, (keys, path, group_df) in enumerate(groups)],
+        columns=["path", "rows", "seconds", "error"],
+        index=pd.MultiIndex.from_tuples([keys for keys, _, _ in groups], names=by_list)
+        if len(by_list) > 1
+        else pd.Index([keys[0] for keys, _, _ in groups], name=by_list[0]),
+    )
+    n_failed = int(report["error"].notna().sum())
+    if n_failed > 0:
+        warnings.warn(
+            f'{n_failed} of {len(report)} workbooks could not be written - see the "error" column of the batch_export() result.'
+        )
+    return report
+
+
+def _init_worker(template, theme):
+    """Set the shared template and seed the theme cache of a worker process"""
+    global _worker_template
+    _worker_template = template
+    if theme is not None:
+        _theme_cache[theme.path] = theme
+
+
+def _export_group(template, path, df, sheet_name, writer_kwargs, to_excel_kwargs):
+    """Write the workbook of a group - returns (seconds, error) with error None if the file was written"""
+    template = _worker_template if template is None else template
+    time_start = time.perf_counter()
+    file_existed = os.path.isfile(path)
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if template is not None:
+            template.render(path, {sheet_name: df})
+        else:
+            excelwriter = ExcelWriter(path, **writer_kwargs)
+            try:
+                excelwriter.to_excel(df, sheet_name, **to_excel_kwargs)
+            except Exception:
+                excelwriter._discard()
+                raise
+            excelwriter.save()
+    except Exception as exc:
+        # no incomplete workbooks are left behind
+        if not file_existed and os.path.isfile(path):
+            os.remove(path)
+        return time.perf_counter() - time_start, f"{type(exc).__name__}: {exc}"
+    return time.perf_counter() - time_start, None
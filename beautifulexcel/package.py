@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+from xml.etree import ElementTree
+from xml.sax.saxutils import quoteattr
+
+
+# style id attributes in the worksheet xml: <c s="1">, <row s="1">, and <col style="1">
+_STYLE_ID_ATTR = re.compile(rb'(<(?:c|row|col)\s[^>]*?\b(?:s|style)=")(\d+)(")')
+
+_SHEET_DATA_END = re.compile(rb"<sheetData\s*/>|</sheetData>")
+_DIMENSION = re.compile(rb'<dimension ref="[^"]*"')
+
+
+def remap_style_ids(xml: bytes, style_ids: dict) -> bytes:
+    """Replace the cell style ids in a worksheet xml e.g. with the {old id: new id} result of styles.merge_style_tables()"""
+    if all(old_id == new_id for old_id, new_id in style_ids.items()):
+        return xml
+    return _STYLE_ID_ATTR.sub(lambda match: match[1] + str(style_ids[int(match[2])]).encode() + match[3], xml)
+
+
+def insert_sheet_data(xml: bytes, dst, sheet_data, dimension: str):
+    """
+    Write a worksheet xml into dst with the rows of the file object sheet_data appended to its <sheetData> element -
+    the inserted rows have to follow the rows that are already in the xml
+    """
+    match = _SHEET_DATA_END.search(xml)
+    if match is None:
+        raise Exception("The worksheet xml has no <sheetData> element to insert the rows into.")
+    head = _DIMENSION.sub(b'<dimension ref="' + dimension.encode() + b'"', xml[: match.start()], count=1)
+    dst.write(head if match[0] == b"</sheetData>" else head + b"<sheetData>")
+    sheet_data.seek(0)
+    shutil.copyfileobj(sheet_data, dst, 1024 * 1024)
+    dst.write(b"</sheetData>" + xml[match.end() :])
+
+
+def replace_package_parts(file: str, parts: dict, remove_parts: set = ()):
+    """
+    Rewrite the xlsx (zip) package with some of its parts replaced e.g. {'xl/worksheets/sheet1.xml': b'<worksheet ...'}
+
+    Instead of the new content a part can also be a function part(old_content, dst) that writes the new content into
+    the file object dst (old_content is None for new parts). Parts that do not exist yet are added at the end, the
+    parts in remove_parts are left out, and all other parts are copied over unchanged
+    """
+    file_dir = os.path.dirname(os.path.abspath(file))
+    with tempfile.NamedTemporaryFile(dir=file_dir, suffix=".xlsx", delete=False) as tmp_file:
+        tmp_path = tmp_file.name
+    try:
+        with (
+            zipfile.ZipFile(file, "r") as zin,
+            zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zout,
+        ):
+            for info in zin.infolist():
+                part = parts.get(info.filename)
+                if info.filename in remove_parts:
+                    continue
+                elif callable(part):
+                    _write_part(
+                        zout,
+                        zipfile.ZipInfo(info.filename, date_time=info.date_time),
+                        part,
+                        zin.read(info),
+                        info.compress_type,
+                    )
+                elif part is not None:
+                    zout.writestr(info, part)
+                else:
+                    with zin.open(info) as src, zout.open(info, "w") as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+            for name in parts.keys() - set(zin.namelist()):
+                if callable(parts[name]):
+                    _write_part(
+                        zout,
+                        zipfile.ZipInfo(name, date_time=time.localtime()[:6]),
+                        parts[name],
+                        None,
+                        zipfile.ZIP_DEFLATED,
+                    )
+                else:
+                    zout.writestr(
+                        zipfile.ZipInfo(name, date_time=time.localtime()[:6]), parts[name], zipfile.ZIP_DEFLATED
+                    )
+        shutil.copymode(file, tmp_path)
+        os.replace(tmp_path, file)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _write_part(zout, part_info, part, old_content, compress_type):
+    """Write the content of a part function part(old_content, dst) into the zip file"""
+    with tempfile.TemporaryFile() as part_file:
+        part(old_content, part_file)
+        # the file size needs to be known upfront for large (zip64) parts
+        part_info.compress_type = compress_type
+        part_info.file_size = part_file.tell()
+        part_file.seek(0)
+        with zout.open(part_info, "w") as dst:
+            shutil.copyfileobj(part_file, dst, 1024 * 1024)
+
+
+RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIP_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+WORKSHEET_REL_TYPE = RELATIONSHIP_NS + "/worksheet"
+STYLES_REL_TYPE = RELATIONSHIP_NS + "/styles"
+CALC_CHAIN_REL_TYPE = RELATIONSHIP_NS + "/calcChain"
+SHARED_STRINGS_REL_TYPE = RELATIONSHIP_NS + "/sharedStrings"
+OFFICE_DOCUMENT_REL_TYPE = RELATIONSHIP_NS + "/officeDocument"
+WORKSHEET_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+SHARED_STRINGS_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"
+
+
+def _rels_path(part: str) -> str:
+    """Path of the relationships part of a package part e.g. xl/workbook.xml -> xl/_rels/workbook.xml.rels"""
+    part_dir, part_name = posixpath.split(part)
+    return posixpath.join(part_dir, "_rels", part_name + ".rels")
+
+
+def _read_rels(zin, part: str) -> dict:
+    """Relationships of a package part as {id: (type, absolute target part, target mode)}"""
+    rels_path = _rels_path(part)
+    if rels_path not in zin.NameToInfo:
+        return {}
+    rels = {}
+    for rel in ElementTree.fromstring(zin.read(rels_path)).iter(f"{{{PACKAGE_RELATIONSHIP_NS}}}Relationship"):
+        target = rel.get("Target")
+        if rel.get("TargetMode") != "External":
+            target = (
+                target[1:]
+                if target.startswith("/")
+                else posixpath.normpath(posixpath.join(posixpath.dirname(part), target))
+            )
+        rels[rel.get("Id")] = (rel.get("Type"), target, rel.get("TargetMode"))
+    return rels
+
+
+class Package:
+    """
+    Sheets and style part of an existing xlsx package read from its workbook part and relationships
+
+    Attributes:
+        workbook_part: e.g. 'xl/workbook.xml'
+        sheets: {sheet name: (sheet id, relationship id, (relationship type, part, target mode))} in workbook order
+        styles_part: e.g. 'xl/styles.xml'
+    """
+
+    def __init__(self, file: str):
+        self.file = file
+        with zipfile.ZipFile(file, "r") as zin:
+            self.parts = set(zin.namelist())
+            self.workbook_part = next(
+                (
+                    target
+                    for rel_type, target, _ in _read_rels(zin, "").values()
+                    if rel_type == OFFICE_DOCUMENT_REL_TYPE
+                ),
+                "xl/workbook.xml",
+            )
+            self.workbook_xml = zin.read(self.workbook_part)
+            self.workbook_rels = _read_rels(zin, self.workbook_part)
+            self.workbook_rels_xml = zin.read(_rels_path(self.workbook_part))
+            self.content_types_xml = zin.read("[Content_Types].xml")
+            self.styles_part = next(
+                (target for rel_type, target, _ in self.workbook_rels.values() if rel_type == STYLES_REL_TYPE), None
+            )
+            self.styles_xml = zin.read(self.styles_part) if self.styles_part in self.parts else None
+
+        self.sheets = {}
+        for sheet in ElementTree.fromstring(self.workbook_xml).iter():
+            if sheet.tag.rsplit("}", 1)[-1] == "sheet":
+                rel_id = sheet.get(f"{{{RELATIONSHIP_NS}}}id")
+                self.sheets[sheet.get("name")] = (int(sheet.get("sheetId")), rel_id, self.workbook_rels.get(rel_id))
+
+    def patch(self, sheets: dict, styles_xml: bytes = None):
+        """
+        Replace or add worksheets and copy all other parts of the package byte for byte
+
+        Args:
+            sheets (dict): {sheet name: worksheet xml} - the xml can also be a function part(dst) that writes it into the
+                file object dst. Existing sheets are replaced in place, new sheets are added after the existing ones
+            styles_xml (bytes): New content of the styles part e.g. from styles.append_style_tables()
+        """
+        parts = {}
+        remove_parts = set()
+        new_sheets = []
+        new_rels = []
+        new_overrides = []
+        replaced = False
+        sheet_ids = [sheet_id for sheet_id, _, _ in self.sheets.values()]
+        rel_ids = set(self.workbook_rels)
+        workbook_dir = posixpath.dirname(self.workbook_part)
+
+        for sheet_name, xml in sheets.items():
+            part = (lambda old_content, dst, xml=xml: xml(dst)) if callable(xml) else xml
+            if sheet_name in self.sheets:
+                _, rel_id, rel = self.sheets[sheet_name]
+                if rel is None or rel[0] != WORKSHEET_REL_TYPE:
+                    raise Exception(
+                        f'The sheet "{sheet_name}" is not a worksheet (e.g. a chart sheet) and cannot be replaced.'
+                    )
+                # the relationships of the old sheet (e.g. drawings, comments) are not valid for the new content
+                remove_parts.add(_rels_path(rel[1]))
+                parts[rel[1]] = part
+                replaced = True
+            else:
+                sheet_number = 1
+                while posixpath.join(workbook_dir, f"worksheets/sheet{sheet_number}.xml") in self.parts | set(parts):
+                    sheet_number += 1
+                rel_number = len(rel_ids) + 1
+                while f"rId{rel_number}" in rel_ids:
+                    rel_number += 1
+                rel_id = f"rId{rel_number}"
+                rel_ids.add(rel_id)
+                sheet_id = max(sheet_ids, default=0) + 1
+                sheet_ids.append(sheet_id)
+                parts[posixpath.join(workbook_dir, f"worksheets/sheet{sheet_number}.xml")] = part
+                new_sheets.append(f'<sheet name={quoteattr(sheet_name)} sheetId="{sheet_id}" r:id="{rel_id}"/>')
+                new_rels.append(
+                    f'<Relationship Id="{rel_id}" Type="{WORKSHEET_REL_TYPE}" Target="worksheets/sheet{sheet_number}.xml"/>'
+                )
+                new_overrides.append(
+                    f'<Override PartName="/{workbook_dir}/worksheets/sheet{sheet_number}.xml" ContentType="{WORKSHEET_CONTENT_TYPE}"/>'
+                )
+
+        workbook_xml = self.workbook_xml
+        workbook_rels_xml = self.workbook_rels_xml
+        content_types_xml = self.content_types_xml
+        # the calculation chain refers to the cells of the replaced sheets - Excel rebuilds it when it is missing
+        calc_chains = [(rel_id, rel[1]) for rel_id, rel in self.workbook_rels.items() if rel[0] == CALC_CHAIN_REL_TYPE]
+        if replaced:
+            for rel_id, part in calc_chains:
+                remove_parts.add(part)
+                workbook_rels_xml = re.sub(
+                    rb'<Relationship\b[^>]*\bId="' + re.escape(rel_id.encode()) + rb'"[^>]*/>', b"", workbook_rels_xml
+                )
+                content_types_xml = re.sub(
+                    rb'<Override\b[^>]*\bPartName="/' + re.escape(part.encode()) + rb'"[^>]*/>', b"", content_types_xml
+                )
+
+        if new_sheets:
+            workbook_xml = _insert_before_end_tag(workbook_xml, "sheets", new_sheets, namespaces={"r": RELATIONSHIP_NS})
+            workbook_rels_xml = _insert_before_end_tag(workbook_rels_xml, "Relationships", new_rels)
+            content_types_xml = _insert_before_end_tag(content_types_xml, "Types", new_overrides)
+            parts[self.workbook_part] = workbook_xml
+        if new_sheets or replaced:
+            parts[_rels_path(self.workbook_part)] = workbook_rels_xml
+            parts["[Content_Types].xml"] = content_types_xml
+        if styles_xml is not None and styles_xml != self.styles_xml:
+            parts[self.styles_part] = styles_xml
+
+        replace_package_parts(self.file, parts, remove_parts)
+
+
+def _insert_before_end_tag(xml: bytes, tag: str, elements: list, namespaces: dict = {}) -> bytes:
+    """Insert xml elements before the end tag of the (possibly namespace prefixed) element tag"""
+    match = re.search(rb"</(\w+:)?" + tag.encode() + rb">", xml)
+    if match is None:
+        raise Exception(f"The package part has no <{tag}> element.")
+    prefix = match[1] or b""
+    new = b""
+    for element in elements:
+        element = element.encode()
+        for ns_prefix, namespace in namespaces.items():
+            declared = re.search(rb'xmlns:(\w+)="' + re.escape(namespace.encode()) + rb'"', xml)
+            ns_prefix = ns_prefix.encode()
+            if declared is None:
+                element = element.replace(
+                    b" " + ns_prefix + b":",
+                    b" xmlns:" + ns_prefix + b'="' + namespace.encode() + b'" ' + ns_prefix + b":",
+                    1,
+                )
+            elif declared[1] != ns_prefix:
+                element = element.replace(b" " + ns_prefix + b":", b" " + declared[1] + b":")
+        new += b"<" + prefix + element[1:] if prefix else element
+    return xml[: match.start()] + new + xml[match.start() :]
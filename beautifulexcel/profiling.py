@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+
+# stats that count the warnings of the running .to_excel() call of each thread - the process-wide warning filters are
+# not touched as several writers can run at the same time e.g. in the executor threads of AsyncExcelWriter
+_warning_stats = threading.local()
+
+
+class Stats:
+    """Per-phase durations in seconds and counters e.g. {'autofit': 0.01} and {'cells_styled': 1200}"""
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Add the duration of the with-block to the phase - phases entered several times are summed up"""
+        time_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - time_start
+
+    def count(self, name: str, n: int = 1):
+        """Increase a counter"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> dict:
+        return {"phases": dict(self.phases), "counters": dict(self.counters)}
+
+
+class SheetStats(Stats):
+    """
+    Stats of a single DataframeSheet - phases (only the ones that were run):
+        theme_styles, number_formats, custom_styles: collecting the theme, number format, and to_excel(style=...) styling
+        autofit: estimating the column widths
+        write_values: pandas writing the values (engine="openpyxl")
+        resolve_styles: resolving the final cell styles of the table areas
+        apply_table_style: styling the written cells in place (engine="openpyxl")
+        write_rows: writing the styled rows (streaming, chunks, and the xlsxwriter/xml engines)
+        col_widths: setting the column widths
+
+    and counters: rows, columns, cells_styled, styles_created, ranges_resolved, warnings (of beautifulexcel e.g. unknown refs), cells_omitted (to_excel(default_styles=True))
+    """
+
+    def __init__(self, sheet_name: str, engine: str):
+        super().__init__()
+        self.sheet_name = sheet_name
+        self.engine = engine
+
+    def to_dict(self) -> dict:
+        return {"sheet_name": self.sheet_name, "engine": self.engine, **super().to_dict()}
+
+
+class WorkbookStats(Stats):
+    """
+    Stats of an ExcelWriter(profile=True) - phases:
+        setup: ExcelWriter() incl. theme loading and opening existing files
+        to_excel: all .to_excel() calls (details per sheet in .sheets)
+        to_excel_many: rendering the sheets of .to_excel_many() and merging their styles (no per sheet details)
+        save: writing the workbook package (serializing and zipping all parts incl. the sheets of engine="xml" and .to_excel_many())
+        package_rewrite: ExcelWriter(mode="patch") instead of save - copying the untouched parts of the existing file and replacing or adding the written sheets and the new cell styles
+
+    and counters: sheets, styles (distinct styles of the workbook), cells_styled, warnings, file_size_bytes
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sheets = []
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), "sheets": [sheet.to_dict() for sheet in self.sheets]}
+
+
+@contextmanager
+def count_warnings(stats: Stats):
+    """Count the warnings emitted with warn() by this thread during the with-block in the stats (None counts nothing)"""
+    previous = getattr(_warning_stats, "stats", None)
+    _warning_stats.stats = stats
+    try:
+        yield
+    finally:
+        _warning_stats.stats = previous
+
+
+def warn(message: str):
+    """warnings.warn() from the calling line that is also counted by the running count_warnings() block of this thread"""
+    stats = getattr(_warning_stats, "stats", None)
+    if stats is not None:
+        stats.count("warnings")
+    warnings.warn(message, stacklevel=2)
@@ -0,0 +1,648 @@
+# -*- coding: utf-8 -*-
+import html
+import re
+import zipfile
+from typing import Iterator, Union
+from xml.etree import ElementTree
+import numpy as np
+import pandas as pd
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.cell import range_boundaries
+from openpyxl.utils.datetime import MAC_EPOCH, WINDOWS_EPOCH
+
+from beautifulexcel.package import Package
+from beautifulexcel.utils import excel_column_number
+
+
+SHEET_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+# worksheet xml elements - tags can have a namespace prefix e.g. <x:row>
+_SHEET_DATA_START = re.compile(rb"<(?:\w+:)?sheetData\b[^>]*?(/?)>")
+_SHEET_DATA_END = re.compile(rb"</(?:\w+:)?sheetData>")
+_ROW_START = re.compile(rb"<(?:\w+:)?row\b")
+_ROW = re.compile(rb"<(?:\w+:)?row\b([^>]*?)(?:/>|>(.*?)</(?:\w+:)?row>)", re.S)
+_CELL = re.compile(rb"<(?:\w+:)?c\b([^>]*?)(?:/>|>(.*?)</(?:\w+:)?c>)", re.S)
+_ATTR = re.compile(rb'\b(r|s|t)="([^"]*)"')
+_VALUE = re.compile(rb"<(?:\w+:)?v>(.*?)</(?:\w+:)?v>", re.S)
+_FORMULA = re.compile(rb"<(?:\w+:)?f\b[^>]*>(.*?)</(?:\w+:)?f>", re.S)
+_TEXT = re.compile(rb"<(?:\w+:)?t\b[^>]*?(?:/>|>(.*?)</(?:\w+:)?t>)", re.S)
+_PHONETIC_RUN = re.compile(rb"<(?:\w+:)?rPh\b.*?</(?:\w+:)?rPh>", re.S)
+_MERGE_CELL = re.compile(rb'<(?:\w+:)?mergeCell\b[^>]*\bref="([A-Z]+\d+:[A-Z]+\d+)"')
+
+# cells in the attribute order written by Excel, openpyxl, xlsxwriter, and the xml engine (r, s, t) with a plain value
+# or inline string - groups: column letters, row number, style id, type, empty cell, value, inline string, any other content
+_PLAIN_CELL = re.compile(
+    rb'<c r="([A-Z]+)(\d+)"(?: s="(\d*)")?(?: t="(\w*)")?(?: (?![st]=)[\w:]+="[^"]*")*\s*'
+    rb"(?:(/)>|>(?:<v>([^<]*)</v>|<is><t[^>]*>([^<]*)</t></is>|(.*?))</c>)",
+    re.S,
+)
+
+# cell kinds
+# DECIMAL are numbers with a number format showing decimal places (e.g. num_fmt_decimal) which are read as floats
+EMPTY, NUMBER, DECIMAL, DATE, BOOL, TEXT, OTHER = range(7)
+
+
+def read_excel(
+    file,
+    sheet_name: Union[str, int] = 0,
+    startrow: int = 0,
+    startcol: int = 0,
+    index: Union[bool, int] = False,
+    header: Union[bool, int] = True,
+    nrows: int = None,
+    chunksize: int = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Read a table written by ExcelWriter.to_excel() back into a pandas Dataframe - the inverse of .to_excel()
+
+    The worksheet xml is streamed block by block and parsed into arrays without loading the workbook or creating cell
+    objects, so the styling of the table costs neither time nor memory. The column dtypes are taken from the cells
+    instead of being guessed from their text: numbers become float64 if their number format shows decimal places
+    (e.g. num_fmt_decimal), values are missing, or are not whole numbers and int64 otherwise, cells with a date number
+    format datetime64, booleans bool, and texts object columns.
+
+    Args:
+        file (str or file-like): Path to or binary file object of a xlsx file
+        sheet_name (str or int): Sheet name or 0-based sheet position
+        startrow (int): Upper left cell row of the table like in .to_excel() (zero indexed)
+        startcol (int): Upper left cell column of the table like in .to_excel() (zero indexed)
+        index (bool or int): The first column/s are the row names/index - the number of index levels for a MultiIndex
+        header (bool or int): The first row/s are the column names/header - the number of header levels for a MultiIndex
+        nrows (int): Maximum number of table rows to read (default: all rows up to the end of the sheet)
+        chunksize (int): Return an iterator of dataframes with at most chunksize rows each instead of a single dataframe - only one chunk is held in memory at a time and the dtypes are decided per chunk
+
+    Returns:
+        pd.DataFrame or iterator of pd.DataFrame
+
+    Example:
+        ```python
+        from beautifulexcel import read_excel
+
+        df = read_excel('workbook.xlsx', sheet_name='My Sheet', index=True)
+
+        for chunk in read_excel('workbook.xlsx', sheet_name='My Sheet', chunksize=100_000):
+            ...
+        ```
+    """
+    chunks = _iter_chunks(file, sheet_name, startrow, startcol, int(index), int(header), nrows, chunksize)
+    if chunksize is not None:
+        return chunks
+    return next(chunks)
+
+
+class _WorkbookParts:
+    """Sheet part, date styles, date epoch, and shared strings of a xlsx package needed to read the cell values"""
+
+    def __init__(self, zin, package: Package, sheet_name):
+        if isinstance(sheet_name, int):
+            sheet_names = list(package.sheets)
+            if not -len(sheet_names) <= sheet_name < len(sheet_names):
+                raise Exception(
+                    f"The workbook has no sheet at position {sheet_name}. Available sheets are: {sheet_names}"
+                )
+            sheet_name = sheet_names[sheet_name]
+        if sheet_name not in package.sheets or package.sheets[sheet_name][2] is None:
+            raise Exception(f'The sheet "{sheet_name}" does not exist. Available sheets are: {list(package.sheets)}')
+        self.sheet_part = package.sheets[sheet_name][2][1]
+
+        date1904 = re.search(rb'<(?:\w+:)?workbookPr\b[^>]*\bdate1904="(1|true)"', package.workbook_xml)
+        self.epoch = MAC_EPOCH if date1904 else WINDOWS_EPOCH
+        self.date_styles, self.decimal_styles = _number_style_ids(package.styles_xml)
+
+        shared_strings_part = next(
+            (target for rel_type, target, _ in package.workbook_rels.values() if rel_type.endswith("/sharedStrings")),
+            None,
+        )
+        shared_strings = []
+        if shared_strings_part in package.parts:
+            with zin.open(shared_strings_part) as src:
+                for _, element in ElementTree.iterparse(src):
+                    if element.tag == SHEET_MAIN_NS + "si":
+                        shared_strings.append("".join(_shared_string_texts(element)))
+                        element.clear()
+        self.shared_strings = np.empty(len(shared_strings), dtype=object)
+        self.shared_strings[:] = shared_strings
+
+
+def _number_style_ids(styles_xml: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Cell style ids (positions in <cellXfs>) with a date number format and with a number format showing decimal places
+
+    Percentages are not decimal styles as num_fmt_pct is used for integer and float columns alike.
+    """
+    if styles_xml is None:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    root = ElementTree.fromstring(styles_xml)
+    number_formats = {
+        int(number_format.get("numFmtId")): number_format.get("formatCode")
+        for number_format in root.iter(SHEET_MAIN_NS + "numFmt")
+    }
+    cell_xfs = root.find(SHEET_MAIN_NS + "cellXfs")
+    date_styles, decimal_styles = [], []
+    for style_id, xf in enumerate([] if cell_xfs is None else cell_xfs.iter(SHEET_MAIN_NS + "xf")):
+        number_format_id = int(xf.get("numFmtId", 0))
+        number_format = number_formats.get(number_format_id, BUILTIN_FORMATS.get(number_format_id))
+        if number_format is not None and is_date_format(number_format):
+            date_styles.append(style_id)
+        elif number_format is not None and _is_decimal_format(number_format):
+            decimal_styles.append(style_id)
+    return np.array(date_styles, dtype=np.int64), np.array(decimal_styles, dtype=np.int64)
+
+
+def _is_decimal_format(number_format: str) -> bool:
+    """Whether a number format shows decimal places (and is no percentage) e.g. '#,##0.00' but not '#,##0' or '0.0%'"""
+    # without quoted texts, escaped and bracketed parts e.g. '"-"' or '[Red]'
+    number_format = re.sub(r'"[^"]*"|\\.|\[[^\]]*\]', "", number_format)
+    return "%" not in number_format and re.search(r"\.[0#?]", number_format) is not None
+
+
+def _shared_string_texts(element):
+    """Texts of a parsed shared string element <si> - plain <t> or rich text runs <r><t> without phonetic runs"""
+    for child in element:
+        if child.tag == SHEET_MAIN_NS + "t":
+            yield child.text or ""
+        elif child.tag == SHEET_MAIN_NS + "r":
+            yield child.findtext(SHEET_MAIN_NS + "t") or ""
+
+
+def _text(xml: bytes) -> str:
+    """Decoded and unescaped text of an xml element"""
+    text = xml.decode("utf-8")
+    return html.unescape(text) if "&" in text else text
+
+
+def _rich_text(xml: bytes) -> str:
+    """Text of the content of an inline string element - plain <t> or rich text runs <r><t> without phonetic runs"""
+    if b"rPh" in xml:
+        xml = _PHONETIC_RUN.sub(b"", xml)
+    return "".join(_text(text[1]) for text in _TEXT.finditer(xml) if text[1])
+
+
+def _merged_ranges(zin, part: str) -> list:
+    """
+    Merged cell ranges of a worksheet as (min_row, max_row, min_col, max_col)
+
+    The <mergeCells> come after the rows in the worksheet xml, so they are searched in the raw xml beforehand
+    """
+    ranges = []
+    with zin.open(part) as src:
+        tail = b""
+        while True:
+            block = src.read(4 * 1024 * 1024)
+            data = tail + block
+            matches = list(_MERGE_CELL.finditer(data))
+            for match in matches:
+                min_col, min_row, max_col, max_row = range_boundaries(match[1].decode())
+                ranges.append((min_row, max_row, min_col, max_col))
+            if not block:
+                return ranges
+            # keep the end of the block after the last match in case an element is cut in half
+            tail = data[max(matches[-1].end() if matches else 0, len(data) - 256) :]
+
+
+def _iter_sheet_data(zin, part: str, block_size: int = 4 * 1024 * 1024):
+    """Yield the content of the <sheetData> element of a worksheet in blocks that only contain complete <row> elements"""
+    with zin.open(part) as src:
+        data = b""
+        in_sheet_data = False
+        while True:
+            block = src.read(block_size)
+            data += block
+            if not in_sheet_data:
+                match = _SHEET_DATA_START.search(data)
+                if match is None:
+                    if not block:
+                        return
+                    continue
+                if match[1]:
+                    # empty <sheetData/>
+                    return
+                in_sheet_data = True
+                data = data[match.end() :]
+
+            sheet_data_end = _SHEET_DATA_END.search(data)
+            if sheet_data_end is not None or not block:
+                yield data[: sheet_data_end.start()] if sheet_data_end is not None else data
+                return
+            # everything before the start of the last row are complete rows - the last row is completed by the next block
+            end = max(data.rfind(b"<row "), data.rfind(b"<row>"))
+            if end == -1:
+                end = max([match.start() for match in _ROW_START.finditer(data)], default=0)
+            if end > 0:
+                yield data[:end]
+                data = data[end:]
+
+
+class _Cells:
+    """
+    Non-empty cells of worksheet rows as arrays: row and column numbers (1-based), kinds (NUMBER, DECIMAL, DATE, BOOL,
+    TEXT, OTHER), raw values (the xml text of numbers, dates, and booleans), and values (python objects of texts and others)
+    """
+
+    __slots__ = ("rows", "cols", "kinds", "raw", "values")
+
+    def __init__(self, rows, cols, kinds, raw, values):
+        self.rows = rows
+        self.cols = cols
+        self.kinds = kinds
+        self.raw = raw
+        self.values = values
+
+    def __len__(self):
+        return len(self.rows)
+
+    def take(self, positions) -> "_Cells":
+        """Cells at the positions (boolean mask or integer positions)"""
+        return _Cells(*[getattr(self, attr)[positions] for attr in _Cells.__slots__])
+
+    @staticmethod
+    def concat(cells: list) -> "_Cells":
+        if not cells:
+            return _Cells.empty()
+        if len(cells) == 1:
+            return cells[0]
+        return _Cells(*[np.concatenate([getattr(i, attr) for i in cells]) for attr in _Cells.__slots__])
+
+    @staticmethod
+    def empty() -> "_Cells":
+        return _Cells(
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int8),
+            np.array([], dtype=bytes),
+            np.array([], dtype=object),
+        )
+
+
+def _parse_cells(data: bytes, parts: _WorkbookParts, col_numbers: dict) -> _Cells:
+    """
+    Parse the cells of complete <row> elements - vectorized for the plain cells written by Excel, openpyxl,
+    xlsxwriter, and the xml engine and cell by cell with _parse_cells_generic() for anything else (e.g. namespace
+    prefixes, cells without refs, or another attribute order)
+    """
+    matches = _PLAIN_CELL.findall(data)
+    if len(matches) != data.count(b"<c ") + data.count(b"<c>"):
+        return _parse_cells_generic(data, parts, col_numbers)
+    if not matches:
+        return _Cells.empty()
+
+    letters, rows, styles, types, empty, raw, inline_strings, contents = (np.array(group) for group in zip(*matches))
+    letters, letter_codes = np.unique(letters, return_inverse=True)
+    for col_letter in letters:
+        if col_letter not in col_numbers:
+            col_numbers[col_letter] = excel_column_number(col_letter.decode())
+    cols = np.array([col_numbers[col_letter] for col_letter in letters], dtype=np.int64)[letter_codes]
+    rows = rows.astype(np.int64)
+
+    kinds = np.zeros(len(matches), dtype=np.int8)
+    values = np.full(len(matches), None, dtype=object)
+    has_value = raw != b""
+    is_number = ((types == b"") | (types == b"n")) & has_value
+    kinds[is_number] = NUMBER
+    if len(parts.date_styles) > 0 or len(parts.decimal_styles) > 0:
+        style_ids = np.where(styles == b"", b"0", styles).astype(np.int64)
+        kinds[is_number & np.isin(style_ids, parts.date_styles)] = DATE
+        kinds[is_number & np.isin(style_ids, parts.decimal_styles)] = DECIMAL
+    kinds[(types == b"b") & has_value] = BOOL
+
+    is_shared = (types == b"s") & has_value
+    kinds[is_shared] = TEXT
+    values[is_shared] = parts.shared_strings[raw[is_shared].astype(np.int64)]
+
+    is_inline = (types == b"inlineStr") & (empty == b"") & (contents == b"")
+    kinds[is_inline] = TEXT
+    inline_texts = np.empty(int(is_inline.sum()), dtype=object)
+    inline_texts[:] = [_text(text) for text in inline_strings[is_inline]]
+    values[is_inline] = inline_texts
+
+    # everything else e.g. formulas, rich text, errors, and formula strings cell by cell
+    others = np.flatnonzero((kinds == EMPTY) & ((contents != b"") | has_value))
+    if len(others) > 0:
+        raw = raw.astype(object)
+        for i in others:
+            value = raw[i] if has_value[i] else _VALUE.search(contents[i])
+            if not has_value[i] and value is not None:
+                value = value[1]
+            kinds[i], values[i] = _parse_cell(types[i], styles[i], value, contents[i], parts)
+            if kinds[i] <= BOOL:
+                raw[i], values[i] = values[i], None
+        raw = np.array(raw.tolist(), dtype=bytes)
+
+    keep = kinds != EMPTY
+    kinds = kinds[keep]
+    return _Cells(rows[keep], cols[keep], kinds, np.where(kinds <= BOOL, raw[keep], b""), values[keep])
+
+
+def _parse_cells_generic(data: bytes, parts: _WorkbookParts, col_numbers: dict) -> _Cells:
+    """Parse the cells of complete <row> elements cell by cell with any attribute order, namespace prefixes, or without refs"""
+    rows, cols, kinds, raw, values = [], [], [], [], []
+    row_num = 0
+    for row in _ROW.finditer(data):
+        row_num = int(dict(_ATTR.findall(row[1])).get(b"r", row_num + 1))
+        col_num = 0
+        for cell in _CELL.finditer(row[2] or b""):
+            attrs = dict(_ATTR.findall(cell[1]))
+            ref = attrs.get(b"r")
+            if ref is None:
+                col_num += 1
+            else:
+                col_letter = ref.rstrip(b"0123456789")
+                if col_letter not in col_numbers:
+                    col_numbers[col_letter] = excel_column_number(col_letter.decode())
+                col_num = col_numbers[col_letter]
+            if not cell[2]:
+                continue
+            value = _VALUE.search(cell[2])
+            kind, value = _parse_cell(
+                attrs.get(b"t", b"n"), attrs.get(b"s", b""), None if value is None else value[1], cell[2], parts
+            )
+            if kind != EMPTY:
+                rows.append(row_num)
+                cols.append(col_num)
+                kinds.append(kind)
+                raw.append(value if kind <= BOOL else b"")
+                values.append(None if kind <= BOOL else value)
+    object_values = np.empty(len(values), dtype=object)
+    object_values[:] = values
+    return _Cells(
+        np.array(rows, dtype=np.int64),
+        np.array(cols, dtype=np.int64),
+        np.array(kinds, dtype=np.int8),
+        np.array(raw, dtype=bytes),
+        object_values,
+    )
+
+
+def _parse_cell(cell_type: bytes, style: bytes, value: bytes, content: bytes, parts: _WorkbookParts):
+    """Kind and value of a single cell - the value is the xml text for NUMBER, DECIMAL, DATE, and BOOL and a python object otherwise"""
+    if cell_type in [b"n", b""]:
+        if not value:
+            formula = _FORMULA.search(content or b"")
+            return (EMPTY, None) if formula is None else (OTHER, "=" + _text(formula[1]))
+        if int(style or 0) in parts.date_styles:
+            return DATE, value
+        if int(style or 0) in parts.decimal_styles:
+            return DECIMAL, value
+        return NUMBER, value
+    if cell_type == b"s":
+        return (EMPTY, None) if value is None else (TEXT, parts.shared_strings[int(value)])
+    if cell_type == b"inlineStr":
+        return TEXT, _rich_text(content)
+    if cell_type == b"b":
+        return (EMPTY, None) if value is None else (BOOL, value)
+    if value is None:
+        return EMPTY, None
+    if cell_type == b"d":
+        return OTHER, pd.Timestamp(_text(value)).to_pydatetime()
+    # formula strings (str) and errors (e) e.g. '#N/A'
+    return TEXT if cell_type == b"str" else OTHER, _text(value)
+
+
+def _iter_chunks(file, sheet_name, startrow, startcol, index_depth, header_depth, nrows, chunksize):
+    """Parse the header rows and yield the table body as dataframes of at most chunksize rows"""
+    package = Package(file)
+    with zipfile.ZipFile(file, "r") as zin:
+        parts = _WorkbookParts(zin, package, sheet_name)
+        first_col = startcol + 1
+        col_numbers = {}
+        blocks = (_parse_cells(data, parts, col_numbers) for data in _iter_sheet_data(zin, parts.sheet_part))
+        # MultiIndex labels spanning several rows/columns are only written once in a merged cell range
+        merged = _merged_ranges(zin, parts.sheet_part) if index_depth > 1 or header_depth > 1 else []
+
+        # the header rows (and the row below for the pandas index names row) - the rest is kept for the body
+        header_start = startrow + 1
+        buffered = []
+        for cells in blocks:
+            cells = cells.take((cells.rows >= header_start) & (cells.cols >= first_col))
+            buffered.append(cells)
+            if len(cells) > 0 and cells.rows[-1] > header_start + header_depth:
+                break
+        cells = _Cells.concat(buffered)
+        is_header = cells.rows < header_start + header_depth
+        header_cells, cells = cells.take(is_header), cells.take(~is_header)
+
+        width = None
+        header_values = []
+        if header_depth > 0:
+            width = int(header_cells.cols.max()) - first_col + 1 if len(header_cells) > 0 else 0
+            header_values = [[None] * width for _ in range(header_depth)]
+            for row_num, col_num, value in zip(
+                header_cells.rows, header_cells.cols, _python_values(header_cells, parts.epoch)
+            ):
+                header_values[row_num - header_start][col_num - first_col] = value
+        for min_row, max_row, min_col, max_col in merged:
+            if header_start <= min_row and max_row < header_start + header_depth and min_col - first_col >= index_depth:
+                value = header_values[min_row - header_start][min_col - first_col]
+                for row_num in range(min_row, max_row + 1):
+                    header_values[row_num - header_start][min_col - first_col : max_col - first_col + 1] = [value] * (
+                        max_col + 1 - min_col
+                    )
+
+        # the index names are in the header row - with a MultiIndex header its level names are in the last index column
+        index_names = [None] * index_depth
+        if header_depth == 1:
+            index_names = header_values[0][:index_depth]
+        # pandas writes the index names of a table with a MultiIndex header in an extra row below the header - blank if unnamed
+        body_start = header_start + header_depth
+        if header_depth > 1 and index_depth > 0:
+            is_names_row = cells.rows == body_start
+            if np.all(cells.cols[is_names_row] < first_col + index_depth):
+                names_cells = cells.take(is_names_row)
+                for col_num, value in zip(names_cells.cols, _python_values(names_cells, parts.epoch)):
+                    index_names[col_num - first_col] = value
+                cells = cells.take(~is_names_row)
+                body_start += 1
+
+        if header_depth > 1:
+            columns = pd.MultiIndex.from_arrays(
+                [values[index_depth:] for values in header_values],
+                names=[values[index_depth - 1] if index_depth > 0 else None for values in header_values],
+            )
+        elif header_depth == 1:
+            columns = pd.Index(header_values[0][index_depth:])
+        else:
+            columns = None
+
+        index_spans = [
+            np.array(
+                sorted(
+                    (min_row, max_row)
+                    for min_row, max_row, min_col, max_col in merged
+                    if min_col == first_col + level == max_col
+                ),
+                dtype=np.int64,
+            ).reshape(-1, 2)
+            for level in range(index_depth)
+        ]
+        table = _Table(first_col, body_start, width, index_depth, index_names, index_spans, columns, parts.epoch)
+        yield from table.iter_chunks(_prepend(cells, blocks), nrows, chunksize)
+
+
+def _prepend(item, iterator):
+    """Iterator with item first"""
+    yield item
+    yield from iterator
+
+
+class _Table:
+    """Layout of the table body to build dataframes from its cells"""
+
+    def __init__(self, first_col, body_start, width, index_depth, index_names, index_spans, columns, epoch):
+        self.first_col = first_col
+        self.body_start = body_start
+        self.width = width
+        self.index_depth = index_depth
+        self.index_names = index_names
+        self.index_spans = index_spans
+        self.columns = columns
+        self.epoch = epoch
+
+    def iter_chunks(self, blocks, nrows, chunksize):
+        """Yield dataframes of at most chunksize body rows from the cell blocks"""
+        end_row = np.inf if nrows is None else self.body_start + nrows
+        chunk_start = self.body_start
+        chunk_end = np.inf if chunksize is None else chunk_start + chunksize
+        buffered = []
+        last_row = chunk_start - 1
+        previous = None
+        for cells in blocks:
+            # blocks only contain complete rows, so all rows before the last row of the block are complete
+            reached_end = len(cells) > 0 and cells.rows[-1] >= end_row - 1
+            keep = (cells.rows >= self.body_start) & (cells.rows < end_row) & (cells.cols >= self.first_col)
+            if self.width is not None:
+                keep &= cells.cols < self.first_col + self.width
+            cells = cells.take(keep)
+            if len(cells) > 0:
+                last_row = max(last_row, int(cells.rows[-1]))
+                buffered.append(cells)
+            while last_row >= chunk_end:
+                chunk_cells = _Cells.concat(buffered)
+                in_chunk = chunk_cells.rows < chunk_end
+                previous = self.to_dataframe(
+                    chunk_cells.take(in_chunk), chunk_start, int(chunk_end - chunk_start), previous
+                )
+                yield previous
+                buffered = [chunk_cells.take(~in_chunk)]
+                chunk_start, chunk_end = chunk_end, chunk_end + chunksize
+            if reached_end:
+                break
+
+        if last_row >= chunk_start or previous is None:
+            yield self.to_dataframe(_Cells.concat(buffered), chunk_start, max(last_row - chunk_start + 1, 0), previous)
+
+    def to_dataframe(self, cells, start_row, n_rows, previous):
+        """Dataframe of the body cells of the rows start_row to start_row + n_rows (the previous chunk continues merged index spans)"""
+        if self.width is not None:
+            n_cols = self.width
+        else:
+            n_cols = int(cells.cols.max()) - self.first_col + 1 if len(cells) > 0 else 0
+        order = np.argsort(cells.cols, kind="stable")
+        col_starts = np.searchsorted(cells.cols[order], np.arange(self.first_col, self.first_col + n_cols + 1))
+        arrays = [
+            _column_array(cells.take(order[col_starts[i] : col_starts[i + 1]]), start_row, n_rows, self.epoch)
+            for i in range(n_cols)
+        ]
+        arrays += [np.full(n_rows, np.nan)] * (self.index_depth - len(arrays))
+
+        index_arrays, body = arrays[: self.index_depth], arrays[self.index_depth :]
+        columns = self.columns if self.columns is not None else pd.RangeIndex(len(body))
+        body += [np.full(n_rows, np.nan)] * (len(columns) - len(body))
+        df = pd.DataFrame(dict(enumerate(body)), index=pd.RangeIndex(n_rows))
+        df.columns = columns
+
+        if self.index_depth > 1:
+            # merged MultiIndex spans only hold the label in their first row - from the previous chunk if the span started there
+            for level, spans in enumerate(self.index_spans):
+                previous_label = (
+                    None if previous is None or len(previous) == 0 else previous.index.get_level_values(level)[-1]
+                )
+                index_arrays[level] = _fill_spans(index_arrays[level], spans, start_row, previous_label)
+            df.index = pd.MultiIndex.from_arrays(index_arrays, names=self.index_names)
+        elif self.index_depth == 1:
+            df.index = pd.Index(index_arrays[0], name=self.index_names[0])
+        return df
+
+
+def _fill_spans(array: np.ndarray, spans: np.ndarray, start_row: int, previous_label) -> np.ndarray:
+    """Repeat the label of the first row of each (min_row, max_row) span in the other rows of the span"""
+    if len(spans) == 0 or len(array) == 0:
+        return array
+    row_nums = np.arange(start_row, start_row + len(array))
+    span_idx = np.maximum(np.searchsorted(spans[:, 0], row_nums, side="right") - 1, 0)
+    span_starts = spans[span_idx, 0]
+    hidden = (row_nums > span_starts) & (row_nums <= spans[span_idx, 1])
+    if not np.any(hidden):
+        return array
+    array = array.astype(object)
+    from_previous = hidden & (span_starts < start_row)
+    array[from_previous] = previous_label
+    from_chunk = hidden & ~from_previous
+    array[from_chunk] = array[span_starts[from_chunk] - start_row]
+    return array
+
+
+def _column_array(cells: _Cells, start_row: int, n_rows: int, epoch) -> np.ndarray:
+    """Array of a column with the dtype of its cell kinds - columns of mixed kinds are object arrays of python values"""
+    positions = cells.rows - start_row
+    kinds = set(np.unique(cells.kinds).tolist())
+    complete = len(cells) == n_rows
+
+    if not kinds:
+        return np.full(n_rows, np.nan)
+    if kinds == {NUMBER} or kinds == {DECIMAL} or kinds == {NUMBER, DECIMAL}:
+        # numbers are integers only if none is formatted with decimal places, missing, or written as a float
+        if (
+            kinds == {NUMBER}
+            and complete
+            and not any(char in b"".join(cells.raw.tolist()) for char in [b".", b"E", b"e", b"N", b"I"])
+        ):
+            try:
+                return cells.raw.astype(np.int64)
+            except (OverflowError, ValueError):
+                pass
+        array = np.full(n_rows, np.nan)
+        array[positions] = cells.raw.astype(float)
+        return array
+    if kinds == {DATE}:
+        serials = np.full(n_rows, np.nan)
+        serials[positions] = cells.raw.astype(float)
+        return excel_datetimes(serials, epoch)
+    if kinds == {BOOL} and complete:
+        return cells.raw == b"1"
+
+    array = np.full(n_rows, None, dtype=object)
+    array[positions] = _python_values(cells, epoch)
+    return array
+
+
+def _python_values(cells: _Cells, epoch) -> np.ndarray:
+    """Python objects of the cell values e.g. for the header and columns of mixed kinds"""
+    values = cells.values.copy()
+    for kind, convert in [
+        (NUMBER, lambda raw: [int(value) if value.lstrip(b"-").isdigit() else float(value) for value in raw.tolist()]),
+        (DATE, lambda raw: pd.DatetimeIndex(excel_datetimes(raw.astype(float), epoch)).to_pydatetime().tolist()),
+        (DECIMAL, lambda raw: raw.astype(float).tolist()),
+        (BOOL, lambda raw: (raw == b"1").tolist()),
+    ]:
+        is_kind = cells.kinds == kind
+        if np.any(is_kind):
+            converted = np.empty(int(is_kind.sum()), dtype=object)
+            converted[:] = convert(cells.raw[is_kind])
+            values[is_kind] = converted
+    return values
+
+
+def excel_datetimes(serials: np.ndarray, epoch=WINDOWS_EPOCH) -> np.ndarray:
+    """Vectorized openpyxl.utils.datetime.from_excel() for an array of Excel date serials - returns a datetime64[us] array (NaT for NaN)"""
+    missing = np.isnan(serials)
+    serials = np.where(missing, 0, serials)
+    # whole microseconds since the epoch - rounding the serial as a whole avoids the float error of its day fraction
+    microseconds = np.round(serials * 86_400_000_000).astype(np.int64)
+    if epoch == WINDOWS_EPOCH:
+        # Excel's fictional 1900-02-29
+        microseconds = np.where((serials > 0) & (serials < 60), microseconds + 86_400_000_000, microseconds)
+    # serials are written with 16 significant digits (about 1 microsecond) - times this close to a whole millisecond are snapped to it
+    milliseconds = np.round(microseconds / 1000).astype(np.int64) * 1000
+    microseconds = np.where(np.abs(microseconds - milliseconds) <= 2, milliseconds, microseconds)
+    dates = np.datetime64(epoch, "us") + microseconds.astype("timedelta64[us]")
+    dates[missing] = np.datetime64("NaT")
+    return dates
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import openpyxl
+from openpyxl.cell._writer import _set_attributes
+from openpyxl.compat import safe_string
+from openpyxl.utils.datetime import WINDOWS_EPOCH
+
+
+EMPTY_CELL = "/>"
+
+# text columns reference the shared strings table if each distinct text is used by at least this many cells on average -
+# columns of (mostly) unique texts are written as inline strings as a shared table would only add to the file
+SHARED_STRINGS_MIN_REPEATS = 2
+
+_INLINE_STRING_START = ' t="inlineStr"><is>'
+_INLINE_STRING_END = "</is></c>"
+
+
+def escape_text(text: str) -> str:
+    """Escape a text for the worksheet xml like openpyxl/lxml does"""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\r", "&#13;")
+
+
+def cell_content(cell) -> str:
+    """
+    Serialize the value of an openpyxl cell to the part of the <c> element after the 'r' and 's' attributes e.g.
+    ' t="n"><v>1.5</v></c>' - returns EMPTY_CELL for empty cells
+    """
+    value, attrs = _set_attributes(cell)
+    if value is None or value == "":
+        return EMPTY_CELL
+    if cell.data_type == "f":
+        return f"><f>{escape_text(value[1:])}</f><v></v></c>"
+    if cell.data_type == "s":
+        text = str(value)
+        stripped = text.strip()
+        space = ' xml:space="preserve"' if stripped and text != stripped else ""
+        return f' t="inlineStr"><is><t{space}>{escape_text(text)}</t></is></c>'
+    return f' t="{attrs["t"]}"><v>{escape_text(safe_string(value))}</v></c>'
+
+
+class SharedStrings:
+    """
+    Shared strings table of a workbook (xl/sharedStrings.xml) - the texts are kept as the xml of their <si> element
+    e.g. '<t>BANK</t>' and each distinct text gets the index of its first add()
+    """
+
+    def __init__(self):
+        self.indices = {}
+
+    def __len__(self):
+        return len(self.indices)
+
+    def add(self, text_xml: str) -> int:
+        """Index of a text (the xml content of its <si> element) in the table - new texts are appended"""
+        return self.indices.setdefault(text_xml, len(self.indices))
+
+    def to_xml(self) -> bytes:
+        """The xml of the shared strings part"""
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" uniqueCount="{len(self.indices)}">'
+            + "".join("<si>" + text_xml + "</si>" for text_xml in self.indices)
+            + "</sst>"
+        ).encode("utf-8")
+
+
+def excel_serials(values: np.ndarray, epoch=WINDOWS_EPOCH) -> np.ndarray:
+    """Vectorized openpyxl.utils.datetime.to_excel() for a datetime64 array - returns the Excel date serials as floats"""
+    values = values.astype("datetime64[us]")
+    delta = (values - np.datetime64(epoch, "us")).astype(np.int64)
+    days = delta // 86_400_000_000
+    if epoch == WINDOWS_EPOCH:
+        # Excel's fictional 1900-02-29
+        days = np.where((days > 0) & (days <= 60), days - 1, days)
+    microseconds = (values - values.astype("datetime64[D]")).astype(np.int64)
+    seconds = microseconds // 1_000_000
+    return days + (seconds + (microseconds % 1_000_000) / 10**6) / 86400
+
+
+def number_strings(values: np.ndarray) -> np.ndarray:
+    """Format numbers like openpyxl's safe_string() ('%.16g') as string array"""
+    if values.dtype.kind in "iu" and len(values) > 0 and np.abs(values).max() < 10**16:
+        return values.astype(str)
+    return np.array(["%.16g" % value for value in values.tolist()], dtype=str)
+
+
+def encode_column(values, ws, value_with_fmt, shared_strings: SharedStrings = None):
+    """
+    Encode a dataframe column or index level into worksheet xml cell contents
+
+    Returns (contents, codes, content_formats, number_formats) with contents[codes] the cell content of cell_content()
+    for each row and number_formats[content_formats[codes]] the number format of each row - code -1 refers to the last
+    content which is always an empty cell with number_formats[0] = None
+
+    With a shared_strings table the texts of categorical and low-cardinality text columns are added to the table once
+    per distinct value and the cells reference them (t="s") - all other texts stay inline strings
+    """
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    dtype = values.dtype
+    n_rows = len(values)
+
+    # vectorized formatting of numeric and naive datetime columns
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+        array = values.to_numpy()
+        missing = pd.isna(array) if dtype.kind in "fM" else np.zeros(n_rows, dtype=bool)
+        number_formats = [None]
+        if dtype.kind == "b":
+            finite = ~missing
+            prefix, strings = ' t="b"><v>', np.where(array, "1", "0")
+        elif dtype.kind == "M":
+            number_formats.append(value_with_fmt(pd.Timestamp(0))[1])
+            finite = ~missing
+            prefix, strings = ' t="n"><v>', number_strings(excel_serials(array[finite], ws.parent.epoch))
+        else:
+            # like pandas.DataFrame.to_excel(inf_rep="inf") infinite numbers are written as text
+            finite = ~missing & np.isfinite(array)
+            prefix, strings = ' t="n"><v>', number_strings(array[finite])
+        contents = np.full(n_rows + 1, EMPTY_CELL, dtype=object)
+        contents[:-1][finite] = np.char.add(np.char.add(prefix, strings), "</v></c>")
+        if dtype.kind == "f":
+            contents[:-1][array == np.inf] = ' t="inlineStr"><is><t>inf</t></is></c>'
+            contents[:-1][array == -np.inf] = ' t="inlineStr"><is><t>-inf</t></is></c>'
+        codes = np.arange(n_rows)
+        codes[missing] = -1
+        content_formats = np.full(n_rows + 1, len(number_formats) - 1, dtype=int)
+        content_formats[-1] = 0
+        return contents.astype(str), codes, content_formats, number_formats
+
+    # all other columns are encoded once per distinct value (strings and categoricals) or cell by cell
+    used = None
+    if isinstance(dtype, pd.CategoricalDtype):
+        # the categories and codes are already known - unused categories are not encoded
+        codes = np.asarray(values.cat.codes, dtype=np.int64)
+        uniques = list(values.cat.categories)
+        used = np.bincount(codes[codes >= 0], minlength=len(uniques)) > 0
+    elif pd.api.types.infer_dtype(values, skipna=True) in ["string", "empty"]:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        uniques = list(uniques)
+    else:
+        uniques = values.tolist()
+        codes = np.arange(n_rows)
+        codes[pd.isna(values).to_numpy()] = -1
+    n_used = len(uniques) if used is None else int(used.sum())
+    share_strings = shared_strings is not None and 0 < n_used * SHARED_STRINGS_MIN_REPEATS <= int((codes >= 0).sum())
+
+    number_formats = [None]
+    contents = []
+    content_formats = []
+    for i, value in enumerate(uniques):
+        if (used is not None and not used[i]) or (pd.api.types.is_scalar(value) and pd.isna(value)):
+            content, number_format = EMPTY_CELL, None
+        else:
+            content, number_format = encode_value(value, ws, value_with_fmt)
+            if share_strings and content.startswith(_INLINE_STRING_START):
+                text_xml = content[len(_INLINE_STRING_START) : -len(_INLINE_STRING_END)]
+                content = f' t="s"><v>{shared_strings.add(text_xml)}</v></c>'
+        if number_format not in number_formats:
+            number_formats.append(number_format)
+        contents.append(content)
+        content_formats.append(number_formats.index(number_format))
+    return (
+        np.array(contents + [EMPTY_CELL], dtype=str),
+        np.asarray(codes),
+        np.array(content_formats + [0], dtype=int),
+        number_formats,
+    )
+
+
+def encode_value(value, ws, value_with_fmt):
+    """Encode a single value into the worksheet xml cell content of cell_content() - returns (content, number_format)"""
+    value, number_format = value_with_fmt(value)
+    cell = openpyxl.cell.Cell(ws, row=1, column=1, value=value)
+    if number_format:
+        cell.number_format = number_format
+    return cell_content(cell), (None if cell.number_format == "General" else cell.number_format)
+
+
+def cells_xml(col_letter, row_strs, style_ids, contents):
+    """Vectorized <c> elements of a column from the row numbers, xf style ids, and cell contents (string arrays)"""
+    style_attrs = np.where(style_ids == 0, "", np.char.add(np.char.add(' s="', style_ids.astype(str)), '"'))
+    return np.char.add(
+        np.char.add(np.char.add(f'<c r="{col_letter}', row_strs), np.char.add('"', style_attrs)), contents
+    )
@@ -0,0 +1,580 @@
+# -*- coding: utf-8 -*-
+import re
+from copy import copy
+import numpy as np
+import openpyxl
+from openpyxl.styles.cell_style import CellStyle, StyleArray
+from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE, NumberFormat
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.styles.table import TableStyle, TableStyleElement
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import fromstring, tostring
+
+from beautifulexcel.profiling import warn
+from beautifulexcel.utils import deepen_dict
+
+
+def style_key(style: dict):
+    """Hashable canonical form of a flattened style dict e.g. {'font__bold': True} -> (('font__bold', True),)"""
+
+    def _hashable(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(_hashable(v) for v in value)
+        return value
+
+    return tuple(sorted((k, _hashable(v)) for k, v in style.items()))
+
+
+def build_style_objects(style: dict):
+    """Turn a flattened style dict into a list of (cell attribute, openpyxl style object) tuples"""
+    style_objects = []
+    for style_type, kwargs in deepen_dict(style).items():
+        style_type_lower = style_type.lower()
+        if style_type_lower == "font":
+            style_objects.append(("font", openpyxl.styles.Font(**kwargs)))
+        elif style_type_lower == "numfmt" or style_type_lower == "numberformat":
+            style_objects.append(("number_format", kwargs))
+        elif style_type_lower == "align" or style_type_lower == "alignment":
+            style_objects.append(("alignment", openpyxl.styles.Alignment(**kwargs)))
+        elif style_type_lower == "fill" or style_type_lower == "pfill" or style_type_lower == "patternfill":
+            if not isinstance(kwargs, dict):
+                kwargs = {"patternType": "solid", "fgColor": kwargs}
+            style_objects.append(("fill", openpyxl.styles.PatternFill(**kwargs)))
+        elif style_type_lower == "gfill" or style_type_lower == "gradientfill":
+            style_objects.append(("fill", openpyxl.styles.GradientFill(**kwargs)))
+        elif style_type_lower == "border" or style_type_lower == "borders":
+            border_kwargs = {}
+            for border_type, border_props in kwargs.items():
+                border_kwargs[border_type] = openpyxl.styles.Side(**border_props)
+            style_objects.append(("border", openpyxl.styles.Border(**border_kwargs)))
+        elif style_type_lower == "protection":
+            style_objects.append(("protection", openpyxl.styles.Protection(**kwargs)))
+        else:
+            raise Exception(
+                f'Unknown style type "{style_type}". Available style types are: font, numberformat, align, fill, patternfill, gradientfill, borders, and protection.'
+            )
+    return style_objects
+
+
+class StyleBundle:
+    """Reusable set of openpyxl style objects for one distinct flattened style dict"""
+
+    __slots__ = ("key", "style", "style_objects")
+
+    def __init__(self, key, style, style_objects):
+        self.key = key
+        self.style = style
+        self.style_objects = style_objects
+
+
+class StyleCache:
+    """
+    Per-workbook cache that builds the openpyxl style objects for each distinct style dict exactly once
+
+    The style bundles can also be taken from and added to a dict shared_bundles that is shared between workbooks (e.g.
+    theme.Theme.bundles) up to max_shared_bundles entries
+
+    Example:
+        >>> cache = StyleCache()
+        >>> bundle = cache.get({'font__bold': True, 'fill': 'FFEEB7'})
+        >>> cache.apply(ws['A1'], bundle)
+        >>> cache.stats()
+        {'hits': 0, 'misses': 1, 'styles': 1, 'cells': 1}
+    """
+
+    def __init__(self, shared_bundles: dict = None, max_shared_bundles: int = 4096):
+        self.shared_bundles = shared_bundles
+        self.max_shared_bundles = max_shared_bundles
+        self.bundles = {}
+        self.style_arrays = {}
+        self.style_ids = {}
+        self.hits = 0
+        self.misses = 0
+        self.cells = 0
+
+    def get(self, style: dict) -> StyleBundle:
+        """Get the style bundle for a flattened style dict - only builds new openpyxl objects on the first call"""
+        key = style_key(style)
+        bundle = self.bundles.get(key)
+        if bundle is None:
+            self.misses += 1
+            shared_bundles = self.shared_bundles
+            bundle = shared_bundles.get(key) if shared_bundles is not None else None
+            if bundle is None:
+                bundle = StyleBundle(key, style, build_style_objects(style))
+                if shared_bundles is not None and len(shared_bundles) < self.max_shared_bundles:
+                    shared_bundles[key] = bundle
+            self.bundles[key] = bundle
+        else:
+            self.hits += 1
+        return bundle
+
+    def apply(self, cell, bundle: StyleBundle):
+        """Assign a style bundle to an openpyxl cell"""
+        self.cells += 1
+        # openpyxl stores the cell style as an array of ids into the workbook style tables - so the same bundle applied
+        # on top of the same previous cell style always results in the same array, which can simply be copied over
+        array_key = (bundle.key, tuple(cell._style) if cell._style is not None else None)
+        style_array = self.style_arrays.get(array_key)
+        if style_array is None:
+            for attr, style_object in bundle.style_objects:
+                setattr(cell, attr, style_object)
+            self.style_arrays[array_key] = copy(cell._style)
+        else:
+            cell._style = copy(style_array)
+        return cell
+
+    def get_style_id(self, ws, bundle: StyleBundle, number_format=None) -> int:
+        """Workbook style id of a style bundle applied to a cell with the given number format - for cells serialized without openpyxl cells"""
+        key = (bundle.key, number_format)
+        style_id = self.style_ids.get(key)
+        if style_id is None:
+            cell = openpyxl.cell.Cell(ws)
+            if number_format:
+                cell.number_format = number_format
+            for attr, style_object in bundle.style_objects:
+                setattr(cell, attr, style_object)
+            style_id = self.style_ids[key] = cell.style_id
+        return style_id
+
+    def stats(self) -> dict:
+        """Cache hit/miss counts and number of styled cells"""
+        return {"hits": self.hits, "misses": self.misses, "styles": len(self.bundles), "cells": self.cells}
+
+
+class DefaultStyles:
+    """
+    Column and row default styles of a table body planned by plan_default_styles()
+
+    Attributes:
+        cols (dict): {col_num: StyleBundle} default styles of the columns
+        rows (list): [(band_start_row, band_end_row, StyleBundle), ...] default styles of the rows
+        bands (list): [(band_start_row, band_end_row), ...] row bands of the table body
+        omit (np.ndarray): bool array (row band x body column) that is True if an empty body cell of the band and column
+            has the default style of its row (or column if the row has none) and does not need to be written
+    """
+
+    __slots__ = ("cols", "rows", "bands", "omit")
+
+    def __init__(self, cols, rows, bands, omit):
+        self.cols = cols
+        self.rows = rows
+        self.bands = bands
+        self.omit = omit
+
+    def iter_row_omissions(self):
+        """Yield the omit list (per body column) of each row of the table body"""
+        for (band_start, band_end), band_omit in zip(self.bands, self.omit.tolist()):
+            for _ in range(band_start, band_end):
+                yield band_omit
+
+
+def plan_default_styles(
+    bands, first_col, index_depth, empty_cols, empty_bands, cols=None, row_styles=True
+) -> DefaultStyles:
+    """
+    Plan which styles of a table body are set once as column/row default style instead of on every empty cell - Excel
+    shows the row style (if set) or else the column style for cells that are not in the worksheet
+
+    A column with empty cells gets the style of most of its body cells as default style. A row band with empty cells
+    gets the style of its body cells as default style if they all share one style that is not already the default
+    style of all columns.
+
+    Args:
+        bands (list): [(band_start_row, band_end_row, [StyleBundle per index and body column]), ...]
+        first_col (int): Column number of the first index (or body) column
+        index_depth (int): Number of index columns - only body cells are omitted
+        empty_cols (list of bool): If the body columns have empty cells
+        empty_bands (list of bool): If the row bands have empty body cells
+        cols (dict): Already set column default styles {col_num: StyleBundle} (e.g. of the first chunk) - no new column default styles are planned
+        row_styles (bool): Plan row default styles (not possible if the rows are streamed)
+
+    Returns:
+        DefaultStyles
+    """
+    n_cols = len(bands[0][2]) if bands else 0
+    if cols is None:
+        cols = {}
+        for i in range(index_depth, n_cols):
+            if empty_cols[i - index_depth]:
+                # the style of the most rows
+                row_counts = {}
+                for band_start, band_end, row_bundles in bands:
+                    bundle = row_bundles[i]
+                    row_counts[bundle.key] = (
+                        row_counts.get(bundle.key, (0, bundle))[0] + band_end - band_start,
+                        bundle,
+                    )
+                cols[first_col + i] = max(row_counts.values(), key=lambda count: count[0])[1]
+
+    rows = []
+    omit = np.zeros((len(bands), n_cols - index_depth), dtype=bool)
+    for band, ((band_start, band_end, row_bundles), is_empty) in enumerate(zip(bands, empty_bands)):
+        row_bundle = None
+        if row_styles and is_empty and n_cols > index_depth:
+            key = row_bundles[index_depth].key
+            if all(bundle.key == key for bundle in row_bundles[index_depth:]) and any(
+                first_col + i not in cols or cols[first_col + i].key != key for i in range(index_depth, n_cols)
+            ):
+                row_bundle = row_bundles[index_depth]
+                rows.append((band_start, band_end, row_bundle))
+        for i in range(index_depth, n_cols):
+            default = row_bundle if row_bundle is not None else cols.get(first_col + i)
+            omit[band, i - index_depth] = default is not None and default.key == row_bundles[i].key
+    return DefaultStyles(cols, rows, [(band_start, band_end) for band_start, band_end, _ in bands], omit)
+
+
+def get_style_tables(book) -> dict:
+    """Picklable copy of the cell style tables of an openpyxl workbook - can be added to another workbook with merge_style_tables()"""
+    return {
+        "fonts": list(book._fonts),
+        "fills": list(book._fills),
+        "borders": list(book._borders),
+        "alignments": list(book._alignments),
+        "protections": list(book._protections),
+        "number_formats": list(book._number_formats),
+        "cell_styles": [tuple(style_array) for style_array in book._cell_styles],
+    }
+
+
+def merge_style_tables(book, style_tables: dict) -> dict:
+    """
+    Add the cell styles of get_style_tables() of another workbook to an openpyxl workbook - existing styles are reused and
+    new ones appended. Returns {style id in the other workbook: style id in this workbook}
+    """
+    style_ids = {}
+    for style_id, style_values in enumerate(style_tables["cell_styles"]):
+        style_array = StyleArray(style_values)
+        style_array.fontId = book._fonts.add(style_tables["fonts"][style_array.fontId])
+        style_array.fillId = book._fills.add(style_tables["fills"][style_array.fillId])
+        style_array.borderId = book._borders.add(style_tables["borders"][style_array.borderId])
+        style_array.alignmentId = book._alignments.add(style_tables["alignments"][style_array.alignmentId])
+        style_array.protectionId = book._protections.add(style_tables["protections"][style_array.protectionId])
+        if style_array.numFmtId >= BUILTIN_FORMATS_MAX_SIZE:
+            number_format = style_tables["number_formats"][style_array.numFmtId - BUILTIN_FORMATS_MAX_SIZE]
+            style_array.numFmtId = book._number_formats.add(number_format) + BUILTIN_FORMATS_MAX_SIZE
+        style_ids[style_id] = book._cell_styles.add(style_array)
+    return style_ids
+
+
+# style tables of the styles.xml part: (collection element, workbook table, item element)
+STYLESHEET_TABLES = [
+    ("numFmts", "_number_formats", "numFmt"),
+    ("fonts", "_fonts", "font"),
+    ("fills", "_fills", "fill"),
+    ("borders", "_borders", "border"),
+    ("cellXfs", "_cell_styles", "xf"),
+]
+
+
+def _indexed_list(values) -> IndexedList:
+    """IndexedList that keeps duplicates at their position - the same value is found at its first position"""
+    indexed = IndexedList()
+    for value in values:
+        list.append(indexed, value)
+        indexed._dict.setdefault(value, len(indexed) - 1)
+    return indexed
+
+
+def seed_style_tables(book, styles_xml: bytes) -> dict:
+    """
+    Replace the cell style tables of an empty openpyxl workbook with the ones of the styles.xml part of an existing
+    file, so that the cell style ids of the workbook are the same as in the existing file and new styles are appended
+    after the existing ones. Returns the sizes of the seeded tables for append_style_tables()
+    """
+    stylesheet = Stylesheet.from_tree(fromstring(styles_xml))
+    book._fonts = _indexed_list(stylesheet.fonts)
+    book._fills = _indexed_list(stylesheet.fills)
+    book._borders = _indexed_list(stylesheet.borders)
+
+    # custom number formats keep their ids - unused ids in between get placeholders no cell style refers to
+    number_formats = {number_format.numFmtId: number_format.formatCode for number_format in stylesheet.numFmts.numFmt}
+    max_id = max(number_formats, default=BUILTIN_FORMATS_MAX_SIZE - 1)
+    book._number_formats = _indexed_list(
+        number_formats.get(numFmtId, f"\x00unused_{numFmtId}")
+        for numFmtId in range(BUILTIN_FORMATS_MAX_SIZE, max_id + 1)
+    )
+
+    style_arrays = []
+    for xf in stylesheet.cellXfs.xf:
+        style_array = xf.to_array()
+        if xf.alignment is not None:
+            style_array.alignmentId = book._alignments.add(xf.alignment)
+        if xf.protection is not None:
+            style_array.protectionId = book._protections.add(xf.protection)
+        style_arrays.append(style_array)
+    book._cell_styles = _indexed_list(style_arrays)
+    return {table: len(getattr(book, table)) for _, table, _ in STYLESHEET_TABLES}
+
+
+def _style_table_items(book, table: str, start: int) -> list:
+    """Serialized xml elements of the workbook style table entries from position start on"""
+    values = getattr(book, table)[start:]
+    if table == "_number_formats":
+        return [
+            tostring(NumberFormat(numFmtId=idx + BUILTIN_FORMATS_MAX_SIZE, formatCode=value).to_tree(tagname="numFmt"))
+            for idx, value in enumerate(values, start)
+        ]
+    if table == "_cell_styles":
+        items = []
+        for style_array in values:
+            xf = CellStyle.from_array(style_array)
+            if style_array.alignmentId:
+                xf.alignment = book._alignments[style_array.alignmentId]
+            if style_array.protectionId:
+                xf.protection = book._protections[style_array.protectionId]
+            items.append(tostring(xf.to_tree(tagname="xf")))
+        return items
+    return [tostring(value.to_tree()) for value in values]
+
+
+def append_style_tables(styles_xml: bytes, book, table_sizes: dict) -> bytes:
+    """
+    Add the styles that were added to a workbook after seed_style_tables() to the original styles.xml part - the
+    existing content of the part is kept byte for byte
+    """
+    root = re.match(rb"(?:<\?xml[^>]*\?>\s*)?(?:<!--.*?-->\s*)*<(\w+:)?styleSheet\b[^>]*>", styles_xml, re.S)
+    if root is None:
+        raise Exception("The styles.xml part has no <styleSheet> element.")
+    prefix = root[1] or b""
+    # elements of a prefixed part need the main namespace as default namespace
+    namespace = b' xmlns="' + SHEET_MAIN_NS.encode() + b'"' if prefix else b""
+
+    for collection, table, item in STYLESHEET_TABLES:
+        items = _style_table_items(book, table, table_sizes[table])
+        if not items:
+            continue
+        if namespace:
+            items = [re.sub(rb"^<" + item.encode() + rb"\b", b"<" + item.encode() + namespace, xml) for xml in items]
+        tag = prefix + collection.encode()
+        start = re.search(rb"<" + tag + rb"\b([^>]*?)(/?)>", styles_xml)
+        if start is None:
+            # only <numFmts> is optional and comes first
+            new = b"<" + tag + b' count="' + str(len(items)).encode() + b'">' + b"".join(items) + b"</" + tag + b">"
+            styles_xml = styles_xml[: root.end()] + new + styles_xml[root.end() :]
+            continue
+        attrs = re.sub(rb'\bcount="(\d*)"', lambda match: b'count="%d"' % (int(match[1] or 0) + len(items)), start[1])
+        if start[2]:
+            new = b"<" + tag + attrs + b">" + b"".join(items) + b"</" + tag + b">"
+            styles_xml = styles_xml[: start.start()] + new + styles_xml[start.end() :]
+        else:
+            end = styles_xml.index(b"</" + tag + b">", start.end())
+            styles_xml = (
+                styles_xml[: start.start()]
+                + b"<"
+                + tag
+                + attrs
+                + b">"
+                + styles_xml[start.end() : end]
+                + b"".join(items)
+                + styles_xml[end:]
+            )
+    return styles_xml
+
+
+XLSXWRITER_FONT_PROPS = {
+    "name": "font_name",
+    "size": "font_size",
+    "sz": "font_size",
+    "bold": "bold",
+    "b": "bold",
+    "italic": "italic",
+    "i": "italic",
+    "strike": "font_strikeout",
+    "strikethrough": "font_strikeout",
+    "color": "font_color",
+    "scheme": "font_scheme",
+    "family": "font_family",
+    "charset": "font_charset",
+    "outline": "font_outline",
+    "shadow": "font_shadow",
+    "condense": "font_condense",
+    "extend": "font_extend",
+}
+XLSXWRITER_UNDERLINES = {"single": 1, "double": 2, "singleAccounting": 33, "doubleAccounting": 34}
+XLSXWRITER_SCRIPTS = {"superscript": 1, "subscript": 2}
+XLSXWRITER_H_ALIGNS = {"centerContinuous": "center_across"}
+XLSXWRITER_V_ALIGNS = {"center": "vcenter", "justify": "vjustify", "distributed": "vdistributed"}
+XLSXWRITER_ALIGNMENT_PROPS = {
+    "textRotation": "rotation",
+    "text_rotation": "rotation",
+    "wrapText": "text_wrap",
+    "wrap_text": "text_wrap",
+    "shrinkToFit": "shrink",
+    "shrink_to_fit": "shrink",
+    "indent": "indent",
+    "readingOrder": "reading_order",
+    "reading_order": "reading_order",
+}
+# position in the list is the xlsxwriter pattern/border index
+XLSXWRITER_PATTERNS = [
+    "none",
+    "solid",
+    "mediumGray",
+    "darkGray",
+    "lightGray",
+    "darkHorizontal",
+    "darkVertical",
+    "darkDown",
+    "darkUp",
+    "darkGrid",
+    "darkTrellis",
+    "lightHorizontal",
+    "lightVertical",
+    "lightDown",
+    "lightUp",
+    "lightGrid",
+    "lightTrellis",
+    "gray125",
+    "gray0625",
+]
+XLSXWRITER_BORDERS = [
+    None,
+    "thin",
+    "medium",
+    "dashed",
+    "dotted",
+    "thick",
+    "double",
+    "hair",
+    "mediumDashed",
+    "dashDot",
+    "mediumDashDot",
+    "dashDotDot",
+    "mediumDashDotDot",
+    "slantDashDot",
+]
+
+
+def build_table_style(book, name: str, element_styles: dict) -> str:
+    """
+    Add a custom table style to an openpyxl workbook (once) - e.g. the theme table styles for to_excel(as_table=True)
+
+    Table styles only support fonts, fills, and borders - all other style types (e.g. alignment and number formats) are
+    ignored. The borders of the sides are also used for the inner horizontal/vertical lines of the table area.
+
+    Args:
+        book (openpyxl.Workbook): Workbook
+        name (str): Table style name
+        element_styles (dict): Flattened style dict per table style element e.g. {'wholeTable': {...}, 'headerRow': {...}, 'firstColumn': {...}}
+
+    Returns:
+        str: Table style name
+    """
+    if any(table_style.name == name for table_style in book._table_styles.tableStyle):
+        return name
+    elements = []
+    for element_type, style in element_styles.items():
+        dxf_kwargs = {}
+        for attr, style_object in build_style_objects(style):
+            if (
+                attr == "fill"
+                and isinstance(style_object, openpyxl.styles.PatternFill)
+                and style_object.patternType == "solid"
+            ):
+                # solid fills of differential styles use the background color
+                style_object = openpyxl.styles.PatternFill(
+                    patternType="solid", fgColor=style_object.fgColor, bgColor=style_object.fgColor
+                )
+            elif attr == "border":
+                style_object = copy(style_object)
+                style_object.horizontal = style_object.top if style_object.top.style else style_object.bottom
+                style_object.vertical = style_object.left if style_object.left.style else style_object.right
+            elif attr not in ["font", "fill"]:
+                continue
+            dxf_kwargs[attr] = style_object
+        if dxf_kwargs:
+            dxf_id = book._differential_styles.add(DifferentialStyle(**dxf_kwargs))
+            elements.append(TableStyleElement(type=element_type, dxfId=dxf_id))
+    book._table_styles.tableStyle.append(
+        TableStyle(name=name, pivot=False, count=len(elements), tableStyleElement=elements)
+    )
+    return name
+
+
+def _xlsxwriter_color(color):
+    """openpyxl RGB or ARGB color e.g. 'FFEEB7' or 'FFFFEEB7' to xlsxwriter color '#FFEEB7'"""
+    if isinstance(color, dict):
+        color = color.get("rgb")
+    if not isinstance(color, str):
+        return None
+    return "#" + color[-6:]
+
+
+def build_xlsxwriter_format(style: dict):
+    """Translate a flattened (openpyxl-style) style dict into xlsxwriter Format properties"""
+    props = {}
+    for style_type, kwargs in deepen_dict(style).items():
+        style_type_lower = style_type.lower()
+        if style_type_lower == "font":
+            for key, value in kwargs.items():
+                if key in ["underline", "u"]:
+                    props["underline"] = XLSXWRITER_UNDERLINES.get(value, 1) if value else 0
+                elif key == "vertAlign":
+                    props["font_script"] = XLSXWRITER_SCRIPTS.get(value, 0)
+                elif key == "color":
+                    props["font_color"] = _xlsxwriter_color(value)
+                elif key in XLSXWRITER_FONT_PROPS:
+                    props[XLSXWRITER_FONT_PROPS[key]] = value
+        elif style_type_lower == "numfmt" or style_type_lower == "numberformat":
+            props["num_format"] = kwargs
+        elif style_type_lower == "align" or style_type_lower == "alignment":
+            for key, value in kwargs.items():
+                if key == "horizontal" and value is not None and value != "general":
+                    props["align"] = XLSXWRITER_H_ALIGNS.get(value, value)
+                elif key == "vertical" and value is not None:
+                    props["valign"] = XLSXWRITER_V_ALIGNS.get(value, value)
+                elif key in XLSXWRITER_ALIGNMENT_PROPS:
+                    props[XLSXWRITER_ALIGNMENT_PROPS[key]] = value
+        elif style_type_lower == "fill" or style_type_lower == "pfill" or style_type_lower == "patternfill":
+            if not isinstance(kwargs, dict):
+                kwargs = {"patternType": "solid", "fgColor": kwargs}
+            pattern = kwargs.get("patternType", kwargs.get("fill_type"))
+            if pattern in XLSXWRITER_PATTERNS:
+                props["pattern"] = XLSXWRITER_PATTERNS.index(pattern)
+            fg_color = _xlsxwriter_color(kwargs.get("fgColor", kwargs.get("start_color")))
+            if fg_color is not None:
+                props["fg_color"] = fg_color
+            bg_color = _xlsxwriter_color(kwargs.get("bgColor", kwargs.get("end_color")))
+            if bg_color is not None:
+                props["bg_color"] = bg_color
+        elif style_type_lower == "gfill" or style_type_lower == "gradientfill":
+            warn("Gradient fills are not supported by xlsxwriter and are ignored.")
+        elif style_type_lower == "border" or style_type_lower == "borders":
+            for side in ["left", "right", "top", "bottom"]:
+                side_props = kwargs.get(side)
+                if isinstance(side_props, dict):
+                    if side_props.get("style") in XLSXWRITER_BORDERS:
+                        props[side] = XLSXWRITER_BORDERS.index(side_props.get("style"))
+                    if _xlsxwriter_color(side_props.get("color")) is not None:
+                        props[f"{side}_color"] = _xlsxwriter_color(side_props.get("color"))
+        elif style_type_lower == "protection":
+            props.update({key: value for key, value in kwargs.items() if key in ["locked", "hidden"]})
+        else:
+            raise Exception(
+                f'Unknown style type "{style_type}". Available style types are: font, numberformat, align, fill, patternfill, gradientfill, borders, and protection.'
+            )
+    return props
+
+
+class XlsxWriterFormatCache:
+    """Per-workbook cache of xlsxwriter Formats - every distinct style bundle and number format is only added once"""
+
+    def __init__(self, book):
+        self.book = book
+        self.formats = {}
+
+    def get(self, bundle: StyleBundle, number_format=None):
+        """Get the xlsxwriter Format of a style bundle - number_format is the default that the style can overwrite"""
+        key = (bundle.key, number_format)
+        cell_format = self.formats.get(key)
+        if cell_format is None:
+            props = build_xlsxwriter_format(bundle.style)
+            if number_format is not None:
+                props = {"num_format": number_format, **props}
+            cell_format = self.formats[key] = self.book.add_format(props)
+        return cell_format
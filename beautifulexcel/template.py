@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import pickle
+import tempfile
+import threading
+from copy import copy
+from functools import partial
+from itertools import chain
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import openpyxl
+from openpyxl.worksheet.cell_range import CellRange
+
+from beautifulexcel.package import insert_sheet_data
+from beautifulexcel.sheet_xml import SharedStrings, cells_xml, encode_column
+from beautifulexcel.writer import SHEET_DATA_MEMORY_SIZE, ExcelWriter, _OutputStream, _save_workbook
+
+# version of the pickled skeleton - cache files of other versions have to be rebuilt
+TEMPLATE_FORMAT_VERSION = 1
+
+
+class ExcelTemplate:
+    """
+    Pre-rendered workbook skeleton for reports that are generated many times with the same layout e.g. one workbook per
+    client - the styled workbook (theme, header styles, data validations, groupings, column widths, ...) is built once
+    with ExcelWriter and every .render() only writes the data rows of the dataframes into a copy of it
+
+    The body cells of each column get the cell style of the first row of the sample dataframe (with the number format of
+    the values if it has none) - styles of single body rows, merges, and row groups within the data rows are not part of
+    the skeleton. The Excel tables, data validations, and autofilters of the tables are extended to the rendered rows.
+
+    Example:
+        ```python
+        from beautifulexcel import ExcelTemplate
+
+        def build(writer):
+            ws = writer.to_excel(sample_df, sheet_name='Report', index=True, style={'RoE': 'bg_light_blue'})
+            ws.add_data_validation(ref='employees', type='whole')
+            ws.group_columns('revenue:B')
+
+        template = ExcelTemplate(build, cache='report_template.pkl', theme='elegant_blue')
+        for client, df in client_dfs.items():
+            template.render(f'{client}.xlsx', {'Report': df})
+        ```
+    """
+
+    def __init__(self, build: Callable = None, cache: str = None, **kwargs):
+        """
+        Args:
+            build (Callable): Function build(writer) that writes the skeleton with an ExcelWriter - every sheet written with writer.to_excel(sample_df, ...) becomes a data region that .render() fills with the rows of a dataframe with the same columns
+            cache (str): Path of the skeleton file - if it exists the skeleton is loaded from it instead of calling build, else the built skeleton is saved to it. Delete the file after changing build (only load trusted files, the skeleton is pickled)
+            kwargs (dict): Further ExcelWriter() arguments for building the skeleton e.g. theme='elegant_blue', date_format='YYYY-MM-DD'
+        """
+        if cache is not None and os.path.isfile(cache):
+            with open(cache, "rb") as file:
+                state = pickle.load(file)
+        elif build is None:
+            raise Exception(
+                "ExcelTemplate() needs a build(writer) function that writes the skeleton or the path of an existing cache file."
+            )
+        else:
+            state = _build_skeleton(build, kwargs)
+            if cache is not None:
+                with open(cache, "wb") as file:
+                    pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__setstate__(state)
+
+    def __getstate__(self):
+        # the skeleton package and regions - templates can be pickled e.g. for process pools
+        return self._state
+
+    def __setstate__(self, state):
+        if state.get("version") != TEMPLATE_FORMAT_VERSION:
+            raise Exception(
+                "The ExcelTemplate skeleton was saved by another beautifulexcel version. Please delete the cache file to rebuild it."
+            )
+        self._state = state
+        self.regions = state["regions"]
+        self.book = openpyxl.load_workbook(io.BytesIO(state["package"]))
+        self._value_with_fmt = pd.ExcelWriter(
+            io.BytesIO(), engine="openpyxl", date_format=state["date_format"], datetime_format=state["datetime_format"]
+        )._value_with_fmt
+        self._lock = threading.Lock()
+        self._last_rows = {}
+        self._template_styles = {}
+        self._style_ids = {}
+
+        # the template row (first sample row) only provides the body cell styles of the columns
+        for sheet_name, region in self.regions.items():
+            ws = self.book[sheet_name]
+            row_num, first_col = region["body_start"], region["startcol"] + 1
+            styles = []
+            for col_num in range(first_col, first_col + region["index_depth"] + len(region["columns"])):
+                cell = ws._cells.pop((row_num, col_num), None)
+                styles.append(cell._style if cell is not None and cell.has_style else None)
+            self._template_styles[sheet_name] = styles
+            self._last_rows[sheet_name] = row_num
+
+    def render(self, file: Any, dfs: dict):
+        """
+        Write a new workbook with the rows of the dataframes filled into the data regions of the skeleton - all other
+        parts of the skeleton are written unchanged
+
+        Args:
+            file (str or file object): Path to the new xlsx file or a writable binary file object e.g. io.BytesIO()
+            dfs (dict): Dataframes {sheet_name: df} with the same columns (and index levels) as the sample dataframes of the skeleton - data regions without dataframe stay empty
+
+        Example:
+            ```python
+            template.render('client_a.xlsx', {'Report': df_client_a})
+            ```
+        """
+        for sheet_name, df in dfs.items():
+            self._check_df(sheet_name, df)
+
+        # the skeleton workbook is shared by all renders
+        with self._lock:
+            rendered_sheets, sheet_data_files, shared_strings = {}, [], SharedStrings()
+            try:
+                for sheet_name, region in self.regions.items():
+                    df = dfs.get(sheet_name, None)
+                    n_rows = 0 if df is None else len(df)
+                    ws = self.book[sheet_name]
+                    last_row = region["body_start"] + max(n_rows, 1) - 1
+                    _move_table_end(ws, region, self._last_rows[sheet_name], last_row)
+                    self._last_rows[sheet_name] = last_row
+
+                    # the rows of small sheets stay in memory, larger sheets are buffered in a temporary file
+                    sheet_data = tempfile.SpooledTemporaryFile(max_size=SHEET_DATA_MEMORY_SIZE)
+                    sheet_data_files.append(sheet_data)
+                    part = partial(
+                        insert_sheet_data, sheet_data=sheet_data, dimension=_get_dimension(ws, region, n_rows)
+                    )
+                    if n_rows > 0:
+                        self._write_rows(sheet_name, df, sheet_data, shared_strings)
+                    rendered_sheets[sheet_name] = (ws, part, sheet_data.tell())
+
+                if isinstance(file, (str, os.PathLike)):
+                    with open(file, "wb") as dst:
+                        _save_workbook(self.book, dst, rendered_sheets, shared_strings)
+                else:
+                    _save_workbook(
+                        self.book,
+                        file if callable(getattr(file, "flush", None)) else _OutputStream(file),
+                        rendered_sheets,
+                        shared_strings,
+                    )
+            finally:
+                for sheet_data in sheet_data_files:
+                    sheet_data.close()
+
+    def _check_df(self, sheet_name, df):
+        """Raise an error if the dataframe does not fit the data region of the sheet"""
+        region = self.regions.get(sheet_name)
+        if region is None:
+            raise Exception(
+                f'The template has no data region "{sheet_name}". The data regions are the sheets written with .to_excel() in build: {list(self.regions)}'
+            )
+        if list(df.columns) != region["columns"]:
+            raise Exception(
+                f'The dataframe for the sheet "{sheet_name}" needs the columns {region["columns"]} of the sample dataframe of the template.'
+            )
+        if region["index_depth"] > 0 and df.index.nlevels != region["index_depth"]:
+            raise Exception(
+                f'The dataframe for the sheet "{sheet_name}" needs {region["index_depth"]} index level(s) like the sample dataframe of the template.'
+            )
+
+    def _get_style_id(self, ws, sheet_name, col_idx, number_format):
+        """Cell style id of a column for values with a number format - the template style with the number format if it has none"""
+        key = (sheet_name, col_idx, number_format)
+        style_id = self._style_ids.get(key)
+        if style_id is None:
+            style = self._template_styles[sheet_name][col_idx]
+            if number_format and (style is None or style.numFmtId == 0):
+                cell = openpyxl.cell.Cell(ws, style_array=copy(style))
+                cell.number_format = number_format
+                style = cell._style
+            style_id = self._style_ids[key] = 0 if style is None else self.book._cell_styles.add(style)
+        return style_id
+
+    def _write_rows(self, sheet_name, df, dst, shared_strings, chunk_size=10_000):
+        """Write the dataframe rows as worksheet xml <row> elements into dst - empty cells without template style are left out and repeated texts reference the SharedStrings table shared_strings"""
+        region = self.regions[sheet_name]
+        ws = self.book[sheet_name]
+        value_with_fmt = self._value_with_fmt
+        index_depth = region["index_depth"]
+        first_col = region["startcol"] + 1
+        col_letters = [
+            openpyxl.utils.get_column_letter(col_num)
+            for col_num in range(first_col, first_col + index_depth + df.shape[1])
+        ]
+        for chunk_start in range(0, len(df), chunk_size):
+            chunk = df.iloc[chunk_start : chunk_start + chunk_size]
+            row_strs = np.arange(
+                region["body_start"] + chunk_start, region["body_start"] + chunk_start + len(chunk)
+            ).astype(str)
+            columns = [chunk.index.get_level_values(level) for level in range(index_depth)]
+            columns += [chunk.iloc[:, i] for i in range(chunk.shape[1])]
+            cols_xml = []
+            for col_idx, (col_letter, values) in enumerate(zip(col_letters, columns)):
+                contents, codes, content_formats, number_formats = encode_column(
+                    values, ws, value_with_fmt, shared_strings
+                )
+                style_ids = np.array(
+                    [self._get_style_id(ws, sheet_name, col_idx, number_format) for number_format in number_formats]
+                )
+                cell_style_ids = style_ids[content_formats[codes]]
+                col_xml = cells_xml(col_letter, row_strs, cell_style_ids, contents[codes])
+                col_xml[(codes == -1) & (cell_style_ids == 0)] = ""
+                cols_xml.append(col_xml.tolist())
+            rows_xml = ['<row r="' + row_str + '">' for row_str in row_strs.tolist()]
+            dst.write(
+                "".join(chain.from_iterable(zip(rows_xml, *cols_xml, ["</row>"] * len(rows_xml)))).encode("utf-8")
+            )
+
+
+def _build_skeleton(build, writer_kwargs):
+    """Build the skeleton workbook with an ExcelWriter - returns the state of ExcelTemplate with the xlsx package and the data regions"""
+    for option, value in [("engine", "openpyxl"), ("streaming", False), ("mode", "replace")]:
+        if writer_kwargs.get(option, value) != value:
+            raise Exception(
+                'ExcelTemplate() builds the skeleton with ExcelWriter(engine="openpyxl", streaming=False, mode="replace") - the engine, streaming, and mode cannot be changed.'
+            )
+
+    output = io.BytesIO()
+    excelwriter = ExcelWriter(output, **writer_kwargs)
+    build(excelwriter)
+
+    sheet_names = [df_sheet.sheet_name for df_sheet in excelwriter.dataframe_sheets]
+    for sheet_name in sheet_names:
+        if sheet_names.count(sheet_name) > 1:
+            raise Exception(
+                f'The sheet "{sheet_name}" was written by several .to_excel() calls. An ExcelTemplate can only fill one table per sheet.'
+            )
+
+    regions = {}
+    for df_sheet in excelwriter.dataframe_sheets:
+        sheet_name = df_sheet.sheet_name
+        if df_sheet.table_height == 0:
+            raise Exception(
+                f'The sample dataframe of the sheet "{sheet_name}" has no rows. ExcelTemplate takes the body cell styles from its first row.'
+            )
+        region = dict(
+            startcol=df_sheet.startcol,
+            body_start=df_sheet.shape_body[0][0],
+            index_depth=df_sheet.index_depth,
+            columns=list(df_sheet.header),
+        )
+        last_row = df_sheet.shape[1][0] - 1
+        _strip_data_rows(df_sheet.ws, region, last_row)
+        _move_table_end(df_sheet.ws, region, last_row, region["body_start"])
+        regions[sheet_name] = region
+    excelwriter.save()
+
+    return dict(
+        version=TEMPLATE_FORMAT_VERSION,
+        package=output.getvalue(),
+        regions=regions,
+        date_format=excelwriter.date_format,
+        datetime_format=excelwriter.datetime_format,
+    )
+
+
+def _region_cols(region):
+    """First and last column number of a data region"""
+    first_col = region["startcol"] + 1
+    return first_col, first_col + region["index_depth"] + len(region["columns"]) - 1
+
+
+def _strip_data_rows(ws, region, last_row):
+    """Remove the sample rows (up to last_row) below the template row (first body row) and the merges and row dimensions of the data rows"""
+    body_start = region["body_start"]
+    first_col, last_col = _region_cols(region)
+    for row_num, col_num in list(ws._cells):
+        if row_num < body_start:
+            continue
+        if not first_col <= col_num <= last_col or row_num > last_row:
+            raise Exception(
+                f'The sheet "{ws.title}" has cells next to or below the table (e.g. {ws._cells[row_num, col_num].coordinate}). The rows of an ExcelTemplate data region can only contain the table.'
+            )
+        if row_num > body_start:
+            del ws._cells[row_num, col_num]
+    for cell_range in list(ws.merged_cells.ranges):
+        if cell_range.max_row >= body_start:
+            ws.merged_cells.remove(cell_range)
+    for row_num in [row_num for row_num in ws.row_dimensions if row_num >= body_start]:
+        del ws.row_dimensions[row_num]
+
+
+def _move_table_end(ws, region, last_row, new_last_row):
+    """Move the end of the Excel tables, data validations, and autofilters of the table columns from last_row to new_last_row"""
+    first_col, last_col = _region_cols(region)
+
+    def _is_table_range(cell_range):
+        return (
+            cell_range.max_row == last_row
+            and first_col <= cell_range.min_col
+            and cell_range.max_col <= last_col
+            and cell_range.min_row <= region["body_start"]
+        )
+
+    for table in ws.tables.values():
+        cell_range = CellRange(table.ref)
+        if _is_table_range(cell_range):
+            cell_range.max_row = new_last_row
+            table.ref = cell_range.coord
+            if table.autoFilter is not None:
+                table.autoFilter.ref = cell_range.coord
+    if ws.auto_filter.ref:
+        cell_range = CellRange(ws.auto_filter.ref)
+        if _is_table_range(cell_range):
+            cell_range.max_row = new_last_row
+            ws.auto_filter.ref = cell_range.coord
+    for dv in ws.data_validations.dataValidation:
+        for cell_range in dv.sqref.ranges:
+            if _is_table_range(cell_range):
+                cell_range.max_row = new_last_row
+
+
+def _get_dimension(ws, region, n_rows):
+    """Used area of the rendered worksheet e.g. 'A1:F20'"""
+    first_col, last_col = _region_cols(region)
+    min_row, max_row = region["body_start"], region["body_start"] + n_rows - 1
+    if ws._cells:
+        min_col, ws_min_row, max_col, ws_max_row = openpyxl.utils.range_boundaries(ws.calculate_dimension())
+        if n_rows == 0:
+            min_row, max_row, first_col, last_col = ws_min_row, ws_max_row, min_col, max_col
+        else:
+            min_row, max_row = min(min_row, ws_min_row), max(max_row, ws_max_row)
+            first_col, last_col = min(first_col, min_col), max(last_col, max_col)
+    elif n_rows == 0:
+        return "A1"
+    return (
+        f"{openpyxl.utils.get_column_letter(first_col)}{min_row}:{openpyxl.utils.get_column_letter(last_col)}{max_row}"
+    )
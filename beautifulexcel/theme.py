@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import yaml
+
+from beautifulexcel.styles import StyleBundle, build_style_objects, style_key
+from beautifulexcel.utils import flatten_dict
+
+
+THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes")
+
+# style levels of a theme that are used as cell styles and whose style objects are built when compiling the theme
+STYLE_LEVELS = ["general", "table", "preset"]
+
+# compiled themes by resolved theme path - each with the file modification time it was compiled from
+_theme_cache = {}
+_theme_cache_lock = threading.Lock()
+
+
+class Theme:
+    """
+    Compiled theme: the flattened styles of a theme yaml file and the style bundles shared by all writers of the theme
+
+    Note: The styles are shared between all writers using the same theme and must not be changed
+    """
+
+    __slots__ = ("path", "mtime", "styles", "bundles")
+
+    def __init__(self, path, mtime, styles, bundles):
+        self.path = path
+        self.mtime = mtime
+        self.styles = styles
+        self.bundles = bundles
+
+
+def resolve_theme_path(theme: str) -> str:
+    """Absolute path of a theme yaml file from a theme name of the package (e.g. 'elegant_blue') or a file path"""
+    if "." not in theme:
+        theme = os.path.join(THEMES_DIR, f"{theme}.yml")
+    return os.path.abspath(theme)
+
+
+def compile_theme(path: str, mtime=None) -> Theme:
+    """Read a theme yaml file, flatten its styles after level 2, and build the style objects of all cell styles"""
+    try:
+        with open(path, "r") as file:
+            theme = yaml.safe_load(file)
+    except yaml.YAMLError as exc:
+        raise Exception(f"Error when reading in theme file from path '{path}':", exc)
+
+    styles = {}
+    for level1_name, level1 in theme.items():
+        styles[level1_name] = {level2_name: flatten_dict(level2) for level2_name, level2 in level1.items()}
+
+    bundles = {}
+    for level1_name in STYLE_LEVELS:
+        for style in styles.get(level1_name, {}).values():
+            try:
+                style_objects = build_style_objects(style)
+            except Exception:
+                # invalid styles only raise once they are actually used
+                continue
+            key = style_key(style)
+            bundles[key] = StyleBundle(key, style, style_objects)
+
+    return Theme(path, mtime, styles, bundles)
+
+
+def load_theme(theme: str) -> Theme:
+    """Compiled theme from the process-wide theme cache - the theme file is only read again once it has changed"""
+    path = resolve_theme_path(theme)
+    mtime = os.stat(path).st_mtime_ns
+    compiled = _theme_cache.get(path)
+    if compiled is None or compiled.mtime != mtime:
+        with _theme_cache_lock:
+            compiled = _theme_cache.get(path)
+            if compiled is None or compiled.mtime != mtime:
+                compiled = _theme_cache[path] = compile_theme(path, mtime)
+    return compiled
+
+
+def clear_theme_cache():
+    """Remove all compiled themes e.g. to free the shared style objects"""
+    with _theme_cache_lock:
+        _theme_cache.clear()
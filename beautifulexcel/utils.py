@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+import functools
 import re
-import pandas as pd
+
+# single Excel cell ref like 'B2' or 'XFD1048576' (columns up to XFD, rows up to 9,999,999)
+_EXCEL_CELL_REF = re.compile(r"^([A-Z]{1,2}|[A-W][A-Z]{2}|X[A-E][A-Z]|XF[A-D])([1-9]\d{0,6})$")
 
 
 def dict_extend_with_dict(dict_obj, key, value_dict):
@@ -13,8 +16,17 @@ def dict_extend_with_dict(dict_obj, key, value_dict):
 
 def flatten_dict(dict_obj: dict, sep="__"):
     """Flatten a multi-level dictionary e.g. {'a1': {'b': 1}, 'a2': 3} -> {'a1__b': 1, 'a2': 3}"""
-    df = pd.json_normalize(dict_obj, sep=sep)
-    d_flat = df.to_dict(orient="records")[0]
+    d_flat = {}
+
+    def _flatten(current, prefix):
+        for k, v in current.items():
+            key = str(k) if prefix is None else f"{prefix}{sep}{k}"
+            if isinstance(v, dict):
+                _flatten(v, key)
+            else:
+                d_flat[key] = v
+
+    _flatten(dict_obj, None)
     return {k[2:] if len(k) > 2 and k[:2] == '__' else k: v for k, v in d_flat.items()}
 
 
@@ -35,6 +47,26 @@ def deepen_dict(dict_obj, sep="__"):
     return parsed_row
 
 
+def sample_positions(n_rows: int, sample_size: int = None):
+    """Evenly spaced row positions to estimate column statistics of large tables - None if all rows should be used"""
+    if sample_size is None or n_rows <= sample_size:
+        return None
+    import numpy as np
+
+    return np.linspace(0, n_rows - 1, sample_size).round().astype(int)
+
+
+def nan_quantiles(values, q):
+    """np.nanquantile() of the columns of a 2d array - NaN for columns without values (without warning about them)"""
+    import numpy as np
+
+    quantiles = np.full(np.shape(q) + values.shape[1:], np.nan)
+    has_values = ~np.isnan(values).all(axis=0)
+    if values.shape[0] > 0 and np.any(has_values):
+        quantiles[..., has_values] = np.nanquantile(values[:, has_values], q, axis=0)
+    return quantiles
+
+
 def excel_column_name(n):
     """Number to Excel-style column name, e.g., 1 = A, 26 = Z, 27 = AA, 703 = AAA."""
     name = ""
@@ -54,11 +86,40 @@ def excel_column_number(name):
 
 def is_valid_excel_cell(cell):
     """Check if valid single excel cell ref like 'B2', 'AB100' etc."""
-    m = re.match(r"^([A-Z]{1,2}|[A-W][A-Z]{2}|X[A-E][A-Z]|XF[A-D])([1-9]\d{0,6})$", cell)
+    m = _EXCEL_CELL_REF.match(cell)
     valid = bool(m) and int(m.group(2)) < 1_048_577
     return (valid, (m.group(1) if valid else None), (int(m.group(2)) if valid else None))
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_excel_ref(ref: str):
+    """
+    Memoized (row_num, col_num) of a row number e.g. '2' or '-1', a column letter e.g. 'B', or a cell ref e.g. 'B2' with
+    None for the missing part (1-based like openpyxl) - None if the ref is none of them
+
+    Examples:
+        >>> parse_excel_ref('B2')
+        (2, 2)
+        >>> parse_excel_ref('b')
+        (None, 2)
+        >>> parse_excel_ref('-1')
+        (-1, None)
+    """
+    # check if row number - i.e. all numbers
+    if ref.isdigit() or (len(ref) >= 2 and ref[0] == "-" and ref[1:].isdigit()):
+        return (int(ref), None)
+
+    # check if reasonable column letter - i.e. up to three letters
+    if len(ref) < 4 and ref.isascii() and ref.isalpha():
+        return (None, excel_column_number(ref.upper()))
+
+    # check if valid excel cell ref
+    valid_excel_cell, col_letter, row_num = is_valid_excel_cell(ref)
+    if valid_excel_cell:
+        return (row_num, excel_column_number(col_letter))
+    return None
+
+
 def excel_cell_ref_coordinates(ref, header=None, offset_horizontal=0, offset_vertical=0):
     """Transform references like 'A', 'COLUMN_A', '2', 'C2' to (row_num, col_num)"""
     # if already tuple - nothing to do
@@ -119,6 +180,72 @@ def excel_range_ref_coordinates(ref, header, offset_horizontal=0, offset_vertica
         return ((row_start, col_start), (row_end, col_end))
 
 
+def coalesce_ranges(ranges):
+    """
+    Union cell ranges ((start_row, start_col), (end_row, end_col)) with inclusive ends into a small set of disjoint
+    rectangles that cover exactly the same cells - overlapping and adjacent ranges are merged
+
+    The rows are cut into bands at every range border, the columns covered in a band are merged into runs, and runs with
+    the same columns in consecutive bands are merged into one rectangle
+
+    Example:
+        >>> coalesce_ranges([((1, 1), (1, 1)), ((1, 2), (1, 2)), ((2, 1), (3, 2))])
+        [((1, 1), (3, 2))]
+    """
+    ranges = list(dict.fromkeys(ranges))
+    if len(ranges) < 2:
+        return ranges
+    row_breaks = sorted({row for (start_row, _), (end_row, _) in ranges for row in (start_row, end_row + 1)})
+    band_idx = {row: i for i, row in enumerate(row_breaks)}
+    band_cols = [[] for _ in range(len(row_breaks) - 1)]
+    for (start_row, start_col), (end_row, end_col) in ranges:
+        for band in range(band_idx[start_row], band_idx[end_row + 1]):
+            band_cols[band].append((start_col, end_col))
+
+    coalesced = []
+    open_ranges = {}  # (start_col, end_col) of the runs of the previous band -> start row
+    for band, cols in enumerate(band_cols):
+        runs = []
+        for start_col, end_col in sorted(cols):
+            if runs and start_col <= runs[-1][1] + 1:
+                runs[-1][1] = max(runs[-1][1], end_col)
+            else:
+                runs.append([start_col, end_col])
+        runs = {(start_col, end_col) for start_col, end_col in runs}
+        for run in [run for run in open_ranges if run not in runs]:
+            coalesced.append(((open_ranges.pop(run), run[0]), (row_breaks[band] - 1, run[1])))
+        for run in runs:
+            open_ranges.setdefault(run, row_breaks[band])
+    for run, start_row in open_ranges.items():
+        coalesced.append(((start_row, run[0]), (row_breaks[-1] - 1, run[1])))
+    return sorted(coalesced)
+
+
+def is_bounded_range(cell_range):
+    """Check if a cell range ((start_row, start_col), (end_row, end_col)) has all four borders within the sheet i.e. no entire rows/columns"""
+    return all(isinstance(i, int) and i >= 1 for coordinates in cell_range for i in coordinates)
+
+
+def coalesce_style_ranges(styles_custom):
+    """
+    Union the consecutive cell ranges of {cell_range: style} with the same style with coalesce_ranges() - returns
+    [(cell_range, style), ...] that styles every cell like styles_custom as later ranges still overwrite earlier ones.
+    Entire rows/columns are kept as they are
+    """
+    coalesced, run, run_style = [], [], None
+    for cell_range, style in list(styles_custom.items()) + [(None, None)]:
+        if cell_range is not None and run and style == run_style and is_bounded_range(cell_range):
+            run.append(cell_range)
+            continue
+        coalesced += [(i_range, run_style) for i_range in coalesce_ranges(run)]
+        run, run_style = [], style
+        if cell_range is not None and is_bounded_range(cell_range):
+            run.append(cell_range)
+        elif cell_range is not None:
+            coalesced.append((cell_range, style))
+    return coalesced
+
+
 def cell_within_cell_range(cell_row_num, cell_col_num, cell_range, ignore_entire_rows_or_cols=False):
     """Check if a cell e.g. 'A1' (0, 0) is within a cell range e.g. ((0, 0), (1, 1))"""
     ((range_start_row, range_start_col), (range_end_row, range_end_col)) = cell_range
@@ -163,3 +290,59 @@ def get_custom_styles(cell_row_num, cell_col_num, styles_custom, ignore_entire_r
             cell_style = {**cell_style, **cust_style}
 
     return cell_style
+
+
+def resolve_custom_styles(row_start, row_end, col_start, col_end, styles_custom, ignore_entire_rows_or_cols=False):
+    """
+    Vectorized get_custom_styles() for all cells in the area [row_start, row_end) x [col_start, col_end) - styles_custom
+    is a {cell_range: style} dict or a list of (cell_range, style) pairs e.g. of coalesce_style_ranges()
+
+    The area is cut into row and column bands at every border of a custom style range, so all cells within the same
+    row band and column band share the same custom style. Returns (row_breaks, col_breaks, style_ids, styles) with
+    row_breaks/col_breaks being the first row/column of each band and styles[style_ids[row_band, col_band]] the
+    merged custom style of the band - e.g. row_band = np.searchsorted(row_breaks, row_num, side="right") - 1
+    """
+    import numpy as np
+
+    # clip all custom style ranges to the area - (start, end) with exclusive end
+    ranges = []
+    for cell_range, cust_style in (styles_custom.items() if isinstance(styles_custom, dict) else styles_custom):
+        ((range_start_row, range_start_col), (range_end_row, range_end_col)) = cell_range
+        if ignore_entire_rows_or_cols and any(
+            [range_start_row is None, range_start_col is None, range_end_row is None, range_end_col is None]
+        ):
+            continue
+        range_rows = (
+            row_start if range_start_row is None else max(range_start_row, row_start),
+            row_end if range_end_row is None else min(range_end_row + 1, row_end),
+        )
+        range_cols = (
+            col_start if range_start_col is None else max(range_start_col, col_start),
+            col_end if range_end_col is None else min(range_end_col + 1, col_end),
+        )
+        if range_rows[0] < range_rows[1] and range_cols[0] < range_cols[1]:
+            ranges.append((range_rows, range_cols, cust_style))
+
+    row_breaks = np.unique([row_start] + [i for range_rows, _, _ in ranges for i in range_rows if i < row_end])
+    col_breaks = np.unique([col_start] + [i for _, range_cols, _ in ranges for i in range_cols if i < col_end])
+    if len(ranges) == 0:
+        return row_breaks, col_breaks, np.zeros((len(row_breaks), len(col_breaks)), dtype=int), [{}]
+
+    # the ranges are applied one after the other in the order of styles_custom - the bands covered by a range get new
+    # style ids with its style merged on top (later ranges overwrite earlier ones), so bands covered by the same ranges
+    # share a style id and the memory only grows with the number of bands
+    style_ids = np.zeros((len(row_breaks), len(col_breaks)), dtype=np.int64)
+    styles = [{}]
+    for (range_start_row, range_end_row), (range_start_col, range_end_col), cust_style in ranges:
+        rows = slice(np.searchsorted(row_breaks, range_start_row), np.searchsorted(row_breaks, range_end_row))
+        cols = slice(np.searchsorted(col_breaks, range_start_col), np.searchsorted(col_breaks, range_end_col))
+        old_ids, inverse = np.unique(style_ids[rows, cols], return_inverse=True)
+        new_ids = np.arange(len(styles), len(styles) + len(old_ids))
+        styles.extend({**styles[old_id], **cust_style} for old_id in old_ids.tolist())
+        style_ids[rows, cols] = new_ids[inverse].reshape(style_ids[rows, cols].shape)
+
+    # without the styles of bands that were overwritten completely
+    used_ids, style_ids = np.unique(style_ids, return_inverse=True)
+    styles = [styles[style_id] for style_id in used_ids.tolist()]
+
+    return row_breaks, col_breaks, style_ids.reshape(len(row_breaks), len(col_breaks)), styles
@@ -1,20 +1,59 @@
 # -*- coding: utf-8 -*-
+import io
 import os
-import warnings
-from typing import Any, Union, List, Tuple #, Literal
+import tempfile
+import time
+import zipfile
+from contextlib import nullcontext
+from copy import copy
+from itertools import chain, count
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Union, List, Tuple, Iterable #, Literal
 import datetime
+import re
 import numpy as np
 import pandas as pd
 import openpyxl
-import yaml
-
-
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+from openpyxl.writer.excel import ExcelWriter as OpenpyxlPackageWriter
+
+
+from beautifulexcel.profiling import SheetStats, Stats, WorkbookStats, count_warnings, warn
+from beautifulexcel.package import (
+    SHARED_STRINGS_CONTENT_TYPE,
+    SHARED_STRINGS_REL_TYPE,
+    Package,
+    _insert_before_end_tag,
+    insert_sheet_data,
+    remap_style_ids,
+)
+from beautifulexcel.sheet_xml import EMPTY_CELL, SharedStrings, cells_xml, encode_column, encode_value
+from beautifulexcel.styles import (
+    StyleBundle,
+    StyleCache,
+    XlsxWriterFormatCache,
+    append_style_tables,
+    build_table_style,
+    get_style_tables,
+    merge_style_tables,
+    plan_default_styles,
+    seed_style_tables,
+)
+from beautifulexcel.theme import load_theme
 from beautifulexcel.utils import (
-    flatten_dict,
-    deepen_dict,
-    get_custom_styles,
+    resolve_custom_styles,
+    coalesce_ranges,
+    coalesce_style_ranges,
+    is_bounded_range,
     dict_extend_with_dict,
-    is_valid_excel_cell,
+    sample_positions,
+    nan_quantiles,
+    parse_excel_ref,
 )
 
 
@@ -27,9 +66,13 @@ class Sheet:
         self.sheet_name = sheet_name
         self.use_theme_style = use_theme_style
         self.col_widths = col_widths
+        self.stats = SheetStats(sheet_name, excelwriter.engine)
+        # resolved cell refs of this sheet {ref: (row_num, col_num) or None}
+        self._cell_refs = {}
 
         if use_theme_style:
-            self.style_base = self._extend_style_args(self.excelwriter.theme.get("general", {}))
+            # copy since the theme styles are shared with all other writers of the theme
+            self.style_base = {**self._extend_style_args(self.excelwriter.theme.get("general", {}))}
         else:
             self.style_base = {}
 
@@ -64,36 +107,12 @@ class Sheet:
             return _final_style
 
     def apply_cell_style(self, row_num, col_num, style):
-        ws = self.ws
-        style_deep = deepen_dict(style)
-        cell = ws.cell(row=row_num, column=col_num)
-
-        for style_type, kwargs in style_deep.items():
-            if style_type.lower() == "font":
-                cell.font = openpyxl.styles.Font(**kwargs)
-            elif style_type.lower() == "numfmt" or style_type.lower() == "numberformat":
-                cell.number_format = kwargs
-            elif style_type.lower() == "align" or style_type.lower() == "alignment":
-                cell.alignment = openpyxl.styles.Alignment(**kwargs)
-            elif style_type.lower() == "fill" or style_type.lower() == "pfill" or style_type.lower() == "patternfill":
-                if type(kwargs) is not dict:
-                    kwargs = {"patternType": "solid", "fgColor": kwargs}
-                cell.fill = openpyxl.styles.PatternFill(**kwargs)
-            elif style_type.lower() == "gfill" or style_type.lower() == "gradientfill":
-                cell.fill = openpyxl.styles.GradientFill(**kwargs)
-            elif style_type.lower() == "border" or style_type.lower() == "borders":
-                border_kwargs = {}
-                for border_type, border_props in kwargs.items():
-                    border_kwargs[border_type] = openpyxl.styles.Side(**border_props)
-                cell.border = openpyxl.styles.Border(**border_kwargs)
-            elif style_type.lower() == "protection":
-                cell.font = openpyxl.styles.Protection(**kwargs)
-            else:
-                raise Exception(
-                    f'Unknown style type "{style_type}". Available style types are: font, numberformat, align, fill, patternfill, gradientfill, borders, and protection.'
-                )
-
-        return cell
+        """Apply a flattened style dict (or an already cached StyleBundle) to a single cell"""
+        style_cache = self.excelwriter.style_cache
+        if not isinstance(style, StyleBundle):
+            style = style_cache.get(style)
+        cell = self.ws.cell(row=row_num, column=col_num)
+        return style_cache.apply(cell, style)
 
     def apply_range_style(self, ws, style):
         raise Exception("Not yet defined function .apply_range_style()")
@@ -138,16 +157,25 @@ class Sheet:
         else:
             formula1 = props
             formula2 = None
-        dv = openpyxl.worksheet.datavalidation.DataValidation(type=type, formula1=formula1, formula2=formula2, operator=operator, **kwargs)
-        self.ws.add_data_validation(dv)
 
         if isinstance(ref, str):
             ref = [ref]
-        for i_ref in ref:
-            if self.__class__.__name__ == 'DataframeSheet':
-                i_ref = self.util_range_ref_from_coordinates(self.util_get_range_coordinates(i_ref, enrich_dimensions=True))
-            if i_ref is not None:
-                dv.add(i_ref)
+        if isinstance(self, DataframeSheet):
+            # overlapping and adjacent ranges are merged so that the sqref lists each cell once in as few ranges as possible
+            coordinates = [i_coordinates for i_coordinates in self.util_resolve_refs(ref, enrich_dimensions=True) if i_coordinates is not None]
+            bounded = [i_coordinates for i_coordinates in coordinates if is_bounded_range(i_coordinates)]
+            coordinates = [i_coordinates for i_coordinates in coordinates if not is_bounded_range(i_coordinates)] + coalesce_ranges(bounded)
+            ref = [self.util_range_ref_from_coordinates(i_coordinates) for i_coordinates in coordinates]
+        refs = list(dict.fromkeys(i_ref for i_ref in ref if i_ref is not None))
+
+        self._add_data_validation(refs, type=type, formula1=formula1, formula2=formula2, operator=operator, **kwargs)
+
+    def _add_data_validation(self, refs, type, formula1, formula2, operator, **kwargs):
+        """Add one data validation for all cell ranges e.g. ['A1:C5', 'E1:E5'] to the worksheet"""
+        dv = openpyxl.worksheet.datavalidation.DataValidation(type=type, formula1=formula1, formula2=formula2, operator=operator, **kwargs)
+        self.ws.data_validations.append(dv)
+        for i_ref in refs:
+            dv.add(i_ref)
 
 
     def merge_cells(self, ref: str):
@@ -162,11 +190,16 @@ class Sheet:
         """
         if isinstance(ref, str):
             ref = [ref]
-        for i_ref in ref:
-            if self.__class__.__name__ == 'DataframeSheet':
-                i_ref = self.util_range_ref_from_coordinates(self.util_get_range_coordinates(i_ref, enrich_dimensions=True))
+        if isinstance(self, DataframeSheet):
+            ref = [self.util_range_ref_from_coordinates(coordinates) for coordinates in self.util_resolve_refs(ref, enrich_dimensions=True)]
+        # duplicates are merged once - adjacent ranges are not joined as that would merge them into one cell
+        for i_ref in dict.fromkeys(ref):
             if i_ref is not None:
-                self.ws.merge_cells(i_ref)
+                self._merge_cells(i_ref)
+
+    def _merge_cells(self, ref):
+        """Merge a single cell range e.g. 'A1:C5' in the worksheet"""
+        self.ws.merge_cells(ref)
 
 
     def __group_cols_rows(self, ref, axis, hidden=False, outline_level=1):
@@ -177,15 +210,19 @@ class Sheet:
                 hidden = [hidden] * len(ref)
             if isinstance(outline_level, int):
                 outline_level = [outline_level] * len(ref)
+        if isinstance(self, DataframeSheet):
+            ref = [self.util_range_ref_from_coordinates(coordinates) for coordinates in self.util_resolve_refs(ref)]
         for i_ref, i_hidden, i_level in zip(ref, hidden, outline_level):
-            if self.__class__.__name__ == 'DataframeSheet':
-                i_ref = self.util_range_ref_from_coordinates(self.util_get_range_coordinates(i_ref))
             if i_ref is not None:
                 i_ref_start, i_ref_end = i_ref.split(':')
-                if axis == 'columns':
-                    self.ws.column_dimensions.group(i_ref_start, i_ref_end, hidden=i_hidden, outline_level=i_level)
-                elif axis == 'rows':
-                    self.ws.row_dimensions.group(i_ref_start, i_ref_end, hidden=i_hidden, outline_level=i_level)
+                self._group(axis, i_ref_start, i_ref_end, hidden=i_hidden, outline_level=i_level)
+
+    def _group(self, axis, ref_start, ref_end, hidden=False, outline_level=1):
+        """Group the columns e.g. 'A' to 'C' or rows e.g. '1' to '3' in the worksheet"""
+        if axis == 'columns':
+            self.ws.column_dimensions.group(ref_start, ref_end, hidden=hidden, outline_level=outline_level)
+        elif axis == 'rows':
+            self.ws.row_dimensions.group(ref_start, ref_end, hidden=hidden, outline_level=outline_level)
 
 
     def group_columns(self, ref: str):
@@ -226,28 +263,31 @@ class Sheet:
             >>> ws.util_get_cell_coordinates(ref='-1')
             (-1, None)
         """
-        ref = str(ref)
-
-        # check if row number - i.e. all numbers
-        if ref.isdigit() or (len(ref) >= 2 and ref[0] == '-' and ref[1:].isdigit()):
-            return (int(ref), None)
-
-        # check if reasonable column letter - i.e. all letters and resonable number
-        if len(ref) < 4 and ref.isalpha() and openpyxl.utils.cell.column_index_from_string(ref) < 1_048_577:
-            return (None, openpyxl.utils.cell.column_index_from_string(ref))
-
-        # check if valid excel cell ref
-        valid_excel_cell, col_letter, row_num = is_valid_excel_cell(ref)
-        if valid_excel_cell:
-            return openpyxl.utils.cell.coordinate_to_tuple(ref)
-
-        # raise wainring if invalid
-        if self.excelwriter.ref_warnings:
-            warnings.warn(f'Ref "{ref}" could not be found. (You can ignore these warnings by adding ref_warnings=False to ExcelWriter())')
-
-        # return None
-        return None
+        coordinates = self._resolve_cell_ref(ref)
+        if coordinates is None:
+            self._warn_unknown_refs([str(ref)])
+        return coordinates
 
+    def _resolve_cell_ref(self, ref):
+        """Memoized cell coordinates of a ref of this sheet - None without warning if the ref could not be found"""
+        ref = str(ref)
+        try:
+            return self._cell_refs[ref]
+        except KeyError:
+            coordinates = self._cell_refs[ref] = self._parse_cell_ref(ref)
+            return coordinates
+
+    def _parse_cell_ref(self, ref):
+        """Cell coordinates of a row number, column letter, or cell ref - None if the ref could not be found"""
+        return parse_excel_ref(ref)
+
+    def _warn_unknown_refs(self, refs, kind="Ref"):
+        """One warning for all refs that could not be found"""
+        if refs and self.excelwriter.ref_warnings:
+            refs_str = ", ".join(f'"{ref}"' for ref in refs)
+            warn(
+                f"{kind}{'s' if len(refs) > 1 else ''} {refs_str} could not be found. (You can ignore these warnings by adding ref_warnings=False to ExcelWriter())"
+            )
 
     def util_get_range_coordinates(self, ref, enrich_dimensions=False):
         """
@@ -264,46 +304,76 @@ class Sheet:
             ((4, None), (-1, None))
 
         """
-        if ':' in ref:
-            ref_start, ref_end = ref.split(':')
-        else:
-            ref_start = ref_end = ref
+        return self.util_resolve_refs([ref], enrich_dimensions=enrich_dimensions)[0]
 
-        coordinates_start = self.util_get_cell_coordinates(ref_start)
-        coordinates_end = self.util_get_cell_coordinates(ref_end)
+    def util_resolve_refs(self, refs, enrich_dimensions=False, kind="Ref"):
+        """
+        Get the cell range coordinates of many refs at once like .util_get_range_coordinates() - every ref of the sheet
+        is only parsed once and a single warning lists all refs that could not be found
 
-        # if any invaild ref
-        if coordinates_start is None or coordinates_end is None:
-            return None
+        Args:
+            refs (list): Cell, column, row, or range refs e.g. ['A2:C4', 'employees', '1:3']
+            enrich_dimensions (bool): Fill undefined rows and columns with the dimensions of the table (or sheet)
+            kind (str): Name of the refs in the warning e.g. "Styling ref"
 
-        row_start, col_start = coordinates_start
-        row_end, col_end = coordinates_end
-        if self.__class__.__name__ == 'DataframeSheet':
-            ((sheet_min_row, sheet_min_column), (sheet_max_row, sheet_max_column)) = self.shape_body
-        else:
-            sheet_min_row = self.ws.min_row
-            sheet_max_row = self.ws.max_row
-            sheet_min_column = self.ws.min_column
-            sheet_max_column = self.ws.max_column
+        Returns:
+            list: ((start_row, start_col), (end_row, end_col)) per ref - None if the ref could not be found
 
-        # enrich_dimensions if any ref is None/undefined
+        Example:
+            >>> ws.util_resolve_refs(['A2:C4', 'employees', 'not_a_column'])
+            [((2, 1), (4, 3)), ((None, 3), (None, 3)), None]
+        """
+        self.stats.count("ranges_resolved", len(refs))
         if enrich_dimensions:
-            if row_start is None:
-                row_start = sheet_min_row
-            if row_end is None:
-                row_end = sheet_max_row - 1
-            if col_start is None:
-                col_start = sheet_min_column
-            if col_end is None:
-                col_end = sheet_max_column - 1
-
-        # make sure lower bound at start always - so range() works
-        if row_start is not None and row_end is not None and row_end < row_start:
-            row_end, row_start = row_start, row_end
-        if col_start is not None and col_end is not None and col_end < col_start:
-            col_end, col_start = col_start, col_end
-
-        return ((row_start, col_start), (row_end, col_end))
+            if isinstance(self, DataframeSheet):
+                ((sheet_min_row, sheet_min_column), (sheet_max_row, sheet_max_column)) = self.shape_body
+            else:
+                sheet_min_row = self.ws.min_row
+                sheet_max_row = self.ws.max_row
+                sheet_min_column = self.ws.min_column
+                sheet_max_column = self.ws.max_column
+
+        resolve_cell_ref = self._resolve_cell_ref
+        results, unknown_refs = [], []
+        for ref in refs:
+            if ':' in ref:
+                ref_start, ref_end = ref.split(':')
+            else:
+                ref_start = ref_end = ref
+
+            coordinates_start = resolve_cell_ref(ref_start)
+            coordinates_end = resolve_cell_ref(ref_end)
+
+            # if any invaild ref
+            if coordinates_start is None or coordinates_end is None:
+                unknown_refs += [i_ref for i_ref, coordinates in [(ref_start, coordinates_start), (ref_end, coordinates_end)] if coordinates is None]
+                results.append(None)
+                continue
+
+            row_start, col_start = coordinates_start
+            row_end, col_end = coordinates_end
+
+            # enrich_dimensions if any ref is None/undefined
+            if enrich_dimensions:
+                if row_start is None:
+                    row_start = sheet_min_row
+                if row_end is None:
+                    row_end = sheet_max_row - 1
+                if col_start is None:
+                    col_start = sheet_min_column
+                if col_end is None:
+                    col_end = sheet_max_column - 1
+
+            # make sure lower bound at start always - so range() works
+            if row_start is not None and row_end is not None and row_end < row_start:
+                row_end, row_start = row_start, row_end
+            if col_start is not None and col_end is not None and col_end < col_start:
+                col_end, col_start = col_start, col_end
+
+            results.append(((row_start, col_start), (row_end, col_end)))
+
+        self._warn_unknown_refs(list(dict.fromkeys(unknown_refs)), kind=kind)
+        return results
 
     def util_cell_ref_from_coordinates(self, ref):
         """Tranform (row_num, col_num) into excel ref 'A1' """
@@ -353,7 +423,11 @@ class DataframeSheet(Sheet):
         use_theme_style=True,
         col_widths={},
         col_autofit=True,
+        col_autofit_sample=10_000,
         auto_number_formatting=True,
+        number_format_sample=100_000,
+        default_styles=False,
+        as_table=False,
     ):
         super().__init__(excelwriter, sheet_name, use_theme_style, col_widths)
         self.startrow = startrow
@@ -363,73 +437,112 @@ class DataframeSheet(Sheet):
         self.header = df.columns
         self.has_index = index
         self.has_header = header
-        self.index_depth = index_depth = self.index.nlevels if self.has_index else 0
-        self.header_depth = header_depth = self.header.nlevels if self.has_header else 0
-        self.table_width = table_width = len(self.header)
-        self.table_height = table_height = len(self.index)
+        self.index_depth = self.index.nlevels if self.has_index else 0
+        self.header_depth = self.header.nlevels if self.has_header else 0
+        # like pandas, MultiIndex columns get an extra row below the header with the index names (empty if unnamed)
+        if self.has_index and isinstance(self.header, pd.MultiIndex):
+            self.header_depth += 1
+        self.table_width = len(self.header)
+        self.table_height = len(self.index)
         self.col_autofit = col_autofit
+        self.col_autofit_sample = col_autofit_sample
         self.auto_number_formatting = auto_number_formatting
+        self.number_format_sample = number_format_sample
+        self.default_styles = default_styles
+        self._default_styles = None
+        self.as_table = as_table
+        self._column_numbers = self._get_column_numbers()
+        if as_table:
+            self._check_table_options()
+            self.table_columns = self._get_table_column_names()
+        self.timings = self.stats.phases
+        self._set_shapes()
+
+        # generate final styling that will apply to the dataframe export
+        self._generate_table_style(style)
+
+        # get column widths
+        _col_widths = self._get_col_widths(col_widths)
+        self._col_widths = dict(_col_widths)
+
+        # export df to excel and apply the styling & column widths
+        self._write_table(_col_widths)
+
+    def _set_shapes(self):
+        """Set the table shapes ((start_row, start_col), (end_row, end_col)) with exclusive end from the table dimensions"""
+        startrow, startcol = self.startrow, self.startcol
+        header_depth, index_depth = self.header_depth, self.index_depth
+        table_height, table_width = self.table_height, self.table_width
         self.shape = ((startrow + 1, startcol + 1), (startrow + header_depth + table_height + 1, startcol + index_depth + table_width + 1))
         self.shape_header = ((startrow + 1, startcol + 1), (startrow + header_depth + 1, startcol + index_depth + table_width + 1))
         self.shape_index = ((startrow + header_depth + 1, startcol + 1), (startrow + header_depth + table_height + 1, startcol + index_depth + 1))
         self.shape_body = ((startrow + header_depth + 1, startcol + index_depth + 1), (startrow + header_depth + table_height + 1, startcol + index_depth + table_width + 1))
 
-        # export df to excel
-        self.df.to_excel(
-            self.writer, sheet_name=sheet_name, startrow=startrow, startcol=startcol, index=index, header=header
-        )
-        self.ws = self.writer.book[sheet_name]
+    def _generate_table_style(self, style):
+        """Collect the theme table styling, automatic number formats, and the custom styling of to_excel(style=...)"""
+        df = self.df
+        stats = self.stats
 
-        # generate final styling that will apply to the dataframe export
-        if use_theme_style:
+        # with as_table the theme table styling is part of the Excel table style instead of the cell styles
+        if self.use_theme_style and not self.as_table:
             # add table style from style template
-            if "table" in self.excelwriter.theme:
-                for level, level_styling in self.excelwriter.theme["table"].items():
-                    dict_extend_with_dict(
-                        dict_obj=self.style_base, key=level, value_dict=self._extend_style_args(level_styling)
-                    )
+            with stats.phase("theme_styles"):
+                if "table" in self.excelwriter.theme:
+                    for level, level_styling in self.excelwriter.theme["table"].items():
+                        dict_extend_with_dict(
+                            dict_obj=self.style_base, key=level, value_dict=self._extend_style_args(level_styling)
+                        )
 
         # add number formatting
-        if auto_number_formatting:
-            # get all date columns
-            for col_name, col_series in df.select_dtypes(include=["datetime", "datetimetz"]).items():
-                self.style_base[col_name] = self._extend_style_args("date_fmt_iso")
-
-            # get all numeric columns
-            for col_name, col_series in df.select_dtypes(include=["number"]).items():
-                col_series_mod = col_series.replace(0, np.nan).abs()
-                low = col_series_mod.quantile(0.2)
-                high = col_series_mod.quantile(0.8)
-
-                # check if percentages
-                if -2 < low and high < 2:
-                    self.style_base[col_name] = self._extend_style_args("num_fmt_pct")
-                # check if small number
-                elif high < 1_000 and "int" not in str(col_series.dtype):
-                    self.style_base[col_name] = self._extend_style_args("num_fmt_decimal")
-                # check if iso cob date
-                elif 1900_00_00 > low and high < 2100_00_00:
-                    pass
-                # check if large number in millions
-                elif low > 10_000_000:
-                    self.style_base[col_name] = self._extend_style_args("num_fmt_mm")
-                # else normal number format
-                else:
-                    self.style_base[col_name] = self._extend_style_args("num_fmt_general")
+        if self.auto_number_formatting:
+            with stats.phase("number_formats"):
+                self._add_number_formats(df)
 
         # add styling defined in this function
-        self.style_custom = {}
-        for ref, ref_style in style.items():
-            dict_extend_with_dict(dict_obj=self.style_custom, key=ref, value_dict=self._extend_style_args(ref_style))
+        with stats.phase("custom_styles"):
+            self.style_custom = {}
+            for ref, ref_style in style.items():
+                dict_extend_with_dict(dict_obj=self.style_custom, key=ref, value_dict=self._extend_style_args(ref_style))
+
+    def _add_number_formats(self, df):
+        """Add the number format presets of all date and numeric columns detected from their values to the base style"""
+        # get all date columns
+        for col_name, col_series in df.select_dtypes(include=["datetime", "datetimetz"]).items():
+            self.style_base[col_name] = self._extend_style_args("date_fmt_iso")
+
+        # get all numeric columns - 20% and 80% quantile of the absolute non-zero values of all columns at once
+        df_numeric = df.select_dtypes(include=["number"])
+        sample = sample_positions(len(df_numeric), self.number_format_sample)
+        if sample is not None:
+            df_numeric = df_numeric.iloc[sample]
+        values = np.abs(df_numeric.to_numpy(dtype=float, na_value=np.nan))
+        values[values == 0] = np.nan
+        lows, highs = nan_quantiles(values, [0.2, 0.8])
+
+        for (col_name, col_dtype), low, high in zip(df_numeric.dtypes.items(), lows, highs):
+            # check if percentages
+            if -2 < low and high < 2:
+                self.style_base[col_name] = self._extend_style_args("num_fmt_pct")
+            # check if small number
+            elif high < 1_000 and "int" not in str(col_dtype):
+                self.style_base[col_name] = self._extend_style_args("num_fmt_decimal")
+            # check if iso cob date
+            elif 1900_00_00 > low and high < 2100_00_00:
+                pass
+            # check if large number in millions
+            elif low > 10_000_000:
+                self.style_base[col_name] = self._extend_style_args("num_fmt_mm")
+            # else normal number format
+            else:
+                self.style_base[col_name] = self._extend_style_args("num_fmt_general")
 
-        # actually apply the final themes
-        self._apply_table_style()
+    def _get_col_widths(self, col_widths):
+        """Get the final column widths {col_idx: width} from the manual col_widths and the column autofit"""
+        df = self.df
 
         # apply column widths
         _col_widths = {}
-        for col_ref, col_width in col_widths.items():
-            col_coordinates = self.util_get_range_coordinates(col_ref)
-
+        for col_width, col_coordinates in zip(col_widths.values(), self.util_resolve_refs(list(col_widths))):
             if (
                 col_coordinates is not None
                 and col_coordinates[0] is not None
@@ -437,46 +550,158 @@ class DataframeSheet(Sheet):
                 and col_coordinates[1] is not None
                 and col_coordinates[1][1] is not None
             ):
+                # coordinates are 1-based, column widths are by 0-based column index
                 for col_idx in range(col_coordinates[0][1], col_coordinates[1][1] + 1):
-                    _col_widths[col_idx] = col_width
+                    _col_widths[col_idx - 1] = col_width
+        self._fixed_col_widths = set(_col_widths)
+
+        # autofit columns without a manual col width
+        if self.col_autofit:
+            with self.stats.phase("autofit"):
+                col_lengths = _estimate_col_lengths(df, self.has_index, self.has_header, self.col_autofit_sample)
+            for i, length in enumerate(col_lengths, start=self.startcol):
+                if i not in _col_widths and length is not None:
+                    _col_widths[i] = int(length * COL_WIDTH_CHARACTER_FACTOR)
+
+        return _col_widths
+
+    def _widen_col_widths(self, df):
+        """Widen the autofit columns whose appended rows (df) are longer than the current column width"""
+        if not self.col_autofit:
+            return
+        with self.stats.phase("autofit"):
+            col_lengths = _estimate_col_lengths(df, self.has_index, False, self.col_autofit_sample)
+        col_widths = {}
+        for i, length in enumerate(col_lengths, start=self.startcol):
+            if i not in self._fixed_col_widths and length is not None and int(length * COL_WIDTH_CHARACTER_FACTOR) > self._col_widths.get(i, 0):
+                col_widths[i] = self._col_widths[i] = int(length * COL_WIDTH_CHARACTER_FACTOR)
+        if col_widths:
+            with self.stats.phase("col_widths"):
+                self.change_col_widths(col_widths)
+
+    def _write_table(self, col_widths):
+        """Export the dataframe with pandas and style the written cells in place"""
+        # export df to excel
+        with self.stats.phase("write_values"):
+            self.df.to_excel(
+                self.writer,
+                sheet_name=self.sheet_name,
+                startrow=self.startrow,
+                startcol=self.startcol,
+                index=self.has_index,
+                header=self.has_header,
+                merge_cells=not self.as_table,
+            )
+        self.ws = self.writer.book[self.sheet_name]
+
+        if self.as_table:
+            # Excel tables need unique text headers and pandas' header/index cell styles would hide the table style
+            ws = self.ws
+            (first_row, first_col), (end_row, end_col) = self.shape_header
+            for col_num, name in zip(range(first_col, end_col), self.table_columns):
+                cell = ws.cell(row=first_row, column=col_num, value=name)
+                cell._style = StyleArray()
+            if self.has_index:
+                (first_row, first_col), (end_row, end_col) = self.shape_index
+                for row in ws.iter_rows(min_row=first_row, max_row=end_row - 1, min_col=first_col, max_col=end_col - 1):
+                    for cell in row:
+                        cell._style = StyleArray()
 
-        # autofit columns
-        if col_autofit:
-            CHARACTER_FACTOR = 1.28
+        # actually apply the final themes
+        self._apply_table_style()
 
-            # enumerate though indeices and columns
-            for i, col in enumerate(
-                ([df.index.get_level_values(i) for i in range(df.index.nlevels)] if index else [])
-                + [i for _, i in df.items()],
-                start=startcol,
-            ):
-                # check if no manual col width
-                if i not in _col_widths:
-                    try:
-                        # is datetime column
-                        if pd.api.types.is_datetime64_any_dtype(col):
-                            _col_widths[i] = int(10 * CHARACTER_FACTOR)
-                        # is string column
-                        elif pd.api.types.is_string_dtype(col):
-                            try:
-                                length = np.quantile(col.str.len().values, 0.8)
-                                _col_widths[i] = int(max(length, 4) * CHARACTER_FACTOR)
-                            except:
-                                # ignore error
-                                pass
-                        # is numeric column
-                        elif pd.api.types.is_numeric_dtype(col):
-                            length = len("{:,}".format(int(col.quantile(0.8))))
-                            _col_widths[i] = int(max(length, 6) * CHARACTER_FACTOR)
-                    except Exception as e:
-                        warnings.warn(f'Were not able to automatically determin best column width for "{col}". You can set it manually col_widths=' + '{' + f'"{col}": 40' + '}')
-
-        self.change_col_widths(_col_widths)
+        with self.stats.phase("col_widths"):
+            self.change_col_widths(col_widths)
 
-    def _apply_table_style(self):
-        """This internal function applies the table cell styling for the to_excel() function"""
-        ref_warnings = self.excelwriter.ref_warnings
+    def _write_rows(self, table_style):
+        """Write and style the rows of the resolved table style cell by cell (used for appended chunks)"""
+        ws = self.ws
+        style_cache = self.excelwriter.style_cache
+        for row_num, cells in self._iter_table_rows(table_style):
+            for col_num, value, number_format, bundle in cells:
+                if bundle is None:
+                    # empty cell with the default style of its column/row
+                    continue
+                cell = ws.cell(row=row_num, column=col_num, value=value)
+                if number_format:
+                    cell.number_format = number_format
+                style_cache.apply(cell, bundle)
+
+        for ref in self._get_label_merges(table_style):
+            self._merge_cells(ref)
+
+    def _write_chunk(self, df):
+        """Append a dataframe chunk with the same columns below the table - reuses the styling and column widths of the first chunk"""
+        if not df.columns.equals(self.header):
+            raise Exception(
+                f'All dataframe chunks written to the sheet "{self.sheet_name}" need the same columns as the first chunk: {list(self.header)}'
+            )
+        chunk_start_row = self.shape[1][0]
+        self.df = df
+        self.index = df.index
+        self.table_height += len(df)
+        self._set_shapes()
+        self._write_styled_rows(body_rows=(chunk_start_row, self.shape[1][0]))
+
+    def append_rows(self, df: pd.DataFrame):
+        """
+        Append dataframe rows with the same columns below the table - only the new rows are written and styled, and the
+        Excel table (to_excel(as_table=...)), the data validations, and the autofit column widths of the table are
+        extended to them
+
+        Args:
+            df (pd.DataFrame): Rows to append
+
+        Returns:
+            beautifulexcel.DataframeSheet
+
+        Example:
+            ```python
+            ws = writer.to_excel(df_history, sheet_name='Log', as_table=True)
+            ws.append_rows(df_today)
+            ```
+        """
+        last_row = self.shape[1][0] - 1
+        table_ref = self._get_table_ref()
+        with self.stats.phase("append_rows"):
+            self._write_chunk(df)
+            self._extend_ranges(last_row, table_ref)
+        self._widen_col_widths(df)
+        return self
 
+    def _extend_ranges(self, last_row, table_ref):
+        """Extend the Excel tables (table_ref before the append) and data validations of the table columns that end in the former last table row down to the new last row"""
+        ws = self.ws
+        (_, first_col), (end_row, end_col) = self.shape
+        new_table_ref = self._get_table_ref()
+
+        def _is_table_range(cell_range):
+            return cell_range.max_row == last_row and first_col <= cell_range.min_col and cell_range.max_col < end_col
+
+        for table in ws.tables.values():
+            if table.ref == table_ref or _is_table_range(CellRange(table.ref)):
+                table.ref = new_table_ref
+                if table.autoFilter is not None:
+                    table.autoFilter.ref = new_table_ref
+        for dv in ws.data_validations.dataValidation:
+            for cell_range in dv.sqref.ranges:
+                if _is_table_range(cell_range):
+                    cell_range.expand(down=end_row - 1 - last_row)
+
+    def _write_styled_rows(self, body_rows=None):
+        """Resolve the table style (of the body_rows) and write its rows with _write_rows()"""
+        with self.stats.phase("resolve_styles"):
+            table_style = self._resolve_table_style(body_rows=body_rows)
+            self._plan_default_styles(table_style)
+        with self.stats.phase("write_rows"):
+            self._write_rows(table_style)
+
+    def _resolve_table_style(self, body_rows=None):
+        """
+        Resolve the final cell styling of the table header, index, and body - returns {area: (shape, style bands)}
+
+        If body_rows=(start_row, end_row) is given only these rows of the index and body are resolved (without header)
+        """
         style_base = self.style_base.copy()
         style_custom = self.style_custom.copy()
 
@@ -486,65 +711,330 @@ class DataframeSheet(Sheet):
         style_special_index = {**style_special_base, **style_base.pop("index", {}), **style_custom.pop("index", {})}
         style_special_body = {**style_special_base, **style_base.pop("body", {}), **style_custom.pop("body", {})}
 
+        # all style refs are resolved at once - invalid refs are left out with a single warning
+        style_refs = [(ref, ref_style) for iter_dict in [style_base, style_custom] for ref, ref_style in iter_dict.items()]
         style_non_special = {}
-        for iter_dict in [style_base, style_custom]:
-            for ref, ref_style in iter_dict.items():
-                style_coordinates = self.util_get_range_coordinates(ref)
-
-                # check if invalid cell ref
-                if (style_coordinates is None or style_coordinates[0] is None or style_coordinates[1] is None):
-                    if ref_warnings:
-                        warnings.warn(
-                            f'Styling ref "{ref}" could not be found. (You can turn off these warnings by adding ref_warnings=False to ExcelWriter())'
-                        )
-
-                # all good - valid cell style range
-                else:
-                    dict_extend_with_dict(
-                        dict_obj=style_non_special, key=style_coordinates, value_dict=self._extend_style_args(ref_style)
-                    )
-
-        # Apply table heading styling
-        if self.has_header:
-            ((start_row, start_col), (end_row, end_col)) = self.shape_header
-            for row_num in range(start_row, end_row):
-                for col_num in range(start_col, end_col):
-                    cell_style = get_custom_styles(
-                        cell_row_num=row_num,
-                        cell_col_num=col_num,
-                        styles_custom=style_non_special,
-                        ignore_entire_rows_or_cols=True,
-                    )
-                    # print('Header', row_num, col_num)
-                    self.apply_cell_style(row_num=row_num, col_num=col_num, style={**style_special_head, **cell_style})
-
-        # Apply table index styling
-        if self.has_index:
-            ((start_row, start_col), (end_row, end_col)) = self.shape_index
-            for row_num in range(start_row, end_row):
-                for col_num in range(start_col, end_col):
-                    cell_style = get_custom_styles(
-                        cell_row_num=row_num,
-                        cell_col_num=col_num,
-                        styles_custom=style_non_special,
-                        ignore_entire_rows_or_cols=True,
-                    )
-                    # print('Index', row_num, col_num)
-                    self.apply_cell_style(row_num=row_num, col_num=col_num, style={**style_special_index, **cell_style})
-
-        # Apply table body styling
-        ((start_row, start_col), (end_row, end_col)) = self.shape_body
-        for row_num in range(start_row, end_row):
-            for col_num in range(start_col, end_col):
-                cell_style = get_custom_styles(
-                    cell_row_num=row_num,
-                    cell_col_num=col_num,
-                    styles_custom=style_non_special,
-                    ignore_entire_rows_or_cols=False,
+        for (ref, ref_style), style_coordinates in zip(style_refs, self.util_resolve_refs([ref for ref, _ in style_refs], kind="Styling ref")):
+            if style_coordinates is not None:
+                dict_extend_with_dict(
+                    dict_obj=style_non_special, key=style_coordinates, value_dict=self._extend_style_args(ref_style)
                 )
-                # print('Body', row_num, col_num)
-                self.apply_cell_style(row_num=row_num, col_num=col_num, style={**style_special_body, **cell_style})
+        # e.g. thousands of per-cell refs with the same style are resolved as a few rectangles
+        style_non_special = coalesce_style_ranges(style_non_special)
+
+        shape_index, shape_body = self.shape_index, self.shape_body
+        if body_rows is not None:
+            shape_index = ((body_rows[0], shape_index[0][1]), (body_rows[1], shape_index[1][1]))
+            shape_body = ((body_rows[0], shape_body[0][1]), (body_rows[1], shape_body[1][1]))
+
+        table_style = {}
+        if self.has_header and body_rows is None:
+            table_style["head"] = (
+                self.shape_header,
+                self._resolve_area_style(self.shape_header, style_special_head, style_non_special, ignore_entire_rows_or_cols=True),
+            )
+        if self.has_index:
+            table_style["index"] = (
+                shape_index,
+                self._resolve_area_style(shape_index, style_special_index, style_non_special, ignore_entire_rows_or_cols=True),
+            )
+        table_style["body"] = (
+            shape_body,
+            self._resolve_area_style(shape_body, style_special_body, style_non_special, ignore_entire_rows_or_cols=False),
+        )
+        return table_style
+
+    def _apply_table_style(self):
+        """This internal function applies the table cell styling for the to_excel() function"""
+        ws = self.ws
+        style_cache = self.excelwriter.style_cache
+        with self.stats.phase("resolve_styles"):
+            table_style = self._resolve_table_style()
+            default_styles = self._plan_default_styles(table_style)
+        with self.stats.phase("apply_table_style"):
+            cells = ws._cells
+            cells_omitted = 0
+            for area, (shape, style_bands) in table_style.items():
+                start_col = shape[0][1]
+                row_omissions = default_styles.iter_row_omissions() if default_styles is not None and area == "body" else None
+                for band_start, band_end, row_bundles in style_bands:
+                    for row_num in range(band_start, band_end):
+                        omit = next(row_omissions) if row_omissions is not None else None
+                        for col_num, bundle in enumerate(row_bundles, start=start_col):
+                            if omit is not None and omit[col_num - start_col]:
+                                cell = cells.get((row_num, col_num))
+                                # empty cells with the default style of their column/row are removed
+                                if cell is None or cell.value is None or cell.value == "":
+                                    cells.pop((row_num, col_num), None)
+                                    cells_omitted += 1
+                                    continue
+                            style_cache.apply(ws.cell(row=row_num, column=col_num), bundle)
+            if default_styles is not None:
+                self.stats.count("cells_omitted", cells_omitted)
+
+    def _plan_default_styles(self, table_style):
+        """
+        Plan the column and row default styles of the table body with styles.plan_default_styles() and set them in the
+        worksheet if to_excel(default_styles=True) - later chunks keep the column default styles of the first chunk
+        """
+        if not self.default_styles:
+            return None
+        df = self.df
+        (body_start, _), (body_end, _) = table_style["body"][0]
+
+        # row bands of the index and body together
+        areas = [table_style[area][1] for area in ["index", "body"] if area in table_style]
+        band_starts = sorted({band_start for area_bands in areas for band_start, _, _ in area_bands if band_start < body_end})
+        bands = []
+        for band_start, band_end in zip(band_starts, band_starts[1:] + [body_end]):
+            row_bundles = []
+            for area_bands in areas:
+                row_bundles += next(bundles for start, end, bundles in area_bands if start <= band_start < end)
+            bands.append((band_start, band_end, row_bundles))
+
+        empty_rows = np.zeros(len(df), dtype=bool)
+        empty_cols = []
+        for i in range(self.table_width):
+            missing = pd.isna(df.iloc[:, i]).to_numpy()
+            empty_cols.append(bool(missing.any()))
+            empty_rows |= missing
+        empty_bands = [bool(empty_rows[band_start - body_start : band_end - body_start].any()) for band_start, band_end, _ in bands]
+
+        previous_cols = None if self._default_styles is None else self._default_styles.cols
+        default_styles = plan_default_styles(
+            bands,
+            first_col=self.startcol + 1,
+            index_depth=self.index_depth,
+            empty_cols=empty_cols,
+            empty_bands=empty_bands,
+            cols=previous_cols,
+            row_styles=self._row_styles_possible(),
+        )
+        new_cols = default_styles.cols if previous_cols is None else {}
+        self._set_default_styles(new_cols, default_styles.rows)
+        self._default_styles = default_styles
+        return default_styles
+
+    def _row_styles_possible(self):
+        """If row default styles can be set - not possible if the rows are streamed"""
+        return True
+
+    def _set_default_styles(self, cols, rows):
+        """Set the column default styles {col_num: StyleBundle} and row default styles [(band_start_row, band_end_row, StyleBundle), ...]"""
+        ws = self.ws
+        style_cache = self.excelwriter.style_cache
+        for col_num, bundle in cols.items():
+            style_cache.apply(ws.column_dimensions[openpyxl.utils.get_column_letter(col_num)], bundle)
+        for band_start, band_end, bundle in rows:
+            for row_num in range(band_start, band_end):
+                style_cache.apply(ws.row_dimensions[row_num], bundle)
+
+    def _resolve_area_style(self, shape, style_special, style_non_special, ignore_entire_rows_or_cols=False):
+        """Resolve the final cell styles of a table area - returns [(band_start_row, band_end_row, [StyleBundle per column]), ...]"""
+        ((start_row, start_col), (end_row, end_col)) = shape
+        row_breaks, col_breaks, style_ids, styles = resolve_custom_styles(
+            row_start=start_row,
+            row_end=end_row,
+            col_start=start_col,
+            col_end=end_col,
+            styles_custom=style_non_special,
+            ignore_entire_rows_or_cols=ignore_entire_rows_or_cols,
+        )
+        bundles = [self.excelwriter.style_cache.get({**style_special, **cell_style}) for cell_style in styles]
+        col_bands = np.searchsorted(col_breaks, np.arange(start_col, end_col), side="right") - 1
+        band_ends = list(row_breaks[1:]) + [end_row]
+        return [
+            (int(band_start), int(band_end), [bundles[i] for i in style_ids[band, col_bands]])
+            for band, (band_start, band_end) in enumerate(zip(row_breaks, band_ends))
+        ]
+
+    def _iter_table_rows(self, table_style, chunk_size=10_000):
+        """
+        Yield the table rows as (row_num, [(col_num, value, number_format, StyleBundle), ...]) in the layout of
+        pandas.DataFrame.to_excel() using the resolved table style of _resolve_table_style() - the dataframe body is
+        converted chunk by chunk to keep the memory usage low
+        """
+        df = self.df
+        first_col = self.startcol + 1
+        value_with_fmt = self.writer._value_with_fmt
+        index_depth = self.index_depth
+        cells_omitted = 0
+
+        def _band_bundles(area):
+            """Iterate row by row through the style bands of an area"""
+            for band_start, band_end, row_bundles in table_style[area][1]:
+                for _ in range(band_start, band_end):
+                    yield row_bundles
+
+        def _row_cells(row_values, row_bundles, omit=None):
+            """Cells of a row - empty body cells with the default style of their column/row get no style bundle (omit)"""
+            nonlocal cells_omitted
+            cells = []
+            for col_num, value, bundle in zip(range(first_col, first_col + len(row_values)), row_values, row_bundles):
+                number_format = None
+                if value is not None:
+                    value, number_format = value_with_fmt(value)
+                elif omit is not None and col_num - first_col >= index_depth and omit[col_num - first_col - index_depth]:
+                    bundle = None
+                    cells_omitted += 1
+                cells.append((col_num, value, number_format, bundle))
+            return cells
+
+        # table header
+        if "head" in table_style:
+            for row_num, row_values, row_bundles in zip(
+                range(self.shape_header[0][0], self.shape_header[1][0]), self._get_header_rows(), _band_bundles("head")
+            ):
+                yield row_num, _row_cells(row_values, row_bundles)
+
+        # table index and body
+        index_hidden = self._get_index_hidden_labels()
+        index_bundles = _band_bundles("index") if self.has_index else None
+        body_bundles = _band_bundles("body")
+        row_omissions = self._default_styles.iter_row_omissions() if self._default_styles is not None else None
+        row_num = table_style["body"][0][0][0]
+        for chunk_start in range(0, len(df), chunk_size):
+            chunk = df.iloc[chunk_start : chunk_start + chunk_size]
+            chunk_columns = []
+            if self.has_index:
+                for level in range(self.index_depth):
+                    values = _to_python_values(chunk.index.get_level_values(level))
+                    for i in np.flatnonzero(index_hidden[level][chunk_start : chunk_start + chunk_size]):
+                        values[i] = None
+                    chunk_columns.append(values)
+            chunk_columns += [_to_python_values(chunk.iloc[:, i]) for i in range(self.table_width)]
+
+            for row_values in zip(*chunk_columns):
+                row_bundles = next(body_bundles)
+                if index_bundles is not None:
+                    row_bundles = next(index_bundles) + row_bundles
+                yield row_num, _row_cells(row_values, row_bundles, next(row_omissions) if row_omissions is not None else None)
+                row_num += 1
+
+        if row_omissions is not None:
+            self.stats.count("cells_omitted", cells_omitted)
+
+    def _get_header_rows(self):
+        """Header row values incl. the index name columns - MultiIndex labels are only shown once per merged span"""
+        if self.as_table:
+            return [self.table_columns]
+        header = self.header
+        if isinstance(header, pd.MultiIndex):
+            hidden = _get_repeated_labels(header)
+            header_rows = []
+            for level in range(header.nlevels):
+                index_names = [None] * self.index_depth
+                if self.index_depth > 0:
+                    index_names[-1] = header.names[level]
+                labels = [None if is_hidden else label for label, is_hidden in zip(header.get_level_values(level), hidden[level])]
+                header_rows.append(index_names + labels)
+            if self.has_index:
+                header_rows.append(list(self.index.names) + [None] * self.table_width)
+            return header_rows
+        index_names = list(self.index.names) if self.has_index else []
+        return [index_names + list(header)]
+
+    def _get_index_hidden_labels(self):
+        """Boolean array per index level that is True if the label is hidden as part of a merged span"""
+        if self.has_index and isinstance(self.index, pd.MultiIndex) and not self.as_table:
+            return _get_repeated_labels(self.index)
+        return np.zeros((self.index_depth, len(self.index)), dtype=bool)
+
+    def _get_label_merges(self, table_style):
+        """Excel refs of the merged MultiIndex header and index label spans - like pandas.DataFrame.to_excel(merge_cells=True)"""
+        merges = []
+        if "head" in table_style and isinstance(self.header, pd.MultiIndex):
+            first_col = self.shape_body[0][1]
+            for level, hidden in enumerate(_get_repeated_labels(self.header)):
+                row_num = self.shape_header[0][0] + level
+                for start, end in _get_spans(hidden):
+                    merges.append(self.util_range_ref_from_coordinates(((row_num, first_col + start), (row_num, first_col + end))))
+        # Excel tables cannot contain merged cells
+        if self.has_index and isinstance(self.index, pd.MultiIndex) and not self.as_table:
+            first_row = table_style["body"][0][0][0]
+            for level, hidden in enumerate(_get_repeated_labels(self.index)):
+                col_num = self.shape_index[0][1] + level
+                for start, end in _get_spans(hidden):
+                    merges.append(self.util_range_ref_from_coordinates(((first_row + start, col_num), (first_row + end, col_num))))
+        return merges
+
+    def _check_table_options(self):
+        """Raise an error if the table cannot be written as Excel table with to_excel(as_table=...)"""
+        if not self.has_header:
+            raise Exception("to_excel(as_table=...) needs the header - Excel tables always have a header row. Please use header=True.")
+        if isinstance(self.header, pd.MultiIndex):
+            raise Exception(
+                "to_excel(as_table=...) does not support MultiIndex columns because Excel tables have a single header row. Please flatten the columns first e.g. df.columns = [' '.join(col) for col in df.columns]."
+            )
+
+    def _get_table_column_names(self):
+        """Excel table column names incl. the index names - unique (case-insensitive) texts, missing names are named "Column1", "Column2", ... like in Excel"""
+        labels = (list(self.index.names) if self.has_index else []) + list(self.header)
+        names, seen = [], set()
+        for i, label in enumerate(labels, start=1):
+            name = f"Column{i}" if label is None or label != label or str(label) == "" else str(label)
+            unique_name, n = name, 2
+            while unique_name.lower() in seen:
+                unique_name, n = f"{name}{n}", n + 1
+            seen.add(unique_name.lower())
+            names.append(unique_name)
+        return names
+
+    def _get_table_style(self):
+        """
+        Table style name and if its rows are banded for to_excel(as_table=...) - as_table=True compiles the theme table
+        styling into a custom table style of the workbook, a string is the name of a built-in or existing table style
+        """
+        if isinstance(self.as_table, str):
+            return self.as_table, True
+        theme_table = self.excelwriter.theme.get("table")
+        if not self.use_theme_style or not theme_table:
+            return "TableStyleMedium2", True
+        theme_name = os.path.splitext(os.path.basename(str(self.excelwriter.theme_name)))[0]
+        theme_table = {level: self._extend_style_args(level_styling) for level, level_styling in theme_table.items()}
+        element_styles = {
+            "wholeTable": {**theme_table.get("base", {}), **theme_table.get("body", {})},
+            "headerRow": theme_table.get("head", {}),
+            "firstColumn": theme_table.get("index", {}),
+        }
+        return build_table_style(self.writer.book, "beautifulexcel_" + re.sub(r"\W", "_", theme_name), element_styles), False
 
+    def _get_table_ref(self):
+        """Excel ref of the table area - Excel tables need at least one body row"""
+        (first_row, first_col), (end_row, end_col) = self.shape
+        return self.util_range_ref_from_coordinates(((first_row, first_col), (max(end_row, first_row + 2) - 1, end_col - 1)))
+
+    def _add_table(self):
+        """Add the written dataframe as Excel table with its table style and filter buttons (to_excel(as_table=...))"""
+        ws = self.ws
+        table_names = {name.lower() for i_ws in self.writer.book.worksheets for name in i_ws.tables.keys()}
+        table_num = 1
+        while f"table{table_num}" in table_names:
+            table_num += 1
+        ref = self._get_table_ref()
+        style_name, banded_rows = self._get_table_style()
+        table = Table(
+            displayName=f"Table{table_num}",
+            ref=ref,
+            autoFilter=AutoFilter(ref=ref),
+            tableStyleInfo=TableStyleInfo(
+                name=style_name,
+                showFirstColumn=bool(self.has_index),
+                showLastColumn=False,
+                showRowStripes=banded_rows,
+                showColumnStripes=False,
+            ),
+        )
+        table.tableColumns = [TableColumn(id=i, name=name) for i, name in enumerate(self.table_columns, start=1)]
+        if hasattr(ws, "_get_cell"):
+            ws.add_table(table)
+        else:
+            # ws.add_table() of write-only worksheets warns that the table columns need to be added manually - already
+            # done above
+            if self.writer.book._duplicate_name(table.name):
+                raise ValueError(f"Table with name {table.name} already exists")
+            ws._tables.add(table)
+        self.table = table
 
     def add_data_validation(self,
             ref: Union[str, List[str]],
@@ -573,35 +1063,666 @@ class DataframeSheet(Sheet):
         """
         if isinstance(ref, str):
             ref = [ref]
-        ref = [self.util_range_ref_from_coordinates(self.util_get_range_coordinates(i, enrich_dimensions=True)) if i in self.header else i for i in ref]
         super().add_data_validation(ref=ref, type=type, props=props, operator=operator, **kwargs)
 
 
-    def util_get_cell_coordinates(self, ref):
+    def _parse_cell_ref(self, ref):
         """
-        Get cell coordinates
+        Cell coordinates of a column name, index name, row number, column letter, or cell ref
 
         Examples:
             >>> ws.util_get_cell_coordinates(ref='employees')
-            (N, 3)
+            (None, 3)
             >>> ws.util_get_cell_coordinates(ref='A2')
             (2, 1)
-            >>> ws.util_get_cell_coordinates(ref='A')
-            (None, 1)
-            >>> ws.util_get_cell_coordinates(ref='1')
-            (1, None)
-            >>> ws.util_get_cell_coordinates(ref='-1')
-            (-1, None)
         """
-        ref = str(ref)
-        if not ref.isdigit() or not (len(ref) >= 2 and ref[0] == '-' and ref[1:].isdigit()):
-            # for normal column name
-            if ref in self.header:
-                ref = openpyxl.utils.cell.get_column_letter((self.header.get_loc(ref) + 1) + self.index_depth + self.startcol)
-            # for column name that is part of index
-            elif self.has_index and ref in list(self.index.names):
-                ref = openpyxl.utils.cell.get_column_letter(list(self.index.names).index(ref) + self.startcol + 1)
-        return super().util_get_cell_coordinates(ref)
+        col_num = self._column_numbers.get(ref)
+        if col_num is not None:
+            return (None, col_num)
+        return super()._parse_cell_ref(ref)
+
+    def _get_column_numbers(self):
+        """Column number of every (text) column name and index name {name: col_num} - the first column of duplicate names"""
+        column_numbers = {}
+        if not isinstance(self.header, pd.MultiIndex):
+            for col_num, label in enumerate(self.header, start=self.startcol + self.index_depth + 1):
+                if isinstance(label, str):
+                    column_numbers.setdefault(label, col_num)
+        if self.has_index:
+            for col_num, name in enumerate(self.index.names, start=self.startcol + 1):
+                if isinstance(name, str):
+                    column_numbers.setdefault(name, col_num)
+        return column_numbers
+
+
+class AppendDataframeSheet(DataframeSheet):
+    """
+    DataFrame Excel Sheet class for to_excel(mode="append") that writes only the new rows below the table of an existing
+    sheet e.g. of ExcelWriter(mode="modify") - the cell styles and number formats of the last table row are reused and
+    the Excel tables, data validations, and autofit column widths of the table are extended to the new rows
+
+    Note: The table has to be appended with the same startrow, startcol, index, and header arguments as it was written
+    """
+
+    def _write_table(self, col_widths):
+        """Find the end of the existing table and append the rows below it"""
+        df = self.df
+        ws = self.ws = self.writer.book[self.sheet_name]
+        self._check_header()
+
+        # the table ends in the last row of the sheet
+        body_start = self.startrow + self.header_depth + 1
+        self.table_height = max(ws.max_row + 1 - body_start, 0)
+        self.df = df.iloc[:0]
+        self._set_shapes()
+
+        # existing column widths - the manual column widths are applied and the autofit columns are only widened
+        fixed_col_widths = {col_idx: col_widths[col_idx] for col_idx in self._fixed_col_widths}
+        self._col_widths = dict(fixed_col_widths)
+        for col_idx in range(self.startcol, self.shape[1][1] - 1):
+            dimension = ws.column_dimensions.get(openpyxl.utils.get_column_letter(col_idx + 1))
+            if col_idx not in fixed_col_widths and dimension is not None and dimension.customWidth:
+                self._col_widths[col_idx] = dimension.width
+        with self.stats.phase("col_widths"):
+            self.change_col_widths(fixed_col_widths)
+
+        self.append_rows(df)
+
+    def _check_header(self):
+        """Raise an error if the header of the existing table does not match the dataframe columns"""
+        if not self.has_header:
+            return
+        ws = self.ws
+        row_num = self.startrow + self.header.nlevels
+        first_col = self.startcol + self.index_depth + 1
+        # incl. the next header cell that is empty if the table has no further columns
+        labels = [ws._cells[row_num, col_num].value if (row_num, col_num) in ws._cells else None for col_num in range(first_col, first_col + self.table_width + 1)]
+        labels = [None if label is None else str(label) for label in labels]
+        expected = [str(label) for label in self.header.get_level_values(-1)] + [None]
+        table_names = self._get_table_column_names()[self.index_depth :] + [None]
+        if labels != expected and labels != table_names:
+            raise Exception(
+                f'The columns {expected[:-1]} cannot be appended to the table of the sheet "{self.sheet_name}" with the columns {[label for label in labels if label is not None]}. Please use the same columns and startrow, startcol, index, and header arguments as for the existing table.'
+            )
+
+    def _write_styled_rows(self, body_rows=None):
+        """Write the rows with the cell styles of the last table row - the theme styling is only used for tables without rows"""
+        template_row = body_rows[0] - 1
+        if template_row < self.shape_body[0][0]:
+            return super()._write_styled_rows(body_rows=body_rows)
+
+        ws = self.ws
+        cells = ws._cells
+        first_col = self.startcol + 1
+        template_styles = []
+        for col_num in range(first_col, self.shape[1][1]):
+            cell = cells.get((template_row, col_num))
+            template_styles.append(cell._style if cell is not None and cell.has_style else None)
+        # template cell style with the number format of the value e.g. dates if the template cell has none
+        format_styles = {}
+        value_with_fmt = self.writer._value_with_fmt
+        df = self.df
+        cells_written = 0
+        with self.stats.phase("write_rows"):
+            for chunk_start in range(0, len(df), 10_000):
+                chunk = df.iloc[chunk_start : chunk_start + 10_000]
+                columns = [_to_python_values(chunk.index.get_level_values(level)) for level in range(self.index_depth)]
+                columns += [_to_python_values(chunk.iloc[:, i]) for i in range(self.table_width)]
+                for row_num, row_values in zip(count(body_rows[0] + chunk_start), zip(*columns)):
+                    for col_num, value, style in zip(count(first_col), row_values, template_styles):
+                        if value is None:
+                            if style is None:
+                                continue
+                        else:
+                            value, number_format = value_with_fmt(value)
+                            if number_format and (style is None or style.numFmtId == 0):
+                                key = (col_num, number_format)
+                                if key not in format_styles:
+                                    cell = openpyxl.cell.Cell(ws, style_array=copy(style))
+                                    cell.number_format = number_format
+                                    format_styles[key] = cell._style
+                                style = format_styles[key]
+                        cells[row_num, col_num] = openpyxl.cell.Cell(ws, row=row_num, column=col_num, value=value, style_array=copy(style))
+                        cells_written += 1
+        self.excelwriter.style_cache.cells += cells_written
+
+
+class StreamingDataframeSheet(DataframeSheet):
+    """
+    DataFrame Excel Sheet class for ExcelWriter(streaming=True) that writes the styled rows one by one into an openpyxl
+    write-only worksheet so that the memory usage does not grow with the sheet size
+
+    Note: Methods that need random access to already written cells or rows are not available in streaming mode
+    """
+
+    def _write_table(self, col_widths):
+        """Stream the styled rows into a new write-only worksheet"""
+        if self.sheet_name in self.writer.book.sheetnames:
+            raise Exception(
+                f'The sheet "{self.sheet_name}" was already written. With ExcelWriter(streaming=True) every sheet can only be written once by a single .to_excel() call.'
+            )
+        self.ws = self.writer.book.create_sheet(self.sheet_name)
+
+        # column widths need to be defined before the first row is written
+        self._rows_written = False
+        with self.stats.phase("col_widths"):
+            self.change_col_widths(col_widths)
+
+        self._next_row_num = 1
+        self._write_styled_rows()
+
+    def _write_rows(self, table_style):
+        """Append the styled rows of the resolved table style to the write-only worksheet"""
+        ws = self.ws
+        style_cache = self.excelwriter.style_cache
+        empty_cols = [None] * self.startcol
+        for row_num, cells in self._iter_table_rows(table_style):
+            while self._next_row_num < row_num:
+                ws.append([])
+                self._next_row_num += 1
+
+            row = empty_cols.copy()
+            for col_num, value, number_format, bundle in cells:
+                if bundle is None:
+                    row.append(None)
+                    continue
+                cell = openpyxl.cell.WriteOnlyCell(ws, value)
+                if number_format:
+                    cell.number_format = number_format
+                row.append(style_cache.apply(cell, bundle))
+            ws.append(row)
+            self._next_row_num += 1
+        self._rows_written = True
+
+        for ref in self._get_label_merges(table_style):
+            self._merge_cells(ref)
+
+    def _raise_random_access_error(self, method):
+        """Raise an error for methods that are not available in streaming mode"""
+        raise Exception(
+            f"{method} is not available with ExcelWriter(streaming=True) because the rows of the sheet are already written. Please use ExcelWriter(streaming=False) instead."
+        )
+
+    def _row_styles_possible(self):
+        """Row dimensions of write-only worksheets cannot be styled"""
+        return False
+
+    def _widen_col_widths(self, df):
+        """The column widths of write-only worksheets cannot be changed once rows are written"""
+        pass
+
+    def _merge_cells(self, ref):
+        """Merge a single cell range e.g. 'A1:C5' - only possible via the merged cells list in write-only worksheets"""
+        self.ws.merged_cells.add(ref)
+
+    def apply_cell_style(self, row_num, col_num, style):
+        self._raise_random_access_error(".apply_cell_style()")
+
+    def change_col_widths(self, col_widths: dict):
+        if self._rows_written:
+            self._raise_random_access_error(".change_col_widths()")
+        super().change_col_widths(col_widths)
+
+    def group_columns(self, ref: str):
+        self._raise_random_access_error(".group_columns()")
+
+    def group_rows(self, ref):
+        self._raise_random_access_error(".group_rows()")
+
+    def write_cell(self, ref: str, content):
+        self._raise_random_access_error(".write_cell()")
+
+
+class XlsxWriterDataframeSheet(DataframeSheet):
+    """
+    DataFrame Excel Sheet class for ExcelWriter(engine="xlsxwriter") that writes every styled cell exactly once with
+    cached xlsxwriter Formats
+
+    Note: xlsxwriter cannot read or restyle already written cells, so .apply_cell_style() is not available
+    """
+
+    def _write_table(self, col_widths):
+        """Write the styled cells into a (new) xlsxwriter worksheet"""
+        book = self.writer.book
+        self.ws = book.get_worksheet_by_name(self.sheet_name) or book.add_worksheet(self.sheet_name)
+        self._write_styled_rows()
+        with self.stats.phase("col_widths"):
+            self.change_col_widths(col_widths)
+
+    def _write_rows(self, table_style):
+        """Write the styled cells of the resolved table style with cached xlsxwriter Formats"""
+        ws = self.ws
+        format_cache = self.excelwriter.format_cache
+        style_cache = self.excelwriter.style_cache
+        header_row = self.shape_header[0][0] if self.as_table and "head" in table_style else None
+        for row_num, cells in self._iter_table_rows(table_style):
+            style_cache.cells += len(cells)
+            if row_num == header_row:
+                # add_table() writes the header cells again with these formats
+                self._header_formats = [format_cache.get(bundle, number_format) for _, _, number_format, bundle in cells]
+            for col_num, value, number_format, bundle in cells:
+                if bundle is None:
+                    continue
+                cell_format = format_cache.get(bundle, number_format)
+                if value is None:
+                    ws.write_blank(row_num - 1, col_num - 1, None, cell_format)
+                else:
+                    ws.write(row_num - 1, col_num - 1, value, cell_format)
+
+        for ref in self._get_label_merges(table_style):
+            self._merge_cells(ref)
+
+    def _set_column(self, col_idx, **options):
+        """Update the width/outline options of a single column - xlsxwriter only keeps the last set_column() call"""
+        col_options = self.excelwriter.col_options.setdefault(self.sheet_name, {}).setdefault(col_idx, {})
+        col_options.update(options)
+        width = col_options.get("width")
+        self.ws.set_column(
+            col_idx,
+            col_idx,
+            # openpyxl writes the width as is but xlsxwriter adds the cell padding of 5px (5/7 of a character)
+            None if width is None else max(width - 5 / 7, 0),
+            col_options.get("cell_format"),
+            {key: value for key, value in col_options.items() if key not in ["width", "cell_format"]},
+        )
+
+    def _row_styles_possible(self):
+        """Rows written with constant_memory=True (streaming) cannot be changed anymore"""
+        return not self.excelwriter.streaming
+
+    def _set_default_styles(self, cols, rows):
+        """Set the column and row default styles as xlsxwriter column/row formats"""
+        format_cache = self.excelwriter.format_cache
+        for col_num, bundle in cols.items():
+            self._set_column(col_num - 1, cell_format=format_cache.get(bundle))
+        for band_start, band_end, bundle in rows:
+            cell_format = format_cache.get(bundle)
+            for row_num in range(band_start, band_end):
+                self.ws.set_row(row_num - 1, None, cell_format)
+
+    def _check_table_options(self):
+        """xlsxwriter can only use built-in table styles and cannot add tables to already streamed rows"""
+        super()._check_table_options()
+        if self.as_table is True:
+            raise Exception(
+                'ExcelWriter(engine="xlsxwriter") cannot add custom table styles compiled from the theme. Please pass the name of a built-in table style e.g. to_excel(as_table="TableStyleMedium2") or use engine="openpyxl".'
+            )
+        if self.excelwriter.streaming:
+            self._raise_not_supported_error("to_excel(as_table=...) in streaming mode")
+
+    def _add_table(self):
+        """Add the written dataframe as Excel table with a built-in table style and filter buttons (to_excel(as_table=...))"""
+        min_col, min_row, max_col, max_row = openpyxl.utils.cell.range_boundaries(self._get_table_ref())
+        self.ws.add_table(
+            min_row - 1,
+            min_col - 1,
+            max_row - 1,
+            max_col - 1,
+            {
+                "style": self.as_table,
+                "columns": [{"header": name, "header_format": cell_format} for name, cell_format in zip(self.table_columns, self._header_formats)],
+                "first_column": bool(self.has_index),
+                "banded_rows": True,
+                "autofilter": True,
+            },
+        )
+
+    def _extend_ranges(self, last_row, table_ref):
+        """Extend the xlsxwriter tables and data validations of the table columns that end in the former last table row down to the new last row"""
+        (_, first_col), (end_row, end_col) = self.shape
+        new_table_ref = self._get_table_ref()
+        for table in self.ws.tables:
+            if table["range"] == table_ref:
+                table["range"] = table["a_range"] = new_table_ref
+                if table["autofilter"]:
+                    table["autofilter"] = new_table_ref
+        for validation in self.ws.validations:
+            for cells in validation["cells"]:
+                if cells[2] == last_row - 1 and first_col - 1 <= cells[1] and cells[3] < end_col - 1:
+                    cells[2] = end_row - 2
+
+    def _raise_not_supported_error(self, method):
+        """Raise an error for methods that xlsxwriter does not support"""
+        raise Exception(f'{method} is not available with ExcelWriter(engine="xlsxwriter"). Please use engine="openpyxl" instead.')
+
+    def apply_cell_style(self, row_num, col_num, style):
+        self._raise_not_supported_error(".apply_cell_style()")
+
+    def change_col_widths(self, col_widths: dict):
+        for col, width in col_widths.items():
+            col_idx = openpyxl.utils.column_index_from_string(col) - 1 if isinstance(col, str) else col
+            self._set_column(col_idx, width=width)
+
+    def _merge_cells(self, ref):
+        """Merge a single cell range e.g. 'A1:C5' - the already written top left cell is kept and the other cells are cleared like in openpyxl"""
+        min_col, min_row, max_col, max_row = openpyxl.utils.cell.range_boundaries(ref)
+        for row_idx in range(min_row - 1, max_row):
+            row_cells = self.ws.table.get(row_idx)
+            if row_cells:
+                for col_idx in range(min_col - 1, max_col):
+                    if (row_idx, col_idx) != (min_row - 1, min_col - 1):
+                        row_cells.pop(col_idx, None)
+        self.ws.merge_range(min_row - 1, min_col - 1, max_row - 1, max_col - 1, None)
+
+    def _group(self, axis, ref_start, ref_end, hidden=False, outline_level=1):
+        """Group the columns e.g. 'A' to 'C' or rows e.g. '1' to '3' in the worksheet"""
+        if axis == 'columns':
+            for col_idx in range(openpyxl.utils.column_index_from_string(ref_start) - 1, openpyxl.utils.column_index_from_string(ref_end)):
+                self._set_column(col_idx, level=outline_level, hidden=hidden)
+        elif axis == 'rows':
+            if self.excelwriter.streaming:
+                self._raise_not_supported_error(".group_rows() in streaming mode")
+            for row_idx in range(int(ref_start) - 1, int(ref_end)):
+                self.ws.set_row(row_idx, None, None, {"level": outline_level, "hidden": hidden})
+
+    def _add_data_validation(self, refs, type, formula1, formula2, operator, **kwargs):
+        """Translate the openpyxl data validation arguments to xlsxwriter and add them for all cell ranges"""
+        options = {"validate": XLSXWRITER_VALIDATION_TYPES.get(type, type)}
+        if options["validate"] == "list":
+            if isinstance(formula1, str) and formula1.startswith('"') and formula1.endswith('"'):
+                options["source"] = formula1[1:-1].split(",")
+            else:
+                options["source"] = formula1
+        elif options["validate"] == "custom":
+            options["value"] = formula1
+        elif formula1 is None:
+            if options["validate"] in ["integer", "decimal"]:
+                options.update({"criteria": "between", "minimum": -2_147_483_647, "maximum": 2_147_483_647})
+            else:
+                options["validate"] = "any"
+        else:
+            options["criteria"] = XLSXWRITER_VALIDATION_OPERATORS.get(operator, operator) or ("between" if formula2 is not None else "equal to")
+            if formula2 is not None:
+                options.update({"minimum": formula1, "maximum": formula2})
+            else:
+                options["value"] = formula1
+
+        for key, value in kwargs.items():
+            if key == "showDropDown":
+                # openpyxl/Excel showDropDown=True actually hides the dropdown
+                options["dropdown"] = not value
+            elif key in XLSXWRITER_VALIDATION_KWARGS:
+                options[XLSXWRITER_VALIDATION_KWARGS[key]] = value
+            else:
+                warn(f'The data validation kwarg "{key}" is not supported by xlsxwriter and is ignored.')
+
+        for i_ref in refs:
+            min_col, min_row, max_col, max_row = openpyxl.utils.cell.range_boundaries(i_ref)
+            self.ws.data_validation(
+                (min_row or 1) - 1, (min_col or 1) - 1, (max_row or 1_048_576) - 1, (max_col or 16_384) - 1, options
+            )
+
+    def write_cell(self, ref: str, content):
+        if self.excelwriter.streaming:
+            self._raise_not_supported_error(".write_cell() in streaming mode")
+        self.ws.write(ref, content)
+
+
+class XmlDataframeSheet(DataframeSheet):
+    """
+    DataFrame Excel Sheet class for ExcelWriter(engine="xml") that writes the worksheet rows directly as xml from the
+    dataframe columns instead of creating an openpyxl cell per value
+
+    Note: The rows are only inserted into the file when the workbook is saved, so methods that need access to the
+    written cells (e.g. .write_cell(), .group_rows()) are not available
+    """
+
+    def _write_table(self, col_widths):
+        """Create an empty placeholder worksheet and write the styled rows as xml into a temporary file"""
+        excelwriter = self.excelwriter
+        book = self.writer.book
+        if self.sheet_name in excelwriter.rendered_sheets:
+            raise Exception(
+                f'The sheet "{self.sheet_name}" was already written. With ExcelWriter(engine="xml") every sheet can only be written once by a single .to_excel() call.'
+            )
+        if self.sheet_name in book.sheetnames:
+            if excelwriter.if_sheet_exists != "replace":
+                raise Exception(f'The sheet "{self.sheet_name}" already exists. ExcelWriter(engine="xml") can only replace existing sheets.')
+            sheet_index = book.sheetnames.index(self.sheet_name)
+            book.remove(book[self.sheet_name])
+            self.ws = book.create_sheet(self.sheet_name, sheet_index)
+        else:
+            self.ws = book.create_sheet(self.sheet_name)
+
+        # the rows of small sheets stay in memory, larger sheets are buffered in a temporary file until the workbook is saved
+        self._sheet_data = tempfile.SpooledTemporaryFile(max_size=SHEET_DATA_MEMORY_SIZE)
+        self._written_rows = None
+        excelwriter.rendered_sheets[self.sheet_name] = (self.ws, self._insert_sheet_data, 0)
+
+        self._write_styled_rows()
+        with self.stats.phase("col_widths"):
+            self.change_col_widths(col_widths)
+
+    def _write_rows(self, table_style, chunk_size=10_000):
+        """Write the rows of the resolved table style as xml column by column - the dataframe is converted chunk by chunk"""
+        ws = self.ws
+        style_cache = self.excelwriter.style_cache
+        value_with_fmt = self.writer._value_with_fmt
+        first_col = self.startcol + 1
+        col_letters = [openpyxl.utils.get_column_letter(col_num) for col_num in range(first_col, self.shape[1][1])]
+
+        # table header
+        if "head" in table_style:
+            (header_start, _), _ = table_style["head"][0]
+            header_bundles = [row_bundles for band_start, band_end, row_bundles in table_style["head"][1] for _ in range(band_start, band_end)]
+            for row_num, row_values, row_bundles in zip(range(header_start, self.shape_header[1][0]), self._get_header_rows(), header_bundles):
+                cells = []
+                for col_letter, value, bundle in zip(col_letters, row_values, row_bundles):
+                    content, number_format = (EMPTY_CELL, None) if value is None else encode_value(value, ws, value_with_fmt)
+                    style_id = style_cache.get_style_id(ws, bundle, number_format)
+                    cells.append(f'<c r="{col_letter}{row_num}"' + (f' s="{style_id}"' if style_id else "") + content)
+                self._write_sheet_data(row_num, row_num + 1, [[cell] for cell in cells])
+
+        # table index and body
+        df = self.df
+        body_start = table_style["body"][0][0][0]
+        areas = (["index"] if self.has_index else []) + ["body"]
+        band_starts = {area: np.array([band_start for band_start, _, _ in table_style[area][1]]) for area in areas}
+        index_hidden = self._get_index_hidden_labels()
+        default_styles = self._default_styles
+        if default_styles is not None:
+            # empty body cells with the default style of their column/row are not written and rows with a default style get it as row style
+            default_band_starts = np.array([band_start for band_start, _ in default_styles.bands])
+            row_style_ids = np.zeros(len(default_styles.bands), dtype=int)
+            for band_start, band_end, bundle in default_styles.rows:
+                row_style_ids[default_band_starts == band_start] = style_cache.get_style_id(ws, bundle)
+            row_style_attrs = np.where(
+                row_style_ids == 0, "", np.char.add(np.char.add(' s="', row_style_ids.astype(str)), '" customFormat="1"')
+            )
+            cells_omitted = 0
+        for chunk_start in range(0, len(df), chunk_size):
+            chunk = df.iloc[chunk_start : chunk_start + chunk_size]
+            row_nums = np.arange(body_start + chunk_start, body_start + chunk_start + len(chunk))
+            row_strs = row_nums.astype(str)
+            band_idx = {area: np.searchsorted(band_starts[area], row_nums, side="right") - 1 for area in areas}
+            row_attrs = None
+            if default_styles is not None:
+                default_band_idx = np.searchsorted(default_band_starts, row_nums, side="right") - 1
+                row_attrs = row_style_attrs[default_band_idx]
+
+            columns = []
+            if self.has_index:
+                for level in range(self.index_depth):
+                    columns.append(("index", level, chunk.index.get_level_values(level), index_hidden[level][chunk_start : chunk_start + chunk_size]))
+            columns += [("body", i, chunk.iloc[:, i], None) for i in range(self.table_width)]
+
+            cols_xml = []
+            for col_letter, (area, area_col, values, hidden) in zip(col_letters, columns):
+                contents, codes, content_formats, number_formats = encode_column(values, ws, value_with_fmt, self.excelwriter.shared_strings)
+                if hidden is not None:
+                    codes[hidden] = -1
+                style_ids = np.array(
+                    [
+                        [style_cache.get_style_id(ws, row_bundles[area_col], number_format) for number_format in number_formats]
+                        for _, _, row_bundles in table_style[area][1]
+                    ]
+                )
+                cell_style_ids = style_ids[band_idx[area], content_formats[codes]]
+                col_xml = cells_xml(col_letter, row_strs, cell_style_ids, contents[codes])
+                if default_styles is not None and area == "body":
+                    omitted = (codes == -1) & default_styles.omit[default_band_idx, area_col]
+                    col_xml[omitted] = ""
+                    cells_omitted += int(omitted.sum())
+                cols_xml.append(col_xml.tolist())
+            self._write_sheet_data(row_nums[0], row_nums[-1] + 1, cols_xml, row_strs, row_attrs)
+        if default_styles is not None:
+            self.stats.count("cells_omitted", cells_omitted)
+
+        for ref in self._get_label_merges(table_style):
+            self._merge_cells(ref)
+
+    def _write_sheet_data(self, start_row, end_row, cols_xml, row_strs=None, row_attrs=None):
+        """Append the <row> elements of the rows start_row to end_row (exclusive) with the <c> elements per column and further row attributes e.g. ' s="3" customFormat="1"'"""
+        if row_strs is None:
+            row_strs = [str(row_num) for row_num in range(start_row, end_row)]
+        if row_attrs is None:
+            rows_xml = ["<row r=\"" + row_str + "\">" for row_str in row_strs]
+        else:
+            rows_xml = ["<row r=\"" + row_str + "\"" + row_attr + ">" for row_str, row_attr in zip(row_strs, row_attrs.tolist())]
+        self._sheet_data.write("".join(chain.from_iterable(zip(rows_xml, *cols_xml, ["</row>"] * len(rows_xml)))).encode("utf-8"))
+        self.excelwriter.style_cache.cells += len(rows_xml) * len(cols_xml)
+        start_row = start_row if self._written_rows is None else self._written_rows[0]
+        self._written_rows = (int(start_row), int(end_row))
+        # the size of the rendered sheet decides upfront if its zip entry needs zip64 extensions
+        self.excelwriter.rendered_sheets[self.sheet_name] = (self.ws, self._insert_sheet_data, self._sheet_data.tell())
+
+    def _insert_sheet_data(self, xml, dst):
+        """Insert the written rows into the saved worksheet xml of the placeholder worksheet"""
+        dimension = "A1"
+        if self._written_rows is not None:
+            dimension = self.util_range_ref_from_coordinates(((self._written_rows[0], self.startcol + 1), (self._written_rows[1] - 1, self.shape[1][1] - 1)))
+        insert_sheet_data(xml, dst, self._sheet_data, dimension)
+
+    def _set_default_styles(self, cols, rows):
+        """Set the column default styles in the placeholder worksheet - the row default styles are written with the rows"""
+        super()._set_default_styles(cols, [])
+
+    def _raise_not_supported_error(self, method):
+        """Raise an error for methods that need access to the written cells"""
+        raise Exception(f'{method} is not available with ExcelWriter(engine="xml"). Please use engine="openpyxl" instead.')
+
+    def _merge_cells(self, ref):
+        """Merge a single cell range e.g. 'A1:C5' - only the merged cells list is changed as the rows are not in the worksheet"""
+        self.ws.merged_cells.add(ref)
+
+    def apply_cell_style(self, row_num, col_num, style):
+        self._raise_not_supported_error(".apply_cell_style()")
+
+    def group_rows(self, ref):
+        self._raise_not_supported_error(".group_rows()")
+
+    def write_cell(self, ref: str, content):
+        self._raise_not_supported_error(".write_cell()")
+
+
+# column width per character of the autofit text length
+COL_WIDTH_CHARACTER_FACTOR = 1.28
+
+# rows of ExcelWriter(engine="xml") that are buffered in memory before they are moved into a temporary file (in bytes)
+SHEET_DATA_MEMORY_SIZE = 64 * 1024 * 1024
+
+XLSXWRITER_VALIDATION_TYPES = {"whole": "integer", "textLength": "length", "formula": "custom"}
+XLSXWRITER_VALIDATION_OPERATORS = {
+    "notBetween": "not between",
+    "equal": "equal to",
+    "notEqual": "not equal to",
+    "greaterThan": "greater than",
+    "lessThan": "less than",
+    "greaterThanOrEqual": "greater than or equal to",
+    "lessThanOrEqual": "less than or equal to",
+}
+XLSXWRITER_VALIDATION_KWARGS = {
+    "allow_blank": "ignore_blank",
+    "allowBlank": "ignore_blank",
+    "showErrorMessage": "show_error",
+    "showInputMessage": "show_input",
+    "error": "error_message",
+    "errorTitle": "error_title",
+    "prompt": "input_message",
+    "promptTitle": "input_title",
+    "errorStyle": "error_type",
+}
+
+
+def _to_python_values(values):
+    """Convert a pandas Series/Index into a list of python objects with None for missing values"""
+    values = pd.Series(values, copy=False)
+    python_values = values.astype(object).to_numpy(copy=True)
+    python_values[values.isna().to_numpy()] = None
+    return python_values.tolist()
+
+
+def _get_repeated_labels(multi_index):
+    """Boolean array per MultiIndex level that is True if the label and all its parent labels repeat the previous ones"""
+    codes = np.array(multi_index.codes).reshape(multi_index.nlevels, len(multi_index))
+    repeated = np.zeros(codes.shape, dtype=bool)
+    repeated[:, 1:] = codes[:, 1:] == codes[:, :-1]
+    return np.logical_and.accumulate(repeated, axis=0)
+
+
+def _estimate_col_lengths(df, index=False, header=True, sample_size=None):
+    """
+    Estimate the text length of each exported index level and column from the 80% quantile of the cell text lengths of
+    at most sample_size evenly spaced rows and from the header labels - returns None for columns without an estimate
+    """
+    positions = sample_positions(len(df), sample_size)
+    sample = df if positions is None else df.iloc[positions]
+    cols = [pd.Series(sample.index.get_level_values(i), copy=False) for i in range(sample.index.nlevels)] if index else []
+    cols += [sample.iloc[:, i] for i in range(sample.shape[1])]
+    lengths = np.full(len(cols), np.nan)
+    min_lengths = np.zeros(len(cols))
+
+    # numbers: all columns at once with the length of the 80% quantile incl. thousands separators
+    is_numeric = np.array([pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_datetime64_any_dtype(col) for col in cols], dtype=bool)
+    numeric = np.flatnonzero(is_numeric)
+    if len(numeric) > 0 and len(sample) > 0:
+        values = np.column_stack([pd.Series(cols[i], copy=False).to_numpy(dtype=float, na_value=np.nan) for i in numeric])
+        highs = nan_quantiles(values, 0.8)
+        for i, high in zip(numeric, highs):
+            if np.isfinite(high):
+                lengths[i] = len("{:,}".format(int(high)))
+    min_lengths[numeric] = 6
+
+    for i, col in enumerate(cols):
+        # dates
+        if pd.api.types.is_datetime64_any_dtype(col):
+            lengths[i] = 10
+        # text: categories are measured once per category
+        elif not is_numeric[i] and len(col) > 0:
+            if isinstance(col.dtype, pd.CategoricalDtype):
+                category_lengths = np.append(col.cat.categories.astype(str).str.len().to_numpy(dtype=float), np.nan)
+                col_lengths = category_lengths[np.asarray(col.cat.codes)]
+            else:
+                col = col[col.notna()]
+                col = col if pd.api.types.is_string_dtype(col) else col.astype(str)
+                col_lengths = col.str.len().to_numpy(dtype=float)
+            if np.any(~np.isnan(col_lengths)):
+                lengths[i] = np.nanquantile(col_lengths, 0.8)
+            min_lengths[i] = 4
+
+    # header labels: labels merged over several columns are split between them
+    if header:
+        header_lengths = np.zeros(len(cols))
+        offset = sample.index.nlevels if index else 0
+        if index:
+            header_lengths[:offset] = [len(str(name)) if name is not None else 0 for name in sample.index.names]
+        columns = sample.columns
+        hidden = _get_repeated_labels(columns) if isinstance(columns, pd.MultiIndex) else np.zeros((1, len(columns)), dtype=bool)
+        for level, level_hidden in enumerate(hidden):
+            label_lengths = np.array([len(str(label)) for label in columns.get_level_values(level)], dtype=float)
+            spans = np.cumsum(~level_hidden)
+            label_lengths = label_lengths[~level_hidden][spans - 1] / np.bincount(spans)[spans]
+            header_lengths[offset:] = np.maximum(header_lengths[offset:], label_lengths)
+        lengths = np.fmax(lengths, np.where(header_lengths > 0, header_lengths, np.nan))
+
+    return [None if np.isnan(length) else float(max(length, min_length)) for length, min_length in zip(lengths, min_lengths)]
+
+
+def _get_spans(hidden):
+    """(start, end) positions of all spans longer than one of a label followed by hidden repetitions"""
+    starts = np.flatnonzero(~hidden)
+    ends = np.append(starts[1:], len(hidden)) - 1
+    return [(int(start), int(end)) for start, end in zip(starts, ends) if end > start]
 
 
 class ExcelWriter:
@@ -630,17 +1751,25 @@ class ExcelWriter:
         date_format: str = None,
         datetime_format: str = None,
         engine_kwargs: Any = {},
+        streaming: bool = False,
+        engine: str = "openpyxl", #Literal["openpyxl", "xlsxwriter"] = "openpyxl",
+        profile: bool = False,
+        profile_hook: Callable = None,
         **kwargs,
     ):
         """
         Args:
-            file (str): Path to xls or xlsx or ods file
-            mode (str): If the file already exists you can either "replace" or "modify" it
+            file (str or file object): Path to xls or xlsx or ods file or a writable binary file object e.g. io.BytesIO() or a (non-seekable) response stream - the xlsx package is written part by part into the file object while saving and is always a new workbook
+            mode (str): If the file already exists you can either "replace" or "modify" it, or "patch" it: only the sheets written with .to_excel() are regenerated (replacing existing sheets completely) and all other parts of the file are copied byte for byte, which is much faster for large files
             if_sheet_exists (str): If a excel sheet already exists raise an "error", create a "new" sheet with a different name, "replace" the existing sheet with the new one, or "overlay" the new contents with the old ones
             theme (str): Excel style name or path to theme yaml file
             date_format (str): Format string for dates written into Excel files (e. g. 'YYYY-MM-DD')
             datetime_format (str): Format string for datetime objects written into Excel files. (e. g. 'YYYY-MM-DD HH:MM:SS')
             engine_kwargs (str): keywords passed though to openpyxl in "replace"-mode: openpyxl.Workbook(**engine_kwargs); "modify"-mode: openpyxl.load_workbook(file, **engine_kwargs)
+            engine (str): Excel engine "openpyxl", "xlsxwriter" (faster for writing new files but cannot modify existing files), or "xml" (fastest - writes the dataframe rows directly as xml but cells cannot be changed after .to_excel())
+            streaming (bool): Write the styled rows one by one into write-only sheets to keep the memory usage constant for very large exports. Each sheet can only be written by a single .to_excel() call and methods that need access to already written cells (e.g. .write_cell(), .group_rows()) are not available. Only possible in "replace"-mode.
+            profile (bool): Record the durations of the export phases and counters of every sheet in writer.stats (a profiling.WorkbookStats object - use writer.stats.to_dict() for a plain dict)
+            profile_hook (Callable): Function that is called with writer.stats once the workbook is saved e.g. to send the stats to a metrics system (implies profile=True)
 
         Example:
             ```python
@@ -650,6 +1779,9 @@ class ExcelWriter:
                 ...
             ```
         """
+        time_start = time.perf_counter()
+        self.stats = WorkbookStats() if profile or profile_hook is not None else None
+        self.profile_hook = profile_hook
         self.file = file
         self.mode = mode
         self.if_sheet_exists = if_sheet_exists
@@ -658,9 +1790,38 @@ class ExcelWriter:
         self.date_format = date_format
         self.datetime_format = datetime_format
         self.engine_kwargs = engine_kwargs
+        self.streaming = streaming
+        self.engine = engine
+        self.rendered_sheets = {}
+        self.dataframe_sheets = []
+        is_path = isinstance(file, (str, os.PathLike))
+        file_exists = is_path and os.path.isfile(file)
+        # file objects are written by .save() directly - pandas only gets a placeholder
+        self.target = None if is_path else file
+
+        if not is_path:
+            if not callable(getattr(file, "write", None)):
+                raise Exception(f"ExcelWriter() needs a file path or a writable binary file object but got {type(file).__name__}.")
+            if mode in ["modify", "patch"]:
+                raise Exception(f'ExcelWriter(mode="{mode}") needs a file path - file objects can only be written as new workbooks with mode="replace".')
+            if not callable(getattr(file, "flush", None)):
+                self.target = _OutputStream(file)
+
+        if engine not in ["openpyxl", "xlsxwriter", "xml"]:
+            raise Exception(f'Unknown engine "{engine}". Available engines are: openpyxl, xlsxwriter, and xml.')
+        if engine == "xlsxwriter" and file_exists and mode in ["modify", "patch"]:
+            raise Exception('ExcelWriter(engine="xlsxwriter") can only create new files. Please use mode="replace" or engine="openpyxl".')
+
+        if streaming:
+            if file_exists and mode == "modify":
+                raise Exception('ExcelWriter(streaming=True) can only create new files or patch them. Please use mode="replace", mode="patch", or streaming=False.')
+            if engine == "xlsxwriter":
+                engine_kwargs = {**engine_kwargs, "options": {**engine_kwargs.get("options", {}), "constant_memory": True}}
+            else:
+                engine_kwargs = {**engine_kwargs, "write_only": True}
 
         # modify existing file
-        if os.path.isfile(file) and mode == "modify":
+        if file_exists and mode == "modify":
             self.writer = pd.ExcelWriter(
                 file,
                 engine="openpyxl",
@@ -675,11 +1836,31 @@ class ExcelWriter:
             # self.writer.sheets = {ws.title: ws for ws in self.writer.book.worksheets}
             self.file_mode = "modify"
 
+        # patch existing file - the sheets are written into an empty workbook with the cell styles of the file and only
+        # the written sheets and the styles are replaced in the file, all other parts are copied byte for byte
+        elif file_exists and mode == "patch":
+            if if_sheet_exists not in ["error", "replace"]:
+                raise Exception('ExcelWriter(mode="patch") can only replace existing sheets. Please use if_sheet_exists="replace" or "error".')
+            self.package = Package(file)
+            self.writer = pd.ExcelWriter(
+                io.BytesIO(),
+                engine="openpyxl",
+                mode="w",
+                date_format=date_format,
+                datetime_format=datetime_format,
+                engine_kwargs=engine_kwargs,
+                **kwargs,
+            )
+            self.style_table_sizes = None
+            if self.package.styles_xml is not None:
+                self.style_table_sizes = seed_style_tables(self.writer.book, self.package.styles_xml)
+            self.file_mode = "patch"
+
         # create new file
         else:
             self.writer = pd.ExcelWriter(
-                file,
-                engine="openpyxl",
+                file if is_path else io.BytesIO(),
+                engine="xlsxwriter" if engine == "xlsxwriter" else "openpyxl",
                 mode="w",
                 if_sheet_exists=None,
                 date_format=date_format,
@@ -689,34 +1870,30 @@ class ExcelWriter:
             )
             # self.writer.book = openpyxl.Workbook(**engine_kwargs)
             self.file_mode = "replace"
+            if not is_path and engine == "xlsxwriter":
+                # xlsxwriter writes the package into its file (object) when the workbook is closed
+                self.writer.book.filename = self.target
+
+        if engine == "xlsxwriter":
+            self.format_cache = XlsxWriterFormatCache(self.writer.book)
+            self.col_options = {}
+        # engine="xml" writes the texts of categorical and low-cardinality columns once into the shared strings table -
+        # mode="patch" copies the other parts unchanged so the sheets keep inline strings
+        self.shared_strings = SharedStrings() if engine == "xml" and self.file_mode != "patch" else None
 
         # explicitly no theme defined
         if theme is None or len(theme) == 0:
             self.theme = {}
+            self.style_cache = StyleCache()
 
-        # theme defined
+        # theme defined - compiled once per process and theme file version
         else:
-            # standard theme from package
-            if "." not in theme:
-                this_file_path = os.path.dirname(os.path.abspath(__file__))
-                theme = os.path.join(this_file_path, "themes", f"{theme}.yml")
-
-            # read in user yml theme file
-            try:
-                with open(theme, "r") as file:
-                    theme = yaml.safe_load(file)
-                    theme_converted = {}
-                    # flatten after level 2
-                    for level1_name, level1 in theme.items():
-                        if level1_name not in theme_converted:
-                            theme_converted[level1_name] = {}
-                        for level2_name, level2 in level1.items():
-                            if level2_name not in theme_converted:
-                                theme_converted[level1_name][level2_name] = {}
-                            theme_converted[level1_name][level2_name] = flatten_dict(level2)
-                    self.theme = theme_converted
-            except yaml.YAMLError as exc:
-                raise Exception(f"Error when reading in theme file from path '{theme}':", exc)
+            compiled_theme = load_theme(theme)
+            self.theme = compiled_theme.styles
+            self.style_cache = StyleCache(shared_bundles=compiled_theme.bundles)
+
+        if self.stats is not None:
+            self.stats.phases["setup"] = time.perf_counter() - time_start
 
     def __enter__(self):
         if not hasattr(self, "file"):
@@ -726,10 +1903,68 @@ class ExcelWriter:
         return self
 
     def save(self):
-        if callable(getattr(self.writer, "save", None)):
-            self.writer.save()
+        file_size = None
+        if self.file_mode == "patch":
+            with self._phase("package_rewrite"):
+                self._patch_package()
+        # openpyxl workbooks are written part by part into the file (object) - incl. the sheets rendered by engine="xml"
+        # and .to_excel_many()
+        elif self.engine != "xlsxwriter":
+            with self._phase("save"):
+                handles = self.writer._handles
+                dst = handles.handle if self.target is None else self.target
+                start = dst.tell() if callable(getattr(dst, "seekable", None)) and dst.seekable() else None
+                _save_workbook(self.writer.book, dst, self.rendered_sheets, self.shared_strings)
+                if start is not None:
+                    file_size = dst.tell() - start
+                if self.target is None:
+                    # mode="modify" overwrites the opened file
+                    dst.truncate()
+                handles.close()
+        elif callable(getattr(self.writer, "save", None)):
+            with self._phase("save"):
+                self.writer.save()
         else:
-            self.writer._save()
+            with self._phase("save"):
+                self.writer._save()
+
+        if self.stats is not None:
+            self.stats.counters["styles"] = len(self.style_cache.bundles)
+            if isinstance(self.file, (str, os.PathLike)) and os.path.isfile(self.file):
+                self.stats.counters["file_size_bytes"] = os.path.getsize(self.file)
+            elif file_size is not None:
+                self.stats.counters["file_size_bytes"] = file_size
+            if self.profile_hook is not None:
+                self.profile_hook(self.stats)
+
+    def _discard(self):
+        """Close the incomplete workbook without saving it - the file that was (re)created by ExcelWriter() is removed"""
+        self.writer._handles.close()
+        if self.file_mode == "replace" and isinstance(self.file, (str, os.PathLike)) and os.path.isfile(self.file):
+            os.remove(self.file)
+
+    def _patch_package(self):
+        """Replace or add the written sheets and the new cell styles in the existing file (mode="patch")"""
+        book = self.writer.book
+        sheets = {}
+        for ws in book.worksheets:
+            rendered = self.rendered_sheets.get(ws.title)
+            if rendered is None or rendered[0] is not ws:
+                sheets[ws.title] = _worksheet_xml(ws, self.streaming)
+            elif callable(rendered[1]):
+                # rows of engine="xml" are inserted into the placeholder sheet
+                sheets[ws.title] = lambda dst, part=rendered[1], xml=_worksheet_xml(ws, self.streaming): part(xml, dst)
+            else:
+                sheets[ws.title] = rendered[1]
+
+        styles_xml = None
+        if self.style_table_sizes is not None:
+            styles_xml = append_style_tables(self.package.styles_xml, book, self.style_table_sizes)
+        self.package.patch(sheets, styles_xml)
+
+    def _phase(self, name):
+        """Context manager that records the duration of a workbook phase if profiling"""
+        return self.stats.phase(name) if self.stats is not None else nullcontext()
 
     def __exit__(self, type, value, traceback):
         # ToDo: add exception handling here
@@ -739,7 +1974,7 @@ class ExcelWriter:
 
     def to_excel(
         self,
-        df: pd.DataFrame,
+        df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
         sheet_name: str,
         startrow: int = 0,
         startcol: int = 0,
@@ -749,13 +1984,18 @@ class ExcelWriter:
         use_base_style: bool = True,
         col_widths: dict = {},
         col_autofit: bool = True,
+        col_autofit_sample: int = 10_000,
         auto_number_formatting: bool = True,
+        number_format_sample: int = 100_000,
+        default_styles: bool = False,
+        as_table: Union[bool, str] = False,
+        mode: str = "write", #Literal["write", "append"] = "write",
     ) -> DataframeSheet:
         """
         Export pandas Datafame to excel.
 
         Args:
-            df (pd.DataFrame): Pandas Dataframe to export
+            df (pd.DataFrame or iterable of pd.DataFrame): Pandas Dataframe to export or dataframe chunks with the same columns e.g. pd.read_csv(..., chunksize=10_000) that are written one below the other - the number formats and column widths are decided from the first chunk
             sheet_name (str): Sheet name
             startrow (int): Upper left cell row to dump dataframe (zero indexed)
             startcol (int): Upper left cell column to dump data rame (zero indexed)
@@ -765,7 +2005,12 @@ class ExcelWriter:
             use_base_style (bool): Apply the excel workbook "theme" set in ExcelWriter()
             col_widths (dict): Define column widths manually with key referencing the column and value the width e.g. {'A:C': 20, 'F': 10, 'employees': 40}
             col_autofit (bool): Automatically change column width to fit content best
+            col_autofit_sample (int): Maximum number of evenly spaced rows used to fit the column widths (None uses all rows)
             auto_number_formatting (bool): Automatically detect number format and change excel format
+            number_format_sample (int): Maximum number of evenly spaced rows used to detect the number formats (None uses all rows)
+            default_styles (bool): Set the style shared by all body cells of a column (or row) once as column (row) style and do not write the empty body cells with this style - smaller files and faster saves for tables with many empty cells. Empty cells outside of the table show the column/row style too
+            as_table (bool or str): Write the dataframe as native Excel table (with filter buttons) styled by a table style instead of styling every cell - True compiles the theme table styling into a custom table style, a string is the name of a built-in table style e.g. "TableStyleMedium2". Only the number formats, the general theme style, and the custom style={...} are still applied as cell styles
+            mode (str): "write" the table or "append" the rows below the table of an existing sheet (e.g. of ExcelWriter(mode="modify")) with the cell styles of its last row - the Excel table, data validations, and autofit column widths are extended to the new rows. Use the same startrow, startcol, index, and header as for the existing table. If the sheet does not exist yet the table is written
 
         Returns:
             beautifulexcel.DataframeSheet
@@ -778,23 +2023,282 @@ class ExcelWriter:
                 ws1 = writer.to_excel(df1, sheetname='My Sheet', mode='a', startrow=0, startcol=0)
             ```
         """
-        df_sheet = DataframeSheet(
-            excelwriter=self,
-            df=df,
-            sheet_name=sheet_name,
-            startrow=startrow,
-            startcol=startcol,
-            index=index,
-            header=header,
-            style=style,
-            use_theme_style=use_base_style,
-            col_widths=col_widths,
-            col_autofit=col_autofit,
-            auto_number_formatting=auto_number_formatting,
-        )
+        # dataframe chunks - only one chunk is held in memory at a time
+        df_chunks = None
+        if not isinstance(df, pd.DataFrame):
+            df_chunks = iter(df)
+            df = next(df_chunks, None)
+            if df is None:
+                raise Exception(f'No dataframe chunks to write to the sheet "{sheet_name}".')
+
+        # mode="patch" regenerates existing sheets completely - their old content is not read
+        if self.file_mode == "patch" and sheet_name in self.package.sheets and self.if_sheet_exists != "replace":
+            raise Exception(f'The sheet "{sheet_name}" already exists.')
+        if as_table and self.file_mode == "patch":
+            raise Exception('to_excel(as_table=...) is not available with ExcelWriter(mode="patch"). Please use mode="modify" instead.')
+        if mode not in ["write", "append"]:
+            raise Exception(f'Unknown to_excel(mode="{mode}"). Available modes are: write and append.')
+        append = mode == "append" and sheet_name in self.writer.book.sheetnames
+        if mode == "append" and (self.engine != "openpyxl" or self.streaming or self.file_mode == "patch"):
+            raise Exception(
+                'to_excel(mode="append") needs the existing cells and is only available with ExcelWriter(engine="openpyxl", streaming=False) and mode="replace" or "modify". Rows can also be appended to a sheet of this writer with ws.append_rows(df).'
+            )
+
+        sheet_class: type[DataframeSheet]
+        if append:
+            sheet_class = AppendDataframeSheet
+        elif self.engine == "xlsxwriter":
+            sheet_class = XlsxWriterDataframeSheet
+        elif self.engine == "xml":
+            sheet_class = XmlDataframeSheet
+        elif self.streaming:
+            sheet_class = StreamingDataframeSheet
+        else:
+            sheet_class = DataframeSheet
+        style_cache = self.style_cache
+        cells_styled, styles_created = style_cache.cells, style_cache.misses
+        # the warnings of this sheet are counted where they are emitted (only if profiling)
+        warning_stats = Stats() if self.stats is not None else None
+        with self._phase("to_excel"), count_warnings(warning_stats):
+            df_sheet = sheet_class(
+                excelwriter=self,
+                df=df,
+                sheet_name=sheet_name,
+                startrow=startrow,
+                startcol=startcol,
+                index=index,
+                header=header,
+                style=style,
+                use_theme_style=use_base_style,
+                col_widths=col_widths,
+                col_autofit=col_autofit,
+                col_autofit_sample=col_autofit_sample,
+                auto_number_formatting=auto_number_formatting,
+                number_format_sample=number_format_sample,
+                default_styles=default_styles,
+                as_table=as_table,
+            )
+
+            if df_chunks is not None:
+                for df_chunk in df_chunks:
+                    if append:
+                        df_sheet.append_rows(df_chunk)
+                    else:
+                        df_sheet._write_chunk(df_chunk)
+
+            # the table covers all chunks
+            if as_table and not append:
+                with df_sheet.stats.phase("table"):
+                    df_sheet._add_table()
+
+        self.dataframe_sheets.append(df_sheet)
+        sheet_stats = df_sheet.stats
+        sheet_stats.count("rows", df_sheet.table_height)
+        sheet_stats.count("columns", df_sheet.table_width)
+        sheet_stats.count("cells_styled", style_cache.cells - cells_styled)
+        sheet_stats.count("styles_created", style_cache.misses - styles_created)
+        if self.stats is not None:
+            sheet_stats.count("warnings", warning_stats.counters.get("warnings", 0))
+            self.stats.sheets.append(sheet_stats)
+            for counter in ["cells_styled", "warnings"]:
+                self.stats.count(counter, sheet_stats.counters[counter])
+            self.stats.count("sheets")
 
         return df_sheet
 
+    def to_excel_many(self, dfs: dict, workers: int = None, **kwargs):
+        """
+        Export multiple pandas Dataframes to excel sheets in parallel - every sheet is rendered in a separate process and
+        the finished sheets with their styles are added to this workbook
+
+        Args:
+            dfs (dict): Dataframes to export {sheet_name: df}
+            workers (int): Number of processes (default: number of CPU cores) - 1 renders the sheets in this process
+            kwargs (dict): Further .to_excel() arguments for all sheets e.g. index=True, style={'RoE': 'bg_light_blue'}
+
+        Example:
+            ```python
+            from beautifulexcel import ExcelWriter
+
+            with ExcelWriter('workbook.xlsx', theme='elegant_blue') as writer:
+                writer.to_excel_many({'Sheet 1': df1, 'Sheet 2': df2}, workers=4, index=True)
+            ```
+
+        Note: The rendered sheets are only inserted into the file when the workbook is saved, so they cannot be changed
+        anymore with the Sheet methods e.g. .merge_cells()
+        """
+        if self.engine == "xlsxwriter":
+            raise Exception('.to_excel_many() is not available with ExcelWriter(engine="xlsxwriter").')
+        if kwargs.get("as_table"):
+            raise Exception(".to_excel_many() cannot write Excel tables. Please use .to_excel(as_table=...) for these sheets.")
+        for sheet_name in dfs:
+            if sheet_name in self.writer.book.sheetnames or (self.file_mode == "patch" and sheet_name in self.package.sheets):
+                raise Exception(f'The sheet "{sheet_name}" already exists. .to_excel_many() can only create new sheets.')
+
+        writer_options = dict(
+            theme=self.theme_name,
+            ref_warnings=self.ref_warnings,
+            date_format=self.date_format,
+            datetime_format=self.datetime_format,
+            streaming=self.streaming,
+        )
+        with self._phase("to_excel_many"):
+            if workers == 1:
+                for sheet_name, df in dfs.items():
+                    self._add_rendered_sheet(sheet_name, *_render_sheet(writer_options, df, sheet_name, kwargs))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        sheet_name: executor.submit(_render_sheet, writer_options, df, sheet_name, kwargs)
+                        for sheet_name, df in dfs.items()
+                    }
+                    for sheet_name, future in futures.items():
+                        self._add_rendered_sheet(sheet_name, *future.result())
+
+    def _add_rendered_sheet(self, sheet_name, xml, style_tables):
+        """Add the styles of a sheet rendered by _render_sheet() and reserve its place in the workbook"""
+        style_ids = merge_style_tables(self.writer.book, style_tables)
+        ws = self.writer.book.create_sheet(sheet_name)
+        xml = remap_style_ids(xml, style_ids)
+        self.rendered_sheets[sheet_name] = (ws, xml, len(xml))
+
+
+def _render_sheet(writer_options, df, sheet_name, to_excel_kwargs):
+    """
+    Render a dataframe sheet in a separate in-memory workbook - returns the worksheet xml and the style tables of the
+    workbook (used by ExcelWriter.to_excel_many() in the worker processes)
+    """
+    excelwriter = ExcelWriter(io.BytesIO(), **writer_options)
+    # the sheet xml is moved into another workbook and cannot reference the shared strings of this one
+    excelwriter.shared_strings = None
+    ws = excelwriter.to_excel(df, sheet_name=sheet_name, **to_excel_kwargs).ws
+    return _worksheet_xml(ws, excelwriter.streaming), get_style_tables(excelwriter.writer.book)
+
+
+class _OutputStream:
+    """Binary file object around an object that only has a .write() method e.g. a response stream - zipfile also needs .flush()"""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, data):
+        return self.raw.write(data)
+
+    def flush(self):
+        pass
+
+
+class _PackageWriter(OpenpyxlPackageWriter):
+    """
+    openpyxl package writer that writes the worksheet xml straight into the zip archive instead of temporary files and
+    inserts the sheets rendered by engine="xml" and .to_excel_many() while the package is written
+    """
+
+    # upper estimate of the xml size of a cell - the part size decides upfront if the zip entry needs zip64 extensions
+    CELL_XML_SIZE = 256
+
+    def __init__(self, workbook, archive, rendered_sheets, shared_strings=None):
+        super().__init__(workbook, archive)
+        self.rendered_sheets = rendered_sheets
+        self.shared_strings = shared_strings
+
+    def _write_worksheets(self):
+        super()._write_worksheets()
+        # the shared strings of the sheets rendered by engine="xml" - openpyxl itself writes all texts as inline strings
+        if self.shared_strings:
+            self._archive.writestr(_SharedStringsPart.path[1:], self.shared_strings.to_xml())
+            self._archive.workbook_rels.append(f'<Relationship Id="rIdSharedStrings" Type="{SHARED_STRINGS_REL_TYPE}" Target="sharedStrings.xml"/>')
+            self.manifest.append(_SharedStringsPart)
+
+    def _open_part(self, name, size):
+        """Open a new deflated part of the archive for writing"""
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.file_size = size
+        return self._archive.open(info, "w")
+
+    def write_worksheet(self, ws):
+        rendered = self.rendered_sheets.get(ws.title)
+        if rendered is not None and rendered[0] is not ws:
+            rendered = None
+        if rendered is None and self.workbook.write_only:
+            # write-only worksheets are already serialized into their own temporary file
+            return super().write_worksheet(ws)
+
+        ws._drawing = SpreadsheetDrawing()
+        ws._drawing.charts = ws._charts
+        ws._drawing.images = ws._images
+        if rendered is None:
+            # the xml is serialized in many small pieces which are compressed in larger blocks
+            with self._open_part(ws.path[1:], len(ws._cells) * self.CELL_XML_SIZE) as part_file, io.BufferedWriter(part_file, 1024 * 1024) as dst:
+                ws_writer = WorksheetWriter(ws, out=dst)
+                ws_writer.write()
+        else:
+            # the placeholder worksheet has the columns, merged cells, tables, etc. of the rendered sheet
+            _, part, size = rendered
+            if self.workbook.write_only:
+                ws.close()
+                ws_writer = ws._writer
+                xml = ws_writer.read()
+                ws_writer.cleanup()
+            else:
+                ws_writer = WorksheetWriter(ws, out=io.BytesIO())
+                ws_writer.write()
+                xml = ws_writer.read()
+            with self._open_part(ws.path[1:], len(xml) + size) as dst:
+                if callable(part):
+                    part(xml, dst)
+                else:
+                    dst.write(part)
+        ws._rels = ws_writer._rels
+        self.manifest.append(ws)
+
+
+class _SharedStringsPart:
+    """Content type override of the shared strings part for the package manifest"""
+
+    path = "/xl/sharedStrings.xml"
+    mime_type = SHARED_STRINGS_CONTENT_TYPE
+
+
+class _WorkbookArchive(zipfile.ZipFile):
+    """Zip archive of _save_workbook() that adds the relationships in workbook_rels to the workbook relationships written by openpyxl"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.workbook_rels = []
+
+    def writestr(self, zinfo_or_arcname, data, *args, **kwargs):
+        if zinfo_or_arcname == "xl/_rels/workbook.xml.rels" and self.workbook_rels:
+            data = _insert_before_end_tag(data, "Relationships", self.workbook_rels)
+        return super().writestr(zinfo_or_arcname, data, *args, **kwargs)
+
+
+def _save_workbook(book, dst, rendered_sheets, shared_strings=None):
+    """
+    Write an openpyxl workbook as xlsx package into the binary file object dst - like openpyxl.Workbook.save() but the
+    parts are written one by one straight into dst, which does not need to be seekable (e.g. a response stream). The
+    rendered sheets can reference the texts of the SharedStrings table shared_strings
+    """
+    if book.write_only and not book.worksheets:
+        book.create_sheet()
+    book.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+    archive = _WorkbookArchive(dst, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+    _PackageWriter(book, archive, rendered_sheets, shared_strings).save()
+
+
+def _worksheet_xml(ws, streaming) -> bytes:
+    """Serialize an openpyxl worksheet (or write-only worksheet if streaming) to its worksheet xml"""
+    if streaming:
+        ws.close()
+        ws_writer = ws._writer
+    else:
+        ws_writer = WorksheetWriter(ws)
+        ws_writer.write()
+    xml = ws_writer.read()
+    ws_writer.cleanup()
+    return xml
+
 
 if __name__ == "__main__":
     example_df = pd.DataFrame(
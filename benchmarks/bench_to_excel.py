@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for ExcelWriter.to_excel()
+
+Every case runs in a fresh process and writes one JSON line with the case parameters, wall time, cells per second,
+peak RSS, and output file size - plain DataFrame.to_excel() is benchmarked as baseline for every row count. The full
+matrix up to 1M rows takes a long time with the openpyxl engine, so use --quick or --rows during development.
+
+Example:
+    $ python benchmarks/bench_to_excel.py --quick --output bench_new.jsonl
+    $ python benchmarks/bench_to_excel.py --quick --output bench_new.jsonl --compare bench_old.jsonl
+"""
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROW_COUNTS = [1_000, 10_000, 100_000, 1_000_000]
+QUICK_ROW_COUNTS = [1_000, 10_000]
+WIDE_SHAPES = [(1_000, 500), (10_000, 200)]
+
+DEFAULT_CASE = {
+    "writer": "beautifulexcel",
+    "rows": 1_000,
+    "cols": 10,
+    "multiindex_index": False,
+    "multiindex_header": False,
+    "style_ranges": 0,
+    # theme styling of the table via to_excel(use_base_style=...)
+    "theme": True,
+    "col_autofit": True,
+    "auto_number_formatting": True,
+    "mode": "replace",
+    "engine": "openpyxl",
+}
+
+# variations of the default case that are benchmarked for every row count
+VARIATIONS = {
+    "default": {},
+    "multiindex": {"multiindex_index": True, "multiindex_header": True},
+    "style_ranges_10": {"style_ranges": 10},
+    "style_ranges_100": {"style_ranges": 100},
+    "no_theme": {"theme": False},
+    "no_autofit": {"col_autofit": False},
+    "no_auto_number_formatting": {"auto_number_formatting": False},
+    "modify": {"mode": "modify"},
+    "patch": {"mode": "patch"},
+}
+
+
+def benchmark_cases(row_counts, wide_shapes, engines):
+    """All benchmark cases as dicts with a unique 'name' to compare them between runs"""
+    cases = []
+    for rows in row_counts:
+        cases.append({**DEFAULT_CASE, "name": f"pandas/rows_{rows}", "writer": "pandas", "rows": rows})
+        for engine in engines:
+            for variation_name, variation in VARIATIONS.items():
+                name = f"{engine}/{variation_name}/rows_{rows}"
+                cases.append({**DEFAULT_CASE, **variation, "name": name, "rows": rows, "engine": engine})
+    for rows, cols in wide_shapes:
+        cases.append(
+            {
+                **DEFAULT_CASE,
+                "name": f"pandas/wide/rows_{rows}_cols_{cols}",
+                "writer": "pandas",
+                "rows": rows,
+                "cols": cols,
+            }
+        )
+        for engine in engines:
+            cases.append(
+                {
+                    **DEFAULT_CASE,
+                    "name": f"{engine}/wide/rows_{rows}_cols_{cols}",
+                    "rows": rows,
+                    "cols": cols,
+                    "engine": engine,
+                }
+            )
+    return cases
+
+
+def make_dataframe(rows, cols, multiindex_index=False, multiindex_header=False, seed=0):
+    """Deterministic mixed type dataframe with text, integer, decimal, percentage, and date columns"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    generators = [
+        lambda: rng.choice(["ASSET MANAGEMENT", "BANK", "INSURANCE", "PENSION FUND", None], rows),
+        lambda: rng.integers(0, 50_000_000, rows),
+        lambda: rng.normal(0, 1_000, rows).round(2),
+        lambda: rng.uniform(-1, 1, rows),
+        lambda: pd.Timestamp("2000-01-01") + pd.to_timedelta(rng.integers(0, 10_000, rows), unit="D"),
+    ]
+    df = pd.DataFrame({f"col_{i}": generators[i % len(generators)]() for i in range(cols)})
+    if multiindex_index:
+        df.index = pd.MultiIndex.from_arrays(
+            [np.repeat([f"group_{i}" for i in range(rows // 100 + 1)], 100)[:rows], np.arange(rows)],
+            names=["group", "id"],
+        )
+    if multiindex_header:
+        df.columns = pd.MultiIndex.from_tuples([(f"block_{i // 5}", col) for i, col in enumerate(df.columns)])
+    return df
+
+
+def make_style_ranges(n_ranges, rows, cols, seed=0):
+    """n_ranges random rectangular style= ranges e.g. {'B12:D40': {'fill': 'FFEEB7'}} within the table body"""
+    import numpy as np
+    from beautifulexcel.utils import excel_column_name
+
+    rng = np.random.default_rng(seed)
+    style = {}
+    for _ in range(n_ranges):
+        row_start, row_end = sorted(rng.integers(2, rows + 2, 2))
+        col_start, col_end = sorted(rng.integers(1, cols + 1, 2))
+        ref = f"{excel_column_name(col_start)}{row_start}:{excel_column_name(col_end)}{row_end}"
+        style[ref] = {"fill": rng.choice(["FFEEB7", "DCE6F1", "EBF1DE"]), "font__italic": True}
+    return style
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None if not available on this platform)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on Linux
+    return max_rss / 1024**2 if sys.platform == "darwin" else max_rss / 1024
+
+
+def written_cells(file, sheet_name):
+    """Number of cells within the dimension of a written sheet e.g. of plain DataFrame.to_excel()"""
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file, read_only=True)
+    try:
+        ws = wb[sheet_name]
+        return (ws.max_row - ws.min_row + 1) * (ws.max_column - ws.min_column + 1)
+    finally:
+        wb.close()
+
+
+def run_case(case):
+    """Run a single benchmark case - meant to be executed in a fresh process"""
+    import pandas as pd
+    from beautifulexcel import ExcelWriter
+
+    # e.g. ref warnings would only clutter the benchmark output
+    warnings.simplefilter("ignore")
+    df = make_dataframe(case["rows"], case["cols"], case["multiindex_index"], case["multiindex_header"])
+    index = case["multiindex_index"]
+    style = make_style_ranges(case["style_ranges"], case["rows"], case["cols"])
+    rss_before = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file = os.path.join(tmp_dir, "benchmark.xlsx")
+        if case["mode"] in ["modify", "patch"]:
+            pd.DataFrame({"existing": range(100)}).to_excel(file, sheet_name="Existing Sheet", engine="openpyxl")
+
+        time_start = time.perf_counter()
+        if case["writer"] == "pandas":
+            df.to_excel(file, sheet_name="Benchmark", index=index, engine="openpyxl")
+        else:
+            with ExcelWriter(file, mode=case["mode"], engine=case["engine"]) as writer:
+                ws = writer.to_excel(
+                    df,
+                    sheet_name="Benchmark",
+                    index=index,
+                    style=style,
+                    use_base_style=case["theme"],
+                    col_autofit=case["col_autofit"],
+                    auto_number_formatting=case["auto_number_formatting"],
+                )
+        wall_time = time.perf_counter() - time_start
+        file_size = os.path.getsize(file)
+        # the written table incl. header, index, and the index names row below a MultiIndex header
+        if case["writer"] == "pandas":
+            cells = written_cells(file, "Benchmark")
+        else:
+            (first_row, first_col), (end_row, end_col) = ws.shape
+            cells = (end_row - first_row) * (end_col - first_col)
+
+    peak_rss = peak_rss_mb()
+    return {
+        **case,
+        "cells": cells,
+        "wall_time_s": round(wall_time, 4),
+        "cells_per_s": round(cells / wall_time, 1),
+        "peak_rss_mb": None if peak_rss is None else round(peak_rss, 1),
+        "peak_rss_increase_mb": None if peak_rss is None else round(peak_rss - rss_before, 1),
+        "file_size_bytes": file_size,
+    }
+
+
+def environment():
+    """Versions of the benchmarked code and its dependencies added to every result"""
+    import numpy as np
+    import openpyxl
+    import pandas as pd
+
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "openpyxl": openpyxl.__version__,
+    }
+
+
+def compare(results, baseline_file, threshold):
+    """Print the wall time ratio of each case to the same case in a previous results file - returns the regressions"""
+    with open(baseline_file, "r") as file:
+        baseline = {result["name"]: result for result in map(json.loads, file) if "name" in result}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result["name"])
+        if previous is None:
+            continue
+        ratio = result["wall_time_s"] / previous["wall_time_s"]
+        flag = "REGRESSION" if ratio > threshold else ""
+        print(
+            f"{result['name']:<60} {previous['wall_time_s']:>10.3f}s -> {result['wall_time_s']:>10.3f}s {ratio:>6.2f}x {flag}"
+        )
+        if ratio > threshold:
+            regressions.append(result["name"])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ExcelWriter.to_excel() against DataFrame.to_excel()")
+    parser.add_argument("--rows", type=int, nargs="+", default=None, help=f"row counts (default {ROW_COUNTS})")
+    parser.add_argument("--quick", action="store_true", help=f"only {QUICK_ROW_COUNTS} rows and no wide frames")
+    parser.add_argument(
+        "--engines", nargs="+", default=["openpyxl"], help="ExcelWriter engines e.g. openpyxl xml xlsxwriter"
+    )
+    parser.add_argument(
+        "--filter", default=None, help="only run cases whose name contains this text (and the pandas baselines)"
+    )
+    parser.add_argument("--output", default="bench_output.jsonl", help="JSON lines results file")
+    parser.add_argument(
+        "--compare", default=None, help="previous JSON lines results file to compare the wall times with"
+    )
+    parser.add_argument("--threshold", type=float, default=1.2, help="wall time ratio that counts as regression")
+    args = parser.parse_args(argv)
+
+    row_counts = args.rows or (QUICK_ROW_COUNTS if args.quick else ROW_COUNTS)
+    wide_shapes = [] if args.quick else WIDE_SHAPES
+    cases = [
+        case
+        for case in benchmark_cases(row_counts, wide_shapes, args.engines)
+        if args.filter is None or args.filter in case["name"] or case["writer"] == "pandas"
+    ]
+    env = environment()
+
+    # a new process per case so that the peak RSS of one case does not include the previous ones
+    context = multiprocessing.get_context("spawn")
+    results = []
+    pandas_times = {}
+    with open(args.output, "w") as file:
+        for case in cases:
+            with context.Pool(1) as pool:
+                result = {**pool.apply(run_case, (case,)), **env}
+            # wall time relative to plain DataFrame.to_excel() of the same shape
+            if case["writer"] == "pandas":
+                pandas_times[(case["rows"], case["cols"])] = result["wall_time_s"]
+            pandas_time = pandas_times.get((case["rows"], case["cols"]))
+            result["vs_pandas"] = None if pandas_time is None else round(result["wall_time_s"] / pandas_time, 3)
+            results.append(result)
+            file.write(json.dumps(result) + "\n")
+            file.flush()
+            print(
+                f"{result['name']:<60} {result['wall_time_s']:>10.3f}s {result['cells_per_s']:>12,.0f} cells/s {result['peak_rss_mb']} MB {result['vs_pandas']}x pandas"
+            )
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions slower than {args.threshold}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,7 @@ setup(
     python_requires=">=3.7",
     #packages=find_packages(),
     install_requires=['typing', 'PyYAML', 'datetime', 'openpyxl', 'numpy', 'pandas'],
+    extras_require={'xlsxwriter': ['XlsxWriter']},
     package_data={"beautifulexcel": ["themes/*.yml", "VERSION"]},
     include_package_data=True,
 )
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import datetime
+import numpy as np
+import pandas as pd
+import openpyxl
+
+
+def example_df():
+    """Small client table with texts, integers, missing values, dates, and percentages shared by the engine tests"""
+    return pd.DataFrame(
+        {
+            "client": ["A", "B", "C", "D"],
+            "industry": ["ASEET MANAGEMENT", "BANK", "INSURANCE", None],
+            "employees": [25_000, 17_000_000, 14, np.nan],
+            "inception": [
+                datetime.datetime(2022, 1, 1),
+                np.nan,
+                datetime.datetime(1997, 1, 1),
+                datetime.datetime(1962, 1, 1),
+            ],
+            "RoE": [0.05, -0.05, np.nan, 1.05],
+        }
+    )
+
+
+def cell_style(cell):
+    """Comparable style of an openpyxl cell"""
+    return cell.number_format, repr(cell.font), repr(cell.fill), repr(cell.border), repr(cell.alignment)
+
+
+def cell_styles(file):
+    """Sheet names and the value and style of every cell of a workbook - to compare workbooks written in different ways"""
+    wb = openpyxl.load_workbook(file)
+    return wb.sheetnames, {
+        (ws.title, cell.coordinate): (repr(cell.value), *cell_style(cell))
+        for ws in wb.worksheets
+        for row in ws.iter_rows()
+        for cell in row
+    }
+
+
+def cell_values(file):
+    """Value, bold, italic, fill color, and number format of the non-empty cells - for engines with other style details"""
+    wb = openpyxl.load_workbook(file)
+    return {
+        (ws.title, cell.coordinate): (
+            repr(cell.value),
+            cell.font.b,
+            cell.font.i,
+            cell.fill.fgColor.rgb[-6:],
+            cell.number_format,
+        )
+        for ws in wb.worksheets
+        for row in ws.iter_rows()
+        for cell in row
+        if cell.value is not None
+    }
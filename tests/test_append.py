@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter, read_excel
+from tests.helpers import cell_style
+
+
+def _day(day, n_rows=3, event="event"):
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(f"2024-01-{day:02d}", periods=n_rows, freq="h"),
+            "event": [f"{event} {day}"] * n_rows,
+            "value": np.arange(n_rows) * 1.5,
+            "RoE": [0.1] * n_rows,
+        }
+    )
+
+
+def _row_styles(ws, row_num):
+    return [cell_style(cell) for cell in ws[row_num]]
+
+
+@pytest.mark.parametrize(
+    "engine, streaming", [("openpyxl", False), ("openpyxl", True), ("xml", False), ("xlsxwriter", False)]
+)
+def test_append_rows(tmp_path, engine, streaming):
+    file = str(tmp_path / "testing_append.xlsx")
+    as_table = "TableStyleLight9" if engine == "xlsxwriter" else True
+    with ExcelWriter(file, engine=engine, streaming=streaming) as writer:
+        ws = writer.to_excel(_day(1), sheet_name="Log", as_table=as_table, style={"RoE": "bg_light_blue"})
+        ws.add_data_validation("value", type="decimal")
+        ws.append_rows(_day(2, event="a much longer event name"))
+        assert ws.table_height == 6
+
+    wb = openpyxl.load_workbook(file)
+    ws = wb["Log"]
+    assert dict(ws.tables.items()) == {"Table1": "A1:D7"}
+    assert [str(dv.sqref) for dv in ws.data_validations.dataValidation] == ["C2:C7"]
+    assert _row_styles(ws, 7) == _row_styles(ws, 2)
+    if not streaming:
+        assert ws.column_dimensions["B"].width >= len("a much longer event name 2")
+    pd.testing.assert_frame_equal(
+        read_excel(file, sheet_name="Log"),
+        pd.concat([_day(1), _day(2, event="a much longer event name")], ignore_index=True),
+    )
+
+
+def test_append_mode(tmp_path):
+    file = str(tmp_path / "testing_append.xlsx")
+    with ExcelWriter(file) as writer:
+        ws = writer.to_excel(
+            _day(1),
+            sheet_name="Log",
+            mode="append",
+            as_table=True,
+            style={"RoE": "bg_light_blue"},
+            col_widths={"event": 8},
+        )
+        ws.add_data_validation("value", type="decimal")
+        writer.to_excel(_day(1), sheet_name="Other")
+    date_width = openpyxl.load_workbook(file)["Log"].column_dimensions["A"].width
+
+    for day in [2, 3]:
+        with ExcelWriter(file, mode="modify") as writer:
+            ws = writer.to_excel(
+                (_day(day).iloc[i : i + 2] for i in range(0, 3, 2)),
+                sheet_name="Log",
+                mode="append",
+                as_table=True,
+                col_widths={"event": 8},
+            )
+            # only the new rows are written
+            assert ws.stats.counters["cells_styled"] == 3 * 4
+
+    ws = openpyxl.load_workbook(file)["Log"]
+    assert dict(ws.tables.items()) == {"Table1": "A1:D10"}
+    assert [str(dv.sqref) for dv in ws.data_validations.dataValidation] == ["C2:C10"]
+    assert _row_styles(ws, 10) == _row_styles(ws, 2)
+    assert ws["D10"].fill.fgColor.rgb.endswith("DCE6F1")
+    assert ws.column_dimensions["A"].width == date_width and ws.column_dimensions["B"].width == 8
+    pd.testing.assert_frame_equal(
+        read_excel(file, sheet_name="Log"), pd.concat([_day(day) for day in [1, 2, 3]], ignore_index=True)
+    )
+
+
+def test_append_errors(tmp_path):
+    file = str(tmp_path / "testing_append.xlsx")
+    with ExcelWriter(file) as writer:
+        writer.to_excel(_day(1), sheet_name="Log")
+    with ExcelWriter(file, mode="modify") as writer:
+        with pytest.raises(Exception, match="cannot be appended"):
+            writer.to_excel(_day(2), sheet_name="Log", mode="append", index=True)
+        with pytest.raises(Exception, match="same columns"):
+            writer.to_excel(_day(2).drop(columns="RoE"), sheet_name="Log", mode="append")
+        with pytest.raises(Exception, match="Unknown"):
+            writer.to_excel(_day(2), sheet_name="Log", mode="a")
+    with ExcelWriter(str(tmp_path / "testing_append_xml.xlsx"), engine="xml") as writer:
+        with pytest.raises(Exception, match="append_rows"):
+            writer.to_excel(_day(2), sheet_name="Log", mode="append")
+        writer.to_excel(_day(2), sheet_name="Log")
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import pytest
+from beautifulexcel import AsyncExcelWriter, read_excel
+
+
+def _df(n_rows=5):
+    return pd.DataFrame(
+        {
+            "client": [f"client {i}" for i in range(n_rows)],
+            "employees": np.arange(n_rows),
+            "RoE": np.linspace(-0.5, 0.5, n_rows),
+        }
+    )
+
+
+def test_async_writer(tmp_path):
+    file = str(tmp_path / "testing_async.xlsx")
+    df = _df(20_000)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.001)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async with AsyncExcelWriter(file, executor=executor, profile=True) as writer:
+                ws = await writer.to_excel(df, sheet_name="Sheet 1", style={"RoE": "bg_light_blue"})
+                await writer.run(ws.merge_cells, "E1:F2")
+        ticker_task.cancel()
+        return writer, ticks
+
+    writer, ticks = asyncio.run(main())
+    # the event loop kept running while the workbook was built and saved
+    assert ticks > 10
+    assert writer.stats.counters["sheets"] == 1 and "save" in writer.stats.phases
+    pd.testing.assert_frame_equal(read_excel(file, sheet_name="Sheet 1"), df)
+
+
+def test_async_writer_semaphore(tmp_path):
+    running, max_running = 0, 0
+    lock = threading.Lock()
+
+    def blocking_operation():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    async def build(semaphore, i):
+        async with AsyncExcelWriter(str(tmp_path / f"testing_async_{i}.xlsx"), semaphore=semaphore) as writer:
+            await writer.run(blocking_operation)
+            await writer.to_excel(_df(), sheet_name="Sheet 1")
+            await writer.run(blocking_operation)
+
+    async def main():
+        semaphore = asyncio.Semaphore(2)
+        await asyncio.gather(*[build(semaphore, i) for i in range(6)])
+
+    asyncio.run(main())
+    assert max_running <= 2
+    assert all(os.path.isfile(tmp_path / f"testing_async_{i}.xlsx") for i in range(6))
+
+
+def test_async_writer_cancel(tmp_path):
+    file = str(tmp_path / "testing_async.xlsx")
+    started, finished = threading.Event(), threading.Event()
+
+    def blocking_operation():
+        started.set()
+        time.sleep(0.2)
+        finished.set()
+
+    async def main():
+        writer = AsyncExcelWriter(file)
+
+        async def build():
+            async with writer:
+                await writer.to_excel(_df(), sheet_name="Sheet 1")
+                await writer.run(blocking_operation)
+
+        task = asyncio.create_task(build())
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the cancelled task only returns once the running operation has finished
+        assert finished.is_set()
+        return writer
+
+    writer = asyncio.run(main())
+    assert writer.cancelled
+    # the incomplete workbook is not saved
+    assert not os.path.isfile(file)
+    with pytest.raises(Exception, match="Wrong usage"):
+        asyncio.run(writer.to_excel(_df(), sheet_name="Sheet 2"))
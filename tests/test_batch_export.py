@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import os
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import batch_export, read_excel
+
+
+def _df():
+    n_rows = 60
+    return pd.DataFrame(
+        {
+            "client": [f"client_{i % 4}" for i in range(n_rows)],
+            "region": [["EU", "US"][(i // 4) % 2] for i in range(n_rows)],
+            "employees": np.arange(n_rows),
+            "RoE": np.linspace(-0.5, 0.5, n_rows),
+        }
+    )
+
+
+@pytest.mark.parametrize("workers, template", [(2, True), (1, True), (2, False)])
+def test_batch_export(tmp_path, workers, template):
+    df = _df()
+    report = batch_export(
+        df,
+        by="client",
+        path_template=str(tmp_path / "reports" / "{client}.xlsx"),
+        sheet_name="Report",
+        workers=workers,
+        template=template,
+        style={"RoE": "bg_light_blue"},
+    )
+    assert list(report.index) == [f"client_{i}" for i in range(4)]
+    assert report["error"].isna().all() and (report["seconds"] > 0).all()
+    assert report["rows"].sum() == len(df)
+    for client, group_df in df.groupby("client"):
+        file = report.loc[client, "path"]
+        pd.testing.assert_frame_equal(read_excel(file, sheet_name="Report"), group_df.reset_index(drop=True))
+        ws = openpyxl.load_workbook(file)["Report"]
+        assert ws["D2"].fill.fgColor.rgb == "00DCE6F1"
+
+
+def test_batch_export_failures(tmp_path):
+    # the directory of one group is blocked by a file
+    open(tmp_path / "client_1", "w").close()
+    with pytest.warns(UserWarning, match="2 of 8 workbooks"):
+        report = batch_export(
+            _df(), by=["client", "region"], path_template=str(tmp_path / "{0}" / "{region}.xlsx"), workers=2
+        )
+    assert report.index.names == ["client", "region"]
+    failed = report[report["error"].notna()]
+    assert sorted(failed.index) == [("client_1", "EU"), ("client_1", "US")]
+    assert failed["error"].str.contains("client_1").all()
+    assert all(os.path.isfile(path) for path in report.loc[report["error"].isna(), "path"])
+
+
+def test_batch_export_same_paths(tmp_path):
+    with pytest.raises(Exception, match="same path"):
+        batch_export(_df(), by=["client", "region"], path_template=str(tmp_path / "{client}.xlsx"))
+
+
+def test_batch_export_missing_keys(tmp_path):
+    df = _df()
+    df.loc[[1, 5], "client"] = None
+    with pytest.warns(UserWarning, match="1 of 5 workbooks"):
+        report = batch_export(df, by="client", path_template=str(tmp_path / "{client}.xlsx"), workers=1)
+    # the rows without client are reported instead of being dropped or written to "None.xlsx"
+    assert report["rows"].sum() == len(df)
+    failed = report[report["error"].notna()]
+    assert len(failed) == 1 and failed["path"].isna().all() and failed["rows"].tolist() == [2]
+    assert failed["error"].str.contains("missing values").all()
+    assert sorted(os.listdir(tmp_path)) == [f"client_{i}.xlsx" for i in range(4)]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+import bench_to_excel
+
+
+def test_benchmark_case(tmp_path):
+    cases = bench_to_excel.benchmark_cases([100], [], ["openpyxl"])
+    assert len({case["name"] for case in cases}) == len(cases) == len(bench_to_excel.VARIATIONS) + 1
+
+    case = {
+        **bench_to_excel.DEFAULT_CASE,
+        "name": "openpyxl/multiindex/rows_100",
+        "rows": 100,
+        "multiindex_index": True,
+        "style_ranges": 5,
+    }
+    result = bench_to_excel.run_case(case)
+    assert result["cells"] == (100 + 1) * (10 + 2)
+    assert result["wall_time_s"] > 0 and result["file_size_bytes"] > 0
+    json.dumps(result)
+
+    # the cells of the written sheet incl. the index names row below a MultiIndex header - like plain pandas
+    for writer in ["beautifulexcel", "pandas"]:
+        result = bench_to_excel.run_case({**case, "writer": writer, "rows": 20, "multiindex_header": True})
+        assert result["cells"] == (2 + 1 + 20) * (2 + 10)
+
+    baseline_file = tmp_path / "baseline.jsonl"
+    baseline_file.write_text(json.dumps({**result, "wall_time_s": result["wall_time_s"] / 10}) + "\n")
+    assert bench_to_excel.compare([result], str(baseline_file), threshold=1.2) == [case["name"]]
@@ -1,6 +1,14 @@
 # -*- coding: utf-8 -*-
+import numpy as np
 import pandas as pd
-from beautifulexcel.utils import excel_cell_ref_coordinates, excel_range_ref_coordinates, cell_within_cell_range
+from beautifulexcel.utils import (
+    excel_cell_ref_coordinates,
+    excel_range_ref_coordinates,
+    cell_within_cell_range,
+    get_custom_styles,
+    resolve_custom_styles,
+    parse_excel_ref,
+)
 
 
 def test_cell_single_level_df():
@@ -109,3 +117,52 @@ def test_cell_within_cell_range():
     assert cell_within_cell_range(b2[0], b2[1], row_range)
     assert cell_within_cell_range(c3[0], c3[1], row_range)
     assert ~cell_within_cell_range(d4[0], d4[1], row_range)
+
+
+def test_resolve_custom_styles():
+    styles_custom = {
+        ((None, 2), (None, 3)): {"fill": "FFEEB7"},
+        ((3, 1), (5, 4)): {"font__bold": True, "fill": "DCE6F1"},
+        ((4, None), (4, None)): {"font__color": "FF0000"},
+        ((-1, 3), (2, 3)): {"fill": "F2F2F2"},
+        ((20, 1), (30, 2)): {"fill": "000000"},
+    }
+
+    for ignore_entire_rows_or_cols in [False, True]:
+        row_breaks, col_breaks, style_ids, styles = resolve_custom_styles(
+            1, 10, 1, 6, styles_custom, ignore_entire_rows_or_cols=ignore_entire_rows_or_cols
+        )
+        for row_num in range(1, 10):
+            for col_num in range(1, 6):
+                row_band = np.searchsorted(row_breaks, row_num, side="right") - 1
+                col_band = np.searchsorted(col_breaks, col_num, side="right") - 1
+                assert styles[style_ids[row_band, col_band]] == get_custom_styles(
+                    row_num, col_num, styles_custom, ignore_entire_rows_or_cols=ignore_entire_rows_or_cols
+                )
+
+    assert resolve_custom_styles(1, 10, 1, 6, {})[3] == [{}]
+
+    # many overlapping single cells and ranges - later ranges overwrite earlier ones
+    rng = np.random.default_rng(0)
+    styles_custom = {}
+    for i in range(200):
+        start_row, start_col = (int(value) for value in rng.integers(1, 12, 2))
+        end_row, end_col = start_row + int(rng.integers(0, 3)), start_col + int(rng.integers(0, 3))
+        styles_custom[((start_row, start_col), (end_row, end_col))] = {["fill", "font__bold", "font__color"][i % 3]: i}
+    row_breaks, col_breaks, style_ids, styles = resolve_custom_styles(1, 12, 1, 12, styles_custom)
+    # no styles of completely overwritten bands are left
+    assert np.unique(style_ids).tolist() == list(range(len(styles)))
+    for row_num in range(1, 12):
+        for col_num in range(1, 12):
+            row_band = np.searchsorted(row_breaks, row_num, side="right") - 1
+            col_band = np.searchsorted(col_breaks, col_num, side="right") - 1
+            assert styles[style_ids[row_band, col_band]] == get_custom_styles(row_num, col_num, styles_custom)
+
+
+def test_parse_excel_ref():
+    assert parse_excel_ref("B2") == (2, 2)
+    assert parse_excel_ref("XFD1048576") == (1_048_576, 16_384)
+    assert parse_excel_ref("b") == (None, 2)
+    assert parse_excel_ref("12") == (12, None)
+    assert parse_excel_ref("-1") == (-1, None)
+    assert parse_excel_ref("A0") is None and parse_excel_ref("B1048577") is None and parse_excel_ref("duration") is None
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter
+from tests.helpers import cell_styles, example_df
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_chunks_same_as_dataframe(tmp_path, streaming):
+    df = example_df().set_index("client")
+
+    # uneven chunks of 3 and 1 rows
+    for file, data in [
+        (tmp_path / "testing.xlsx", df),
+        (tmp_path / "testing_chunks.xlsx", (df.iloc[i : i + 3] for i in range(0, 4, 3))),
+    ]:
+        with ExcelWriter(str(file), streaming=streaming) as writer:
+            ws1 = writer.to_excel(
+                data,
+                sheet_name="Test Sheet 1",
+                startrow=1,
+                index=True,
+                style={"RoE": "bg_light_blue", "A4:B5": {"font": {"italic": True}}},
+            )
+            ws1.add_data_validation(ref="employees", type="list", props=["Y", "N"])
+
+    assert cell_styles(tmp_path / "testing.xlsx") == cell_styles(tmp_path / "testing_chunks.xlsx")
+    ws = openpyxl.load_workbook(tmp_path / "testing_chunks.xlsx")["Test Sheet 1"]
+    assert str(ws.data_validations.dataValidation[0].sqref) == "C3:C6"
+
+
+def test_chunks_errors(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210], "duration": [50, 40, 45, 90]})
+
+    with ExcelWriter(str(tmp_path / "testing_chunks.xlsx")) as writer:
+        with pytest.raises(Exception, match="same columns"):
+            writer.to_excel([df, df[["duration", "calories"]]], sheet_name="Test Sheet 1")
+        with pytest.raises(Exception, match="No dataframe chunks"):
+            writer.to_excel([], sheet_name="Test Sheet 2")
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import io
+import itertools
+import numpy as np
+import pandas as pd
+import openpyxl
+from beautifulexcel import ExcelWriter
+from beautifulexcel.utils import coalesce_ranges, coalesce_style_ranges
+
+
+def _cells(ranges):
+    return [
+        (row, col)
+        for (start_row, start_col), (end_row, end_col) in ranges
+        for row, col in itertools.product(range(start_row, end_row + 1), range(start_col, end_col + 1))
+    ]
+
+
+def test_coalesce_ranges():
+    assert coalesce_ranges([((1, 1), (1, 1)), ((1, 2), (1, 2))]) == [((1, 1), (1, 2))]
+    assert coalesce_ranges([((1, 1), (1, 1)), ((2, 1), (2, 1))]) == [((1, 1), (2, 1))]
+    assert coalesce_ranges([((1, 1), (5, 1)), ((3, 1), (8, 1)), ((1, 1), (5, 1))]) == [((1, 1), (8, 1))]
+    assert coalesce_ranges([((1, 1), (1, 1)), ((1, 3), (1, 3))]) == [((1, 1), (1, 1)), ((1, 3), (1, 3))]
+
+    # the coalesced ranges are disjoint and cover exactly the same cells
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        ranges = []
+        for _ in range(rng.integers(1, 30)):
+            start_row, start_col = rng.integers(1, 20, 2)
+            ranges.append(
+                (
+                    (int(start_row), int(start_col)),
+                    (int(start_row + rng.integers(0, 4)), int(start_col + rng.integers(0, 4))),
+                )
+            )
+        cells = _cells(coalesce_ranges(ranges))
+        assert len(cells) == len(set(cells))
+        assert set(cells) == set(_cells(ranges))
+
+
+def test_coalesce_style_ranges():
+    styles_custom = {
+        ((1, 1), (1, 1)): {"fill": "FFEEB7"},
+        ((1, 2), (1, 2)): {"fill": "FFEEB7"},
+        ((None, 2), (None, 2)): {"font__bold": True},
+        ((2, 1), (2, 1)): {"fill": "FFEEB7"},
+    }
+    # entire columns stay in place so that the later cell style still overwrites them
+    assert coalesce_style_ranges(styles_custom) == [
+        (((1, 1), (1, 2)), {"fill": "FFEEB7"}),
+        (((None, 2), (None, 2)), {"font__bold": True}),
+        (((2, 1), (2, 1)), {"fill": "FFEEB7"}),
+    ]
+
+
+def test_coalesced_validations_and_styles():
+    df = pd.DataFrame(np.arange(60).reshape(12, 5), columns=list("vwxyz"))
+    files = {}
+    for name, style in {
+        "cells": {**{f"{col}{row}": "bg_light_blue" for col in "BC" for row in range(2, 14)}, "D5": "bg_light_red"},
+        "ranges": {"B2:C13": "bg_light_blue", "D5": "bg_light_red"},
+    }.items():
+        files[name] = io.BytesIO()
+        with ExcelWriter(files[name], theme="elegant_blue") as writer:
+            ws = writer.to_excel(df, sheet_name="Sheet1", style=style)
+            ws.add_data_validation(ref=[f"A{row}" for row in range(2, 14)] + ["B2:B13", "B5", "v"], type="whole")
+            ws.merge_cells(["G1:H2", "G1:H2"])
+
+    wb_cells, wb_ranges = (
+        openpyxl.load_workbook(files["cells"])["Sheet1"],
+        openpyxl.load_workbook(files["ranges"])["Sheet1"],
+    )
+    assert [str(dv.sqref) for dv in wb_cells.data_validations.dataValidation] == ["A2:B13"]
+    assert [str(merged) for merged in wb_cells.merged_cells.ranges] == ["G1:H2"]
+    for row in wb_ranges.iter_rows():
+        for cell in row:
+            assert repr(wb_cells[cell.coordinate].fill) == repr(cell.fill)
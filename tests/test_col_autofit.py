@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from beautifulexcel import ExcelWriter
+
+
+# the all NaN column is estimated without warnings
+@pytest.mark.filterwarnings("error")
+def test_col_autofit(tmp_path):
+    df = pd.DataFrame(
+        {
+            "client": ["A", "B", "C", "D"],
+            "industry": ["ASSET MANAGEMENT", "BANK", "INSURANCE", None],
+            "employees": [25_000, 17_000_000, 14, np.nan],
+            "inception": [
+                datetime.datetime(2022, 1, 1),
+                np.nan,
+                datetime.datetime(1997, 1, 1),
+                datetime.datetime(1962, 1, 1),
+            ],
+            "a very long column name": [1, 2, 3, 4],
+            "empty": [np.nan] * 4,
+        }
+    ).set_index("client")
+
+    with ExcelWriter(str(tmp_path / "testing.xlsx")) as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1", index=True, col_widths={"empty": 30})
+        widths = {col: ws1.ws.column_dimensions[col].width for col in "ABCDEF"}
+        assert widths == {
+            "A": int(6 * 1.28),
+            "B": int(13.2 * 1.28),
+            "C": int(10 * 1.28),
+            "D": int(10 * 1.28),
+            "E": int(23 * 1.28),
+            "F": 30,
+        }
+        assert ws1.timings["autofit"] >= 0
+
+
+def test_col_autofit_multi_index_header(tmp_path):
+    columns = pd.MultiIndex.from_tuples([("Long group label", "x"), ("Long group label", "y"), ("B", "a longer label")])
+    df = pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=columns)
+
+    with ExcelWriter(str(tmp_path / "testing.xlsx")) as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1", index=True)
+        widths = [ws1.ws.column_dimensions[col].width for col in "BCD"]
+        assert widths == [int(8 * 1.28), int(8 * 1.28), int(14 * 1.28)]
+
+
+def test_col_autofit_sample(tmp_path):
+    df = pd.DataFrame({"text": ["short"] * 99 + ["a much much longer text"]})
+
+    with ExcelWriter(str(tmp_path / "testing.xlsx")) as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1", col_autofit_sample=None)
+        ws2 = writer.to_excel(df, sheet_name="Test Sheet 2", col_autofit_sample=2)
+        assert ws1.ws.column_dimensions["A"].width == int(5 * 1.28)
+        # only the first and the last row are sampled
+        assert ws2.ws.column_dimensions["A"].width == int((5 + 0.8 * (23 - 5)) * 1.28)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter
+
+
+def _style(obj):
+    return (repr(obj.font), repr(obj.fill), repr(obj.border), repr(obj.alignment), obj.number_format)
+
+
+def _effective_styles(file, shape):
+    """Style of every cell of the area as shown by Excel: cell style, else row style (customFormat), else column style"""
+    ws = openpyxl.load_workbook(file)["Sheet 1"]
+    col_styles = {}
+    for dimension in ws.column_dimensions.values():
+        if dimension.has_style:
+            for col_num in range(dimension.min, dimension.max + 1):
+                col_styles[col_num] = _style(dimension)
+    default = _style(openpyxl.cell.Cell(ws))
+    styles = {}
+    for row_num in range(1, shape[0] + 1):
+        row_dimension = ws.row_dimensions.get(row_num)
+        for col_num in range(1, shape[1] + 1):
+            if (row_num, col_num) in ws._cells:
+                styles[row_num, col_num] = (ws._cells[row_num, col_num].value, _style(ws._cells[row_num, col_num]))
+            elif row_dimension is not None and row_dimension.customFormat:
+                styles[row_num, col_num] = (None, _style(row_dimension))
+            else:
+                styles[row_num, col_num] = (None, col_styles.get(col_num, default))
+    return styles, len(ws._cells)
+
+
+@pytest.mark.parametrize(
+    "engine, streaming", [("openpyxl", False), ("openpyxl", True), ("xml", False), ("xlsxwriter", False)]
+)
+def test_default_styles(tmp_path, engine, streaming):
+    df = pd.DataFrame(
+        {
+            "client": ["A", "B", "C", "D", "E", "F"],
+            "employees": [25_000, np.nan, 14, np.nan, 3, np.nan],
+            "RoE": [0.05, np.nan, np.nan, 1.05, -0.02, np.nan],
+            "comment": [None, "ok", None, None, "late", None],
+        }
+    ).set_index("client")
+    # a full column style and a full row style
+    style = {"RoE": "bg_light_blue", "6": "bg_light_red"}
+
+    results = {}
+    for default_styles in [False, True]:
+        file = str(tmp_path / f"testing_default_styles_{default_styles}.xlsx")
+        with ExcelWriter(file, engine=engine, streaming=streaming) as writer:
+            ws = writer.to_excel(df, sheet_name="Sheet 1", index=True, style=style, default_styles=default_styles)
+        results[default_styles] = _effective_styles(file, (len(df) + 1, df.shape[1] + 1))
+        if default_styles:
+            assert ws.stats.counters["cells_omitted"] > 0
+
+    (styles, n_cells), (default_styles, n_default_cells) = results[False], results[True]
+    # the cells look the same in Excel but fewer cells are written
+    assert default_styles == styles
+    assert n_default_cells < n_cells
+
+
+def test_default_styles_chunks(tmp_path):
+    df = pd.DataFrame({"a": [1.0, np.nan] * 10, "b": [np.nan, "x"] * 10})
+    file = str(tmp_path / "testing_default_styles.xlsx")
+    with ExcelWriter(file, engine="xml") as writer:
+        writer.to_excel((df.iloc[i : i + 5] for i in range(0, len(df), 5)), sheet_name="Sheet 1", default_styles=True)
+
+    ws = openpyxl.load_workbook(file)["Sheet 1"]
+    assert ws.column_dimensions["A"].has_style and ws.column_dimensions["B"].has_style
+    assert [ws.cell(row=row_num, column=1).value for row_num in range(2, 6)] == [1, None, 1, None]
+    # only the header and the cells with values are written
+    assert len(list(ws.iter_rows(min_row=2, values_only=True))) == len(df)
+    assert sum(1 for row in ws.iter_rows(min_row=2) for cell in row if cell.has_style) == df.notna().sum().sum()
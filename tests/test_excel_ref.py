@@ -2,6 +2,7 @@
 import datetime
 import numpy as np
 import pandas as pd
+import pytest
 from beautifulexcel import ExcelWriter
 
 
@@ -108,3 +109,24 @@ def test_util_get_cell_coordinates():
 
 
 
+
+
+def test_util_resolve_refs(tmp_path):
+    df = pd.DataFrame({"employees": [1, 2, 3], "RoE": [0.1, 0.2, 0.3]}).rename_axis("client")
+    with ExcelWriter(str(tmp_path / "testing_refs.xlsx")) as writer:
+        ws = writer.to_excel(df, sheet_name="Sheet 1", startcol=1, index=True)
+
+        refs = ["A2:C4", "employees", "client:RoE", "4:-1", "not_a_column", "employees:missing"]
+        with pytest.warns(UserWarning) as record:
+            coordinates = ws.util_resolve_refs(refs)
+        # one warning for all refs that could not be found
+        assert len(record) == 1
+        assert 'Refs "not_a_column", "missing" could not be found' in str(record[0].message)
+        assert coordinates == [((2, 1), (4, 3)), ((None, 3), (None, 3)), ((None, 2), (None, 4)), ((-1, None), (4, None)), None, None]
+        assert coordinates[:4] == [ws.util_get_range_coordinates(ref) for ref in refs[:4]]
+        assert ws.util_resolve_refs(["employees"], enrich_dimensions=True) == [((2, 3), (4, 3))]
+        assert ws.stats.counters["ranges_resolved"] >= len(refs)
+
+        # style refs are resolved in bulk too
+        with pytest.warns(UserWarning, match='Styling refs "nope", "gone" could not be found'):
+            writer.to_excel(df, sheet_name="Sheet 2", style={"nope": "bg_light_blue", "gone": "bg_light_red", "RoE": "bg_light_blue"})
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter, read_excel
+
+
+class _ResponseStream:
+    """Non-seekable binary stream e.g. a web response that records the written chunks"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def getvalue(self):
+        return b"".join(self.chunks)
+
+
+def _df(n_rows=2_000):
+    return pd.DataFrame(
+        {
+            "id": np.arange(n_rows),
+            "label": np.array(["x", "yy", "zzz"])[np.arange(n_rows) % 3],
+            "value": np.linspace(0, 1, n_rows),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "engine, streaming", [("openpyxl", False), ("openpyxl", True), ("xml", False), ("xlsxwriter", False)]
+)
+def test_file_objects(tmp_path, engine, streaming):
+    df = _df()
+    buffer, stream = io.BytesIO(), _ResponseStream()
+    for target in [buffer, stream]:
+        with ExcelWriter(target, engine=engine, streaming=streaming) as writer:
+            writer.to_excel(df, sheet_name="Sheet 1", style={"value": "bg_light_blue"})
+            writer.to_excel(df.head(), sheet_name="Sheet 2", index=True)
+
+        data = target.getvalue()
+        assert openpyxl.load_workbook(io.BytesIO(data)).sheetnames == ["Sheet 1", "Sheet 2"]
+        pd.testing.assert_frame_equal(read_excel(io.BytesIO(data), sheet_name="Sheet 1"), df)
+    # the package is written part by part into the stream
+    assert len(stream.chunks) > 10
+    # no file is created anywhere
+    assert os.listdir(tmp_path) == []
+
+
+def test_file_object_rendered_sheets():
+    df = _df()
+    stream = _ResponseStream()
+    with ExcelWriter(stream, engine="xml", profile=True) as writer:
+        writer.to_excel(df, sheet_name="Sheet 1", as_table=True)
+        writer.to_excel_many({"Sheet 2": df, "Sheet 3": df.head()}, workers=1)
+
+    data = stream.getvalue()
+    wb = openpyxl.load_workbook(io.BytesIO(data))
+    assert wb.sheetnames == ["Sheet 1", "Sheet 2", "Sheet 3"] and list(wb["Sheet 1"].tables) == ["Table1"]
+    for sheet_name in wb.sheetnames:
+        pd.testing.assert_frame_equal(
+            read_excel(io.BytesIO(data), sheet_name=sheet_name), df if sheet_name != "Sheet 3" else df.head()
+        )
+
+
+def test_file_object_errors():
+    with pytest.raises(Exception, match="writable binary file object"):
+        ExcelWriter(42)
+    with pytest.raises(Exception, match="needs a file path"):
+        ExcelWriter(io.BytesIO(), mode="modify")
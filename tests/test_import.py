@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+
+# import time budget of beautifulexcel and its dependency free helpers in seconds
+IMPORT_TIME_BUDGET = 0.1
+HEAVY_DEPENDENCIES = ["numpy", "pandas", "openpyxl", "yaml", "xlsxwriter"]
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_import_is_lazy():
+    code = f"""
+import sys, time
+time_start = time.perf_counter()
+import beautifulexcel
+from beautifulexcel.utils import excel_column_name
+assert excel_column_name(28) == "AB"
+print(time.perf_counter() - time_start)
+print(",".join(module for module in {HEAVY_DEPENDENCIES} if module in sys.modules))
+"""
+    import_time, heavy_modules = (_run(code).splitlines() + [""])[:2]
+    assert heavy_modules == ""
+    assert float(import_time) < IMPORT_TIME_BUDGET
+
+
+def test_lazy_excel_writer():
+    assert _run("from beautifulexcel import ExcelWriter; print(ExcelWriter.__module__)") == "beautifulexcel.writer"
+    assert _run("import beautifulexcel; print('ExcelWriter' in dir(beautifulexcel))") == "True"
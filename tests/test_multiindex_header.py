@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import io
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter
+
+COLUMNS = pd.MultiIndex.from_tuples([("A", "x"), ("A", "y"), ("B", "z")], names=["l1", "l2"])
+FRAMES = {
+    "named_index": pd.DataFrame(
+        np.arange(9).reshape(3, 3), columns=COLUMNS, index=pd.Index(["r1", "r2", "r3"], name="idx")
+    ),
+    "multiindex": pd.DataFrame(
+        np.arange(12).reshape(4, 3),
+        columns=COLUMNS,
+        index=pd.MultiIndex.from_tuples([("g1", "r1"), ("g1", "r2"), ("g1", "r3"), ("g2", "r4")], names=["grp", "idx"]),
+    ),
+    "unnamed_index": pd.DataFrame(np.arange(9).reshape(3, 3), columns=COLUMNS),
+}
+
+
+def _cells(file, styles):
+    """Values (and styles) of all written cells and the merged ranges of the sheet"""
+    ws = openpyxl.load_workbook(file)["Sheet1"]
+    cells = {}
+    for row in ws.iter_rows():
+        for cell in row:
+            if cell.value is not None or cell.has_style:
+                style = (
+                    (cell.number_format, repr(cell.font), repr(cell.fill), repr(cell.border), repr(cell.alignment))
+                    if styles
+                    else ()
+                )
+                cells[cell.coordinate] = (cell.value, *style)
+    return cells, sorted(str(merged) for merged in ws.merged_cells.ranges)
+
+
+# the xlsxwriter engine serializes the same styles slightly differently (e.g. font family) so only values are compared
+@pytest.mark.parametrize(
+    "writer_kwargs, styles", [({"streaming": True}, True), ({"engine": "xlsxwriter"}, False), ({"engine": "xml"}, True)]
+)
+@pytest.mark.parametrize("frame", list(FRAMES))
+def test_multiindex_header_parity(writer_kwargs, styles, frame):
+    df = FRAMES[frame]
+    files = {}
+    for name, kwargs in {"openpyxl": {}, "other": writer_kwargs}.items():
+        files[name] = io.BytesIO()
+        with ExcelWriter(files[name], theme="elegant_blue", **kwargs) as writer:
+            writer.to_excel(df, sheet_name="Sheet1", index=True, startrow=1)
+
+    expected_cells, expected_merges = _cells(files["openpyxl"], styles)
+    cells, merges = _cells(files["other"], styles)
+    assert cells == expected_cells
+    assert merges == expected_merges
+    # pandas writes the index names into an extra row below the MultiIndex header
+    assert expected_cells["A4"][0] == (None if frame == "unnamed_index" else df.index.names[0])
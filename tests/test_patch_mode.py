@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import re
+import shutil
+import zipfile
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter
+from tests.helpers import cell_styles
+
+
+def _parts(file):
+    with zipfile.ZipFile(file) as package:
+        return {name: package.read(name) for name in package.namelist()}
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xml"])
+def test_patch_mode(tmp_path, engine):
+    df = pd.DataFrame({"client": ["A", "B", "C"], "employees": [25_000, 17_000_000, 14], "RoE": [0.05, -0.05, 1.05]})
+    file = str(tmp_path / "testing_patch.xlsx")
+    # existing file with shared strings and custom number formats that are not written by openpyxl
+    with pd.ExcelWriter(file, engine="xlsxwriter") as writer:
+        df.to_excel(writer, sheet_name="Sheet 1")
+        df.to_excel(writer, sheet_name="Sheet 2")
+        writer.sheets["Sheet 1"].write("F1", 0.5, writer.book.add_format({"num_format": "0.000%", "bold": True}))
+    shutil.copy(file, tmp_path / "testing_modify.xlsx")
+    parts_before = _parts(file)
+
+    for path, mode in [(file, "patch"), (str(tmp_path / "testing_modify.xlsx"), "modify")]:
+        with ExcelWriter(path, mode=mode, engine=engine if mode == "patch" else "openpyxl") as writer:
+            writer.to_excel(df, sheet_name="Sheet 2", style={"RoE": {"fill": "FFEEB7", "numFmt": "0.000%"}})
+            writer.to_excel(df, sheet_name="Sheet 3", index=True)
+
+    # untouched parts are copied byte for byte
+    parts_after = _parts(file)
+    for name in ["xl/worksheets/sheet1.xml", "xl/sharedStrings.xml", "xl/theme/theme1.xml", "docProps/core.xml"]:
+        assert parts_after[name] == parts_before[name]
+    # existing cell styles keep their ids and new ones are appended
+    old_xfs = re.search(rb"<cellXfs[^>]*>(.*)</cellXfs>", parts_before["xl/styles.xml"])[1]
+    assert re.search(rb"<cellXfs[^>]*>(.*)</cellXfs>", parts_after["xl/styles.xml"])[1].startswith(old_xfs)
+
+    assert openpyxl.load_workbook(file).sheetnames == ["Sheet 1", "Sheet 2", "Sheet 3"]
+    assert cell_styles(file) == cell_styles(tmp_path / "testing_modify.xlsx")
+
+
+def test_patch_mode_errors(tmp_path):
+    df = pd.DataFrame({"a": [1, 2]})
+    file = str(tmp_path / "testing_patch.xlsx")
+    with ExcelWriter(file) as writer:
+        writer.to_excel(df, sheet_name="Sheet 1")
+
+    with pytest.raises(Exception, match="already exists"):
+        with ExcelWriter(file, mode="patch", if_sheet_exists="error") as writer:
+            writer.to_excel(df, sheet_name="Sheet 1")
+    with pytest.raises(Exception, match="can only replace existing sheets"):
+        ExcelWriter(file, mode="patch", if_sheet_exists="overlay")
+    with pytest.raises(Exception, match="can only create new files"):
+        ExcelWriter(file, mode="patch", engine="xlsxwriter")
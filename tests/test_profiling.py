@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import pytest
+from beautifulexcel import ExcelWriter
+
+
+def test_profile_stats(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210], "duration": [50, 40, 45, 90]})
+    hook_stats = []
+
+    for engine in ["openpyxl", "xml"]:
+        with ExcelWriter(
+            str(tmp_path / f"testing_{engine}.xlsx"), engine=engine, profile_hook=hook_stats.append
+        ) as writer:
+            with pytest.warns(UserWarning, match="not_a_column"):
+                ws1 = writer.to_excel(
+                    df, sheet_name="Test Sheet 1", style={"not_a_column": "bg_light_blue", "A2:B3": "bg_light_blue"}
+                )
+
+        stats = writer.stats
+        assert hook_stats[-1] is stats
+        assert {"setup", "to_excel", "save"} <= set(stats.phases)
+        assert stats.counters["sheets"] == 1 and stats.counters["warnings"] >= 1
+        assert stats.counters["file_size_bytes"] > 0
+
+        sheet_stats = stats.sheets[0]
+        assert sheet_stats is ws1.stats and sheet_stats.engine == engine
+        assert {"theme_styles", "number_formats", "custom_styles", "autofit", "resolve_styles", "col_widths"} <= set(
+            sheet_stats.phases
+        )
+        assert ("apply_table_style" if engine == "openpyxl" else "write_rows") in sheet_stats.phases
+        assert sheet_stats.counters["rows"] == 4 and sheet_stats.counters["columns"] == 2
+        assert sheet_stats.counters["cells_styled"] == df.size + len(df.columns)
+        assert sheet_stats.counters["styles_created"] >= 2
+        assert sheet_stats.counters["ranges_resolved"] >= 2
+        json.dumps(stats.to_dict())
+
+
+def test_profile_off(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210]})
+    with ExcelWriter(str(tmp_path / "testing.xlsx")) as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1")
+    assert writer.stats is None
+    assert "warnings" not in ws1.stats.counters and "autofit" in ws1.timings
+
+
+def test_profile_warnings_threads(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210]})
+
+    def export(n_sheets):
+        with ExcelWriter(str(tmp_path / f"testing_{n_sheets}.xlsx"), profile=True) as writer:
+            for i in range(n_sheets):
+                writer.to_excel(df, sheet_name=f"Sheet {i}", style={f"not_a_column_{n_sheets}": "bg_light_blue"})
+        return writer.stats.counters["warnings"]
+
+    # the warnings of concurrent writers are counted per writer - also if they are filtered out
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        filters = list(warnings.filters)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(export, [1, 2, 3, 4] * 3)) == [1, 2, 3, 4] * 3
+        assert warnings.filters == filters
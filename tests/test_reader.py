@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import datetime
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from beautifulexcel import ExcelWriter, read_excel
+
+
+def _df():
+    return pd.DataFrame(
+        {
+            "client": ["A", "B", "C", "D", "E"],
+            "industry": ["ASSET", "ASSET", "<BANK & CO>", None, " INS "],
+            "employees": [25_000, 17_000_000, 14, 3, 5],
+            "revenue": [1.5, np.nan, 3.25, -1e20, 0.1 + 0.2],
+            "inception": [
+                datetime.datetime(2022, 1, 1, 12, 30, 15, 123456),
+                pd.NaT,
+                datetime.datetime(1901, 1, 1),
+                datetime.datetime(1962, 1, 1),
+                datetime.datetime(2003, 11, 10),
+            ],
+            "active": [True, False, True, True, False],
+        }
+    )
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xml", "xlsxwriter"])
+@pytest.mark.parametrize("index", [None, ["client"], ["industry", "client"]])
+def test_read_excel_round_trip(tmp_path, engine, index):
+    df = _df().set_index(index) if index else _df()
+    file = str(tmp_path / "testing_reader.xlsx")
+    with ExcelWriter(file, engine=engine) as writer:
+        writer.to_excel(df, sheet_name="Sheet 1", startrow=2, startcol=1, index=bool(index))
+
+    df_read = read_excel(file, sheet_name="Sheet 1", startrow=2, startcol=1, index=len(index) if index else False)
+    pd.testing.assert_frame_equal(df_read, df, check_index_type=False)
+    assert list(df_read.dtypes.astype(str)) == list(df.dtypes.astype(str))
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xml", "xlsxwriter"])
+def test_read_excel_multiindex_header_and_chunks(tmp_path, engine):
+    columns = pd.MultiIndex.from_tuples([("a", "x"), ("a", "y"), ("b", "z")], names=["l0", "l1"])
+    index = pd.MultiIndex.from_tuples(
+        [("g1", "r1"), ("g1", "r2"), ("g1", "r3"), ("g2", "r4"), ("g2", "r5")], names=["grp", "row"]
+    )
+    df = pd.DataFrame(np.arange(15).reshape(5, 3), index=index, columns=columns)
+    file = str(tmp_path / "testing_reader.xlsx")
+    with ExcelWriter(file, engine=engine) as writer:
+        writer.to_excel(df, sheet_name="Sheet 1", startrow=1, startcol=2, index=True)
+
+    kwargs = dict(sheet_name="Sheet 1", startrow=1, startcol=2, index=2, header=2)
+    pd.testing.assert_frame_equal(read_excel(file, **kwargs), df)
+
+    # merged index labels are continued across chunks
+    chunks = list(read_excel(file, chunksize=2, **kwargs))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), read_excel(file, **kwargs))
+
+    assert read_excel(file, nrows=2, **kwargs).index.tolist() == [("g1", "r1"), ("g1", "r2")]
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xml", "xlsxwriter"])
+def test_read_excel_multiindex_header_unnamed_index(tmp_path, engine):
+    columns = pd.MultiIndex.from_tuples([("a", "x"), ("a", "y"), ("b", "z")])
+    df = pd.DataFrame(np.arange(9).reshape(3, 3), index=["r1", "r2", "r3"], columns=columns)
+    file = str(tmp_path / "testing_reader.xlsx")
+    with ExcelWriter(file, engine=engine) as writer:
+        writer.to_excel(df, sheet_name="Sheet 1", index=True)
+
+    # the blank index names row below the header is no table row
+    pd.testing.assert_frame_equal(read_excel(file, sheet_name="Sheet 1", index=1, header=2), df)
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xml", "xlsxwriter"])
+def test_read_excel_number_format_dtypes(tmp_path, engine):
+    df = pd.DataFrame(
+        {
+            "float": [1.0, 2.0, 3.0],
+            "float_large": [1_000.0, 2_000.0, 3_000.0],
+            "int": [1, 2, 3],
+            "int_pct": [0, 1, 1],
+            "float_pct": [0.5, 0.25, 1.0],
+        }
+    )
+    file = str(tmp_path / "testing_reader.xlsx")
+    with ExcelWriter(file, engine=engine) as writer:
+        writer.to_excel(df, sheet_name="Sheet 1")
+
+    # whole number floats are read as floats if their number format shows decimal places
+    df_read = read_excel(file, sheet_name="Sheet 1")
+    pd.testing.assert_frame_equal(
+        df_read[["float", "int", "int_pct", "float_pct"]], df[["float", "int", "int_pct", "float_pct"]]
+    )
+    # without decimal places or missing values whole numbers can't be told apart from integers
+    assert df_read["float_large"].dtype == np.int64
+
+
+def test_read_excel_large_file_object(tmp_path):
+    n_rows = 25_000
+    df = pd.DataFrame(
+        {
+            "id": np.arange(n_rows),
+            "value": np.linspace(0, 1, n_rows),
+            "label": np.array(["x", "yy", "zzz"])[np.arange(n_rows) % 3],
+            "date": pd.date_range("2000-01-01", periods=n_rows, freq="h"),
+        }
+    )
+    file = str(tmp_path / "testing_reader.xlsx")
+    with ExcelWriter(file, engine="xml") as writer:
+        writer.to_excel(df, sheet_name="Sheet 1")
+
+    with open(file, "rb") as f:
+        buffer = io.BytesIO(f.read())
+    pd.testing.assert_frame_equal(read_excel(buffer), df, check_dtype=False)
+    chunks = list(read_excel(file, chunksize=10_000))
+    assert [len(chunk) for chunk in chunks] == [10_000, 10_000, 5_000]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df, check_dtype=False)
+
+
+def test_read_excel_cell_types(tmp_path):
+    # shared strings, formulas, errors, and cells without style ids written by another tool
+    file = str(tmp_path / "testing_reader.xlsx")
+    with pd.ExcelWriter(file, engine="xlsxwriter") as writer:
+        pd.DataFrame({"text": ["a", "b"], "number": [1, 2]}).to_excel(writer, sheet_name="Data", index=False)
+        writer.sheets["Data"].write_formula("C1", '="total"', value="total")
+        writer.sheets["Data"].write_formula("C2", "=B2*2", value=2)
+        writer.sheets["Data"].write_formula("C3", "=NA()", value="#N/A")
+
+    df = read_excel(file, sheet_name="Data")
+    assert df.columns.tolist() == ["text", "number", "total"]
+    assert df["text"].tolist() == ["a", "b"]
+    assert df["number"].tolist() == [1, 2]
+    assert df["total"].tolist() == [2, "#N/A"]
+
+
+def test_read_excel_missing_sheet(tmp_path):
+    file = str(tmp_path / "testing_reader.xlsx")
+    with ExcelWriter(file) as writer:
+        writer.to_excel(_df(), sheet_name="Sheet 1")
+    with pytest.raises(Exception, match="Available sheets are"):
+        read_excel(file, sheet_name="Sheet 2")
+    with pytest.raises(Exception, match="no sheet at position"):
+        read_excel(file, sheet_name=1)
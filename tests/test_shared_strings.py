@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import io
+import zipfile
+import numpy as np
+import pandas as pd
+import openpyxl
+from beautifulexcel import ExcelTemplate, ExcelWriter, read_excel
+from beautifulexcel.sheet_xml import SharedStrings, encode_column
+
+
+def _df(n_rows=40):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "industry": pd.Categorical(
+                rng.choice(["BANK", "INSURANCE", "ASSET MANAGEMENT & CO"], n_rows),
+                categories=["BANK", "INSURANCE", "ASSET MANAGEMENT & CO", "UNUSED"],
+            ),
+            "country": rng.choice([" Germany ", "France", None], n_rows),
+            "comment": [f"comment {i}" for i in range(n_rows)],
+            "employees": rng.integers(0, 1_000, n_rows),
+        }
+    )
+
+
+def test_encode_column_shared_strings():
+    ws = openpyxl.Workbook().active
+
+    def value_with_fmt(value):
+        return value, None
+
+    shared_strings = SharedStrings()
+    df = _df()
+
+    contents, codes, _, _ = encode_column(df["industry"], ws, value_with_fmt, shared_strings)
+    assert all(content.startswith(' t="s">') for content in contents[codes])
+    # unused categories are not added to the table
+    assert len(shared_strings) == 3
+
+    contents, codes, _, _ = encode_column(df["country"], ws, value_with_fmt, shared_strings)
+    assert len(shared_strings) == 5
+    assert '<t xml:space="preserve"> Germany </t>' in shared_strings.indices
+
+    # unique texts stay inline strings
+    contents, codes, _, _ = encode_column(df["comment"], ws, value_with_fmt, shared_strings)
+    assert all(content.startswith(' t="inlineStr">') for content in contents[codes])
+    assert len(shared_strings) == 5
+
+
+def test_shared_strings_xml_engine():
+    df = _df()
+    output = io.BytesIO()
+    with ExcelWriter(output, engine="xml", theme="elegant_blue") as writer:
+        writer.to_excel(df, sheet_name="Sheet1")
+
+    with zipfile.ZipFile(output) as package:
+        assert b"<si><t>ASSET MANAGEMENT &amp; CO</t></si>" in package.read("xl/sharedStrings.xml")
+        assert b"/sharedStrings" in package.read("xl/_rels/workbook.xml.rels")
+        assert b"sharedStrings+xml" in package.read("[Content_Types].xml")
+
+    expected = df.astype({"industry": object}).replace({None: np.nan})
+    pd.testing.assert_frame_equal(read_excel(output, sheet_name="Sheet1"), expected, check_dtype=False)
+    pd.testing.assert_frame_equal(pd.read_excel(output, sheet_name="Sheet1"), expected, check_dtype=False)
+
+
+def test_shared_strings_template():
+    template = ExcelTemplate(lambda writer: writer.to_excel(_df(5), sheet_name="Sheet1"))
+    for n_rows in [50, 20]:
+        df = _df(n_rows)
+        output = io.BytesIO()
+        template.render(output, {"Sheet1": df})
+        with zipfile.ZipFile(output) as package:
+            # every render has its own table
+            assert package.read("xl/sharedStrings.xml").count(b"<si>") == 5
+        pd.testing.assert_frame_equal(
+            read_excel(output, sheet_name="Sheet1"),
+            df.astype({"industry": object}).replace({None: np.nan}),
+            check_dtype=False,
+        )
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter
+from tests.helpers import cell_styles, example_df
+
+
+def test_streaming_same_as_in_place(tmp_path):
+    df = example_df().set_index("client")
+
+    for streaming in [False, True]:
+        with ExcelWriter(str(tmp_path / f"testing_streaming_{streaming}.xlsx"), streaming=streaming) as writer:
+            ws1 = writer.to_excel(
+                df,
+                sheet_name="Test Sheet 1",
+                startrow=1,
+                startcol=1,
+                index=True,
+                style={"RoE": "bg_light_blue", "B3:C4": {"font": {"italic": True}}},
+                col_widths={"employees": 30},
+            )
+            ws1.merge_cells("B8:C9")
+            ws1.add_data_validation(ref="employees", type="list", props=["Y", "N"])
+
+    assert cell_styles(tmp_path / "testing_streaming_False.xlsx") == cell_styles(
+        tmp_path / "testing_streaming_True.xlsx"
+    )
+
+    ws = openpyxl.load_workbook(tmp_path / "testing_streaming_True.xlsx")["Test Sheet 1"]
+    assert [str(i) for i in ws.merged_cells.ranges] == ["B8:C9"]
+    assert str(ws.data_validations.dataValidation[0].sqref) == "D3:D6"
+
+
+def test_streaming_random_access_errors(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210], "duration": [50, 40, 45, 90]})
+
+    with ExcelWriter(str(tmp_path / "testing_streaming.xlsx"), streaming=True) as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1")
+
+        with pytest.raises(Exception, match="streaming=True"):
+            ws1.write_cell("A1", "Hello")
+        with pytest.raises(Exception, match="streaming=True"):
+            ws1.group_rows("1:2")
+        with pytest.raises(Exception, match="streaming=True"):
+            writer.to_excel(df, sheet_name="Test Sheet 1", startrow=10)
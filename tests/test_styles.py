@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+from beautifulexcel import ExcelWriter
+from beautifulexcel.styles import StyleCache, style_key
+
+
+def test_style_key():
+    assert style_key({"font__bold": True, "fill": "FFEEB7"}) == style_key({"fill": "FFEEB7", "font__bold": True})
+    assert style_key({"font__bold": True}) != style_key({"font__bold": False})
+    hash(style_key({"gfill__stop": ["FFFFFF", "000000"]}))
+
+
+def test_style_cache(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210], "duration": [50, 40, 45, 90], "test": [4, 1, 4, 7]})
+
+    with ExcelWriter(str(tmp_path / "testing.xlsx"), theme="elegant_blue") as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1", style={"duration": {"fill": "FFEEB7"}})
+
+        cache = writer.style_cache
+        assert cache.misses == len(cache.bundles)
+        assert cache.cells == df.size + len(df.columns)
+        assert cache.misses <= 3
+
+        assert ws1.ws["B2"].fill.fgColor.rgb == "00FFEEB7"
+        assert ws1.ws["A2"].fill.fgColor.rgb != "00FFEEB7"
+        assert ws1.ws["A1"].font.bold
+        assert ws1.ws["A2"].font.name == "Arial"
+
+    cache = StyleCache()
+    assert cache.get({"font__bold": True}) is cache.get({"font__bold": True})
+    assert cache.stats() == {"hits": 1, "misses": 1, "styles": 1, "cells": 0}
+
+
+def test_auto_number_formatting(tmp_path):
+    df = pd.DataFrame(
+        {
+            "pct": [0.05, -0.5, 0, 1.2, None],
+            "decimal": [1.5, 20.25, 300.0, 0, 5.5],
+            "count": [1, 20, 300, 0, 5],
+            "mm": [20_000_000, 50_000_000, 0, 30_000_000, 90_000_000],
+            "cob": [20220101, 20221231, 20230630, 20230101, 20240101],
+            "empty": [None, None, None, None, None],
+        }
+    ).astype({"empty": float})
+
+    with ExcelWriter(str(tmp_path / "testing.xlsx")) as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1")
+        assert ws1.style_base["pct"] == ws1._extend_style_args("num_fmt_pct")
+        assert ws1.style_base["decimal"] == ws1._extend_style_args("num_fmt_decimal")
+        assert ws1.style_base["mm"] == ws1._extend_style_args("num_fmt_mm")
+        assert ws1.style_base["cob"] == ws1._extend_style_args("num_fmt_mm")
+        assert "count" not in ws1.style_base
+        assert ws1.style_base["empty"] == ws1._extend_style_args("num_fmt_general")
+
+        # only the sampled (first and last) rows are used to detect the number format
+        ws2 = writer.to_excel(
+            pd.DataFrame({"mixed": [0.5, 5_000.0, 5_000.0, 5_000.0, 0.5]}),
+            sheet_name="Test Sheet 2",
+            number_format_sample=2,
+        )
+        assert ws2.style_base["mixed"] == ws2._extend_style_args("num_fmt_pct")
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter, read_excel
+
+
+def _df():
+    return pd.DataFrame(
+        {
+            "client": ["A", "B", "C", "D"],
+            "employees": [25_000, 17_000_000, np.nan, 3],
+            "RoE": [0.05, -0.05, 0.15, 1.05],
+            "roe": [1, 2, 3, 4],
+        }
+    ).set_index("client")
+
+
+@pytest.mark.parametrize("engine, streaming", [("openpyxl", False), ("openpyxl", True), ("xml", False)])
+def test_as_table_theme_style(tmp_path, engine, streaming):
+    file = str(tmp_path / "testing_table.xlsx")
+    df = _df()
+    with ExcelWriter(file, engine=engine, streaming=streaming) as writer:
+        writer.to_excel(
+            (df.iloc[i : i + 2] for i in range(0, len(df), 2)),
+            sheet_name="Sheet 1",
+            startrow=1,
+            index=True,
+            as_table=True,
+            style={"RoE": "bg_light_blue"},
+        )
+        writer.to_excel(df.iloc[:0], sheet_name="Sheet 2", as_table=True)
+
+    wb = openpyxl.load_workbook(file)
+    ws = wb["Sheet 1"]
+    table = ws.tables["Table1"]
+    assert table.ref == "A2:D6"
+    assert table.tableStyleInfo.name == "beautifulexcel_elegant_blue" and table.tableStyleInfo.showFirstColumn
+    # unique (case-insensitive) text headers
+    assert [column.name for column in table.tableColumns] == ["client", "employees", "RoE", "roe2"]
+    assert [cell.value for cell in ws[2]] == ["client", "employees", "RoE", "roe2"]
+    # header and index are styled by the table style - number formats and custom styles are kept as cell styles
+    assert not ws["A2"].font.b and not ws["A3"].font.b and ws["A3"].fill.fill_type is None
+    assert ws["C3"].number_format == "#,##0.0%;[Red]-#,##0.0%" and ws["C3"].fill.fgColor.rgb.endswith("DCE6F1")
+    assert [table_style.name for table_style in wb._table_styles.tableStyle] == ["beautifulexcel_elegant_blue"]
+    # empty tables get an empty body row
+    assert dict(wb["Sheet 2"].tables.items()) == {"Table2": "A1:C2"}
+
+    pd.testing.assert_frame_equal(
+        read_excel(file, sheet_name="Sheet 1", startrow=1, index=1), df.set_axis(["employees", "RoE", "roe2"], axis=1)
+    )
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter"])
+def test_as_table_builtin_style(tmp_path, engine):
+    file = str(tmp_path / "testing_table.xlsx")
+    index = pd.MultiIndex.from_tuples([("g1", "A"), ("g1", "B"), ("g2", "C"), ("g2", "D")], names=["group", None])
+    df = _df().set_axis(index)
+    with ExcelWriter(file, engine=engine) as writer:
+        writer.to_excel(df, sheet_name="Sheet 1", index=True, as_table="TableStyleLight9")
+
+    ws = openpyxl.load_workbook(file)["Sheet 1"]
+    table = ws.tables["Table1"]
+    assert table.ref == "A1:E5" and table.tableStyleInfo.name == "TableStyleLight9"
+    assert [column.name for column in table.tableColumns] == ["group", "Column2", "employees", "RoE", "roe2"]
+    # tables cannot contain merged cells - the index labels are repeated
+    assert not ws.merged_cells.ranges
+    assert [ws.cell(row=row_num, column=1).value for row_num in range(2, 6)] == ["g1", "g1", "g2", "g2"]
+
+
+def test_as_table_errors(tmp_path):
+    file = str(tmp_path / "testing_table.xlsx")
+    df = _df()
+    with ExcelWriter(file) as writer:
+        with pytest.raises(Exception, match="MultiIndex columns"):
+            writer.to_excel(
+                df.set_axis(pd.MultiIndex.from_product([["a"], ["x", "y", "z"]]), axis=1),
+                sheet_name="Sheet 1",
+                as_table=True,
+            )
+        with pytest.raises(Exception, match="header=True"):
+            writer.to_excel(df, sheet_name="Sheet 1", header=False, as_table=True)
+        with pytest.raises(Exception, match="cannot write Excel tables"):
+            writer.to_excel_many({"Sheet 2": df}, workers=1, as_table=True)
+        writer.to_excel(df, sheet_name="Sheet 1")
+    with ExcelWriter(str(tmp_path / "testing_table_xlsxwriter.xlsx"), engine="xlsxwriter") as writer:
+        with pytest.raises(Exception, match="built-in table style"):
+            writer.to_excel(df, sheet_name="Sheet 1", as_table=True)
+        writer.to_excel(df, sheet_name="Sheet 1")
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import io
+import pickle
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelTemplate, ExcelWriter, read_excel
+
+
+def _df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "client": [f"client {i}" for i in range(n_rows)],
+            "employees": rng.integers(0, 1_000_000, n_rows),
+            "RoE": rng.normal(size=n_rows).round(4),
+            "inception": pd.date_range("2020-01-01", periods=n_rows, freq="D"),
+        }
+    ).set_index("client")
+
+
+def _build(writer):
+    ws = writer.to_excel(_df(20), sheet_name="Report", startrow=2, index=True, style={"RoE": "bg_light_blue"})
+    ws.write_cell("A1", "Client report")
+    ws.add_data_validation(ref="employees", type="whole")
+    ws.group_columns("RoE:inception")
+    writer.to_excel(_df(3).reset_index(), sheet_name="Table", as_table=True)
+
+
+def _cell_style(cell):
+    return (cell.value, cell.number_format, repr(cell.font), repr(cell.fill), repr(cell.border), repr(cell.alignment))
+
+
+def test_template(tmp_path):
+    template = ExcelTemplate(_build, theme="elegant_blue")
+    for n_rows in [50, 5]:
+        df = _df(n_rows, seed=n_rows)
+        file = str(tmp_path / f"testing_template_{n_rows}.xlsx")
+        template.render(file, {"Report": df, "Table": df.reset_index()})
+
+        pd.testing.assert_frame_equal(
+            read_excel(file, sheet_name="Report", startrow=2, index=True), df, check_index_type=False
+        )
+        wb = openpyxl.load_workbook(file)
+        ws = wb["Report"]
+        assert ws["A1"].value == "Client report"
+        assert str(ws.data_validations.dataValidation[0].sqref) == f"B4:B{n_rows + 3}"
+        assert ws.column_dimensions["C"].outlineLevel == 1
+        assert ws.max_row == n_rows + 3
+        assert [table.ref for table in wb["Table"].tables.values()] == [f"A1:D{n_rows + 1}"]
+
+        # the cells look like the cells of the same table written with ExcelWriter
+        direct_file = str(tmp_path / "testing_template_direct.xlsx")
+        with ExcelWriter(direct_file, theme="elegant_blue") as writer:
+            writer.to_excel(df, sheet_name="Report", startrow=2, index=True, style={"RoE": "bg_light_blue"})
+        direct_ws = openpyxl.load_workbook(direct_file)["Report"]
+        for row in direct_ws.iter_rows(min_row=3):
+            for direct_cell in row:
+                assert _cell_style(ws[direct_cell.coordinate]) == _cell_style(direct_cell)
+
+
+def test_template_empty_region():
+    template = ExcelTemplate(_build)
+    output = io.BytesIO()
+    template.render(output, {"Table": _df(2).reset_index()})
+    wb = openpyxl.load_workbook(output)
+    # the header stays and the data region without dataframe is empty
+    assert wb["Report"].max_row == 3
+    assert [cell.value for cell in wb["Report"][3]] == ["client", "employees", "RoE", "inception"]
+    assert wb["Table"].max_row == 3
+
+
+def test_template_cache(tmp_path):
+    cache = str(tmp_path / "template.pkl")
+    calls = []
+
+    def build(writer):
+        calls.append(1)
+        _build(writer)
+
+    ExcelTemplate(build, cache=cache)
+    template = ExcelTemplate(build, cache=cache)
+    assert len(calls) == 1
+
+    # templates can be sent to other processes
+    template = pickle.loads(pickle.dumps(template))
+    df = _df(10)
+    file = str(tmp_path / "testing_template.xlsx")
+    template.render(file, {"Report": df})
+    pd.testing.assert_frame_equal(
+        read_excel(file, sheet_name="Report", startrow=2, index=True), df, check_index_type=False
+    )
+
+
+def test_template_errors():
+    template = ExcelTemplate(_build)
+    with pytest.raises(Exception, match="needs the columns"):
+        template.render(io.BytesIO(), {"Report": _df(5).drop(columns="RoE")})
+    with pytest.raises(Exception, match="no data region"):
+        template.render(io.BytesIO(), {"Other": _df(5)})
+
+    def build_twice(writer):
+        writer.to_excel(_df(5), sheet_name="Report")
+        writer.to_excel(_df(5), sheet_name="Report", startcol=6)
+
+    with pytest.raises(Exception, match="one table per sheet"):
+        ExcelTemplate(build_twice)
+
+    def build_cells_below(writer):
+        ws = writer.to_excel(_df(5), sheet_name="Report")
+        ws.write_cell("A10", "Total")
+
+    with pytest.raises(Exception, match="next to or below"):
+        ExcelTemplate(build_cells_below)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import pandas as pd
+from beautifulexcel import ExcelWriter
+from beautifulexcel.theme import load_theme, resolve_theme_path
+from beautifulexcel.utils import flatten_dict
+
+
+def test_flatten_dict():
+    assert flatten_dict({"a1": {"b": 1, "c": {"d": [1, 2]}}, "a2": 3, "e": {}}) == {
+        "a1__b": 1,
+        "a1__c__d": [1, 2],
+        "a2": 3,
+    }
+
+
+def test_theme_cache(tmp_path):
+    assert load_theme("elegant_blue") is load_theme("elegant_blue")
+    assert load_theme("elegant_blue") is load_theme(resolve_theme_path("elegant_blue"))
+
+    # changed theme files are compiled again
+    theme_file = str(tmp_path / "theme.yml")
+    shutil.copy(resolve_theme_path("elegant_blue"), theme_file)
+    theme = load_theme(theme_file)
+    with open(theme_file, "a") as file:
+        file.write("\n")
+    os.utime(theme_file, ns=(theme.mtime + 10**9, theme.mtime + 10**9))
+    assert load_theme(theme_file) is not theme
+    assert load_theme(theme_file).styles == theme.styles
+
+
+def test_theme_shared_between_writers(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210], "duration": [0.5, 0.4, 0.45, 0.9]})
+    general = {k: dict(v) for k, v in load_theme("elegant_blue").styles["general"].items()}
+
+    for _ in range(2):
+        with ExcelWriter(str(tmp_path / "testing.xlsx")) as writer:
+            writer.to_excel(df, sheet_name="Test Sheet 1", style={"duration": "bg_light_blue"})
+            assert writer.style_cache.shared_bundles is load_theme("elegant_blue").bundles
+
+    # writers must not change the shared theme styles
+    assert load_theme("elegant_blue").styles["general"] == general
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import pytest
+from beautifulexcel import ExcelWriter
+from tests.helpers import cell_styles, example_df
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_to_excel_many_same_as_to_excel(tmp_path, workers):
+    df = example_df()
+    dfs = {
+        "Clients": df,
+        "Clients (indexed)": df.set_index("client"),
+        "Employees": df[["employees"]],
+    }
+
+    files = {"to_excel": tmp_path / "testing.xlsx", "to_excel_many": tmp_path / "testing_many.xlsx"}
+    for method, file in files.items():
+        with ExcelWriter(str(file)) as writer:
+            ws1 = writer.to_excel(df, sheet_name="First", style={"client": {"font": {"italic": True}}})
+            ws1.merge_cells("A7:B8")
+            if method == "to_excel":
+                for sheet_name, sheet_df in dfs.items():
+                    writer.to_excel(sheet_df, sheet_name=sheet_name, index=True, style={"RoE": "bg_light_blue"})
+            else:
+                writer.to_excel_many(dfs, workers=workers, index=True, style={"RoE": "bg_light_blue"})
+
+    assert cell_styles(files["to_excel"]) == cell_styles(files["to_excel_many"])
+
+    with ExcelWriter(str(files["to_excel_many"])) as writer:
+        writer.to_excel(df, sheet_name="First")
+        with pytest.raises(Exception, match="already exists"):
+            writer.to_excel_many({"First": df}, workers=1)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import re
+import zipfile
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter
+from tests.helpers import cell_values, example_df
+
+pytest.importorskip("xlsxwriter")
+
+
+def test_xlsxwriter_same_as_openpyxl(tmp_path):
+    df = example_df().set_index("client")
+
+    for engine in ["openpyxl", "xlsxwriter"]:
+        with ExcelWriter(str(tmp_path / f"testing_{engine}.xlsx"), engine=engine) as writer:
+            ws1 = writer.to_excel(
+                df,
+                sheet_name="Test Sheet 1",
+                startrow=1,
+                startcol=1,
+                index=True,
+                style={"RoE": "bg_light_blue", "B3:C4": {"font": {"italic": True}}},
+            )
+            ws1.merge_cells("B8:C9")
+            # the values of the hidden cells of a merged range are cleared
+            ws1.merge_cells("C4:D5")
+            ws1.group_columns("E:F")
+            ws1.add_data_validation(ref="employees", type="list", props=["Y", "N"])
+
+    assert cell_values(tmp_path / "testing_openpyxl.xlsx") == cell_values(tmp_path / "testing_xlsxwriter.xlsx")
+
+    ws = openpyxl.load_workbook(tmp_path / "testing_xlsxwriter.xlsx")["Test Sheet 1"]
+    assert sorted(str(i) for i in ws.merged_cells.ranges) == ["B8:C9", "C4:D5"]
+    # openpyxl hides the values of merged cells when loading - the xml must not have them either
+    with zipfile.ZipFile(tmp_path / "testing_xlsxwriter.xlsx") as package:
+        sheet_xml = package.read("xl/worksheets/sheet1.xml").decode()
+    assert not re.search(r'<c r="(D4|C5|D5)"[^>]*>', sheet_xml)
+    assert str(ws.data_validations.dataValidation[0].sqref) == "D3:D6"
+    assert ws.data_validations.dataValidation[0].formula1 == '"Y,N"'
+    assert ws.column_dimensions["E"].outline_level == 1
+
+
+def test_xlsxwriter_errors(tmp_path):
+    file = str(tmp_path / "testing_xlsxwriter.xlsx")
+    df = pd.DataFrame({"calories": [420, 380, 390, 210], "duration": [50, 40, 45, 90]})
+
+    with ExcelWriter(file, engine="xlsxwriter") as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1")
+        with pytest.raises(Exception, match="xlsxwriter"):
+            ws1.apply_cell_style(1, 1, {"font__bold": True})
+
+    with pytest.raises(Exception, match="xlsxwriter"):
+        ExcelWriter(file, engine="xlsxwriter", mode="modify")
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import datetime
+import zipfile
+import numpy as np
+import pandas as pd
+import openpyxl
+import pytest
+from beautifulexcel import ExcelWriter
+from tests.helpers import cell_styles
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_xml_engine_same_as_openpyxl(tmp_path, streaming):
+    example_df = pd.DataFrame(
+        {
+            "client": ["A", "B", "C", "D", "E"],
+            "industry": ["ASEET MANAGEMENT", "ASEET MANAGEMENT", "<BANK & CO>", None, " INSURANCE "],
+            "employees": [25_000, 17_000_000, 14, np.nan, np.inf],
+            "inception": [
+                datetime.datetime(2022, 1, 1, 12, 30, 15, 123456),
+                np.nan,
+                datetime.datetime(1900, 1, 1),
+                datetime.datetime(1962, 1, 1),
+                datetime.datetime(2003, 11, 10),
+            ],
+            "active": [True, False, True, True, False],
+            "mixed": [1, "=1+1", 2.5, datetime.date(2020, 1, 1), "#N/A"],
+            "RoE": [0.05, -0.05, np.nan, 1.05, 0.1 + 0.2],
+        }
+    )
+    example_df.set_index(["industry", "client"], inplace=True)
+
+    files = {"openpyxl": tmp_path / "testing.xlsx", "xml": tmp_path / "testing_xml.xlsx"}
+    for engine, file in files.items():
+        with ExcelWriter(str(file), engine=engine, streaming=streaming and engine == "xml") as writer:
+            ws1 = writer.to_excel(
+                example_df,
+                sheet_name="Test Sheet 1",
+                startrow=1,
+                startcol=1,
+                index=True,
+                style={"RoE": "bg_light_blue", "B3:C4": {"font": {"italic": True}}, "5:6": {"fill": "FFEEB7"}},
+            )
+            ws1.merge_cells("B10:C11")
+            ws1.add_data_validation(ref="employees", type="list", props=["Y", "N"])
+            writer.to_excel(example_df.reset_index(), sheet_name="Test Sheet 2")
+
+    assert cell_styles(files["openpyxl"]) == cell_styles(files["xml"])
+
+    ws = openpyxl.load_workbook(files["xml"])["Test Sheet 1"]
+    assert sorted(str(i) for i in ws.merged_cells.ranges) == ["B10:C11", "B3:B4"]
+    assert str(ws.data_validations.dataValidation[0].sqref) == "D3:D7"
+    if not streaming:
+        with zipfile.ZipFile(files["xml"]) as package:
+            assert b'<dimension ref="B2:H7"' in package.read("xl/worksheets/sheet1.xml")
+
+
+def test_xml_engine_errors(tmp_path):
+    df = pd.DataFrame({"calories": [420, 380, 390, 210], "duration": [50, 40, 45, 90]})
+
+    with ExcelWriter(str(tmp_path / "testing_xml.xlsx"), engine="xml") as writer:
+        ws1 = writer.to_excel(df, sheet_name="Test Sheet 1")
+
+        with pytest.raises(Exception, match='engine="xml"'):
+            ws1.write_cell("A1", "Hello")
+        with pytest.raises(Exception, match='engine="xml"'):
+            ws1.group_rows("1:2")
+        with pytest.raises(Exception, match="already written"):
+            writer.to_excel(df, sheet_name="Test Sheet 1", startrow=10)